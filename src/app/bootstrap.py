@@ -1,159 +1,269 @@
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
 
-from ..config import get_settings
-from ..domain.services.translation_service import TranslationService
-from ..domain.services.interface_translation_service import InterfaceTranslationService
-from ..domain.services.language_detection_service import LanguageDetectionService
-from ..infra.gemini_translation import GeminiTranslationAdapter
-from ..infra.language_pref_client import LanguagePreferenceAdapter
-from ..infra.command_router import OpenAIGroupMentionCommandRouter
-from ..infra.line_api import LineApiAdapter
-from ..infra.neon_client import get_client
-from ..infra.neon_repositories import NeonMessageRepository
-from ..infra.openai_support_agent import OpenAISupportAgent
-from ..domain.services.quota_service import QuotaService
-from ..domain.services.private_chat_support_service import (
-    PrivateChatSupportConfig,
-    PrivateChatSupportService,
-)
-from ..domain.services.language_settings_service import LanguageSettingsService
-from ..domain.services.translation_flow_service import TranslationFlowService
-from .dispatcher import Dispatcher
-from .handlers.follow_handler import FollowHandler
-from .handlers.join_handler import JoinHandler
-from .handlers.leave_handler import LeaveHandler
-from .handlers.member_joined_handler import MemberJoinedHandler
-from .handlers.member_left_handler import MemberLeftHandler
-from .handlers.message_handler import MessageHandler
-from .handlers.postback_handler import PostbackHandler
+from ..config import Settings, get_settings
+from .dispatcher import Dispatcher, LazyHandler
+
+PROMPTS_DIR = Path(__file__).resolve().parent / "prompts"
+
+
+@dataclass(frozen=True)
+class AppContainer:
+    """依存グラフを一度だけ解決して共有する DI コンテナ。
+
+    各サービスはシングルトンとして初回参照時に生成・キャッシュされる。
+    Stripe / Gemini / OpenAI / Neon などの重い依存は、実際に必要とする
+    イベントが届くまで import も初期化も行わない。
+    """
+
+    settings: Settings
+
+    @cached_property
+    def line_client(self):
+        from ..infra.line_api import LineApiAdapter
+
+        return LineApiAdapter(self.settings.line_channel_access_token)
+
+    @cached_property
+    def executor_max_workers(self) -> int:
+        from .concurrency import default_executor_workers
+
+        return default_executor_workers()
+
+    @cached_property
+    def gemini_session(self):
+        # 翻訳と言語設定推定で Gemini への TCP/TLS 接続を使い回す。MessageHandler の executor の各スレッドと
+        # 呼び出し元スレッドが同時に POST するため、接続プールはその合計に合わせる（ステートレスな POST 専用）
+        from ..infra.http_session import build_shared_session
+
+        return build_shared_session(pool_maxsize=self.executor_max_workers + 1)
+
+    @cached_property
+    def translation_adapter(self):
+        from ..infra.gemini_translation import GeminiTranslationAdapter
+
+        return GeminiTranslationAdapter(
+            api_key=self.settings.gemini_api_key,
+            model=self.settings.gemini_model,
+            timeout_seconds=self.settings.gemini_timeout_seconds,
+            session=self.gemini_session,
+        )
+
+    @cached_property
+    def translation_service(self):
+        from ..domain.services.translation_service import TranslationService
+
+        return TranslationService(self.translation_adapter)
+
+    @cached_property
+    def interface_translation(self):
+        from ..domain.services.interface_translation_service import InterfaceTranslationService
+
+        return InterfaceTranslationService(self.translation_adapter)
+
+    @cached_property
+    def language_pref_service(self):
+        from ..infra.language_pref_client import LanguagePreferenceAdapter
+
+        return LanguagePreferenceAdapter(
+            api_key=self.settings.gemini_api_key,
+            model=self.settings.gemini_model,
+            timeout_seconds=self.settings.gemini_timeout_seconds,
+            session=self.gemini_session,
+        )
+
+    @cached_property
+    def command_router(self):
+        from ..infra.command_router import OpenAIGroupMentionCommandRouter
+
+        return OpenAIGroupMentionCommandRouter(
+            api_key=self.settings.openai_api_key,
+            model=self.settings.openai_group_mention_model,
+            prompt_path=str(PROMPTS_DIR / "kotori_group_mention_prompt.txt"),
+            timeout_seconds=self.settings.gemini_timeout_seconds,
+        )
+
+    @cached_property
+    def repo(self):
+        from ..infra.neon_client import get_client
+        from ..infra.neon_repositories import NeonMessageRepository
+
+        # ランタイムは pooled エンドポイントを優先（マイグレーションは scripts 側で直結 URL を使う）
+        dsn = self.settings.neon_pooled_database_url or self.settings.neon_database_url
+        return NeonMessageRepository(
+            get_client(dsn),
+            max_group_languages=self.settings.max_group_languages,
+            message_encryption_key=self.settings.message_encryption_key,
+        )
+
+    @cached_property
+    def quota_service(self):
+        from ..domain.services.quota_service import QuotaService
+
+        return QuotaService(self.repo)
+
+    @cached_property
+    def language_settings_service(self):
+        from ..domain.services.language_settings_service import LanguageSettingsService
+
+        return LanguageSettingsService(
+            self.repo,
+            self.language_pref_service,
+            self.interface_translation,
+            self.settings.max_group_languages,
+        )
+
+    @cached_property
+    def translation_flow_service(self):
+        from ..domain.services.translation_flow_service import TranslationFlowService
+
+        return TranslationFlowService(
+            self.repo,
+            self.translation_service,
+            self.interface_translation,
+            self.quota_service,
+            max_context_messages=self.settings.max_context_messages,
+            translation_retry=self.settings.translation_retry,
+        )
+
+    @cached_property
+    def private_chat_support_service(self):
+        from ..domain.services.private_chat_support_service import (
+            PrivateChatSupportConfig,
+            PrivateChatSupportService,
+        )
+        from ..infra.openai_support_agent import OpenAISupportAgent
+
+        responder = OpenAISupportAgent(
+            api_key=self.settings.openai_api_key,
+            support_model=self.settings.openai_support_model,
+            guardrail_model=self.settings.openai_guardrail_model,
+            prompt_path=str(PROMPTS_DIR / "kotori_support_prompt.txt"),
+        )
+        return PrivateChatSupportService(
+            repo=self.repo,
+            responder=responder,
+            config=PrivateChatSupportConfig(history_limit=self.settings.private_chat_history_limit),
+        )
+
+    @cached_property
+    def subscription_service(self):
+        # サブスク関連の共通サービス（Stripe SDK は呼び出し時に読み込まれる）
+        from ..domain.services.subscription_service import SubscriptionService
+
+        return SubscriptionService(
+            self.repo,
+            stripe_secret_key=self.settings.stripe_secret_key,
+            stripe_price_monthly_id=self.settings.stripe_price_monthly_id,
+            subscription_frontend_base_url=self.settings.subscription_frontend_base_url,
+            checkout_api_base_url=self.settings.checkout_api_base_url,
+            subscription_token_secret=self.settings.subscription_token_secret,
+        )
+
+    # --- handlers ---
+    def message_handler(self):
+        from ..domain.services.language_detection_service import LanguageDetectionService
+        from .handlers.message_handler import MessageHandler
+
+        settings = self.settings
+        return MessageHandler(
+            line_client=self.line_client,
+            translation_service=self.translation_service,
+            language_pref_service=self.language_pref_service,
+            command_router=self.command_router,
+            repo=self.repo,
+            max_context_messages=settings.max_context_messages,
+            max_group_languages=settings.max_group_languages,
+            translation_retry=settings.translation_retry,
+            bot_mention_name=settings.bot_mention_name,
+            interface_translation=self.interface_translation,
+            language_detector=LanguageDetectionService(),
+            stripe_secret_key=settings.stripe_secret_key,
+            stripe_price_monthly_id=settings.stripe_price_monthly_id,
+            free_quota_per_month=settings.free_quota_per_month,
+            standard_quota_per_month=settings.standard_quota_per_month,
+            pro_quota_per_month=settings.pro_quota_per_month,
+            subscription_frontend_base_url=settings.subscription_frontend_base_url,
+            checkout_api_base_url=settings.checkout_api_base_url,
+            subscription_service=self.subscription_service,
+            quota_service=self.quota_service,
+            translation_flow_service=self.translation_flow_service,
+            language_settings_service=self.language_settings_service,
+            private_chat_support_service=self.private_chat_support_service,
+            executor_max_workers=self.executor_max_workers,
+        )
+
+    def postback_handler(self):
+        from .handlers.postback_handler import PostbackHandler
+
+        return PostbackHandler(
+            self.line_client,
+            self.repo,
+            max_group_languages=self.settings.max_group_languages,
+            interface_translation=self.interface_translation,
+            subscription_service=self.subscription_service,
+            language_settings_service=self.language_settings_service,
+        )
+
+    def join_handler(self):
+        from .handlers.join_handler import JoinHandler
+
+        return JoinHandler(self.line_client, self.repo)
+
+    def leave_handler(self):
+        from .handlers.leave_handler import LeaveHandler
+
+        return LeaveHandler(self.subscription_service, self.repo)
+
+    def member_joined_handler(self):
+        from .handlers.member_joined_handler import MemberJoinedHandler
+
+        return MemberJoinedHandler(self.line_client, self.repo)
+
+    def member_left_handler(self):
+        from .handlers.member_left_handler import MemberLeftHandler
+
+        return MemberLeftHandler(
+            self.line_client,
+            self.repo,
+            self.subscription_service,
+            interface_translation=self.interface_translation,
+        )
+
+    def follow_handler(self):
+        from .handlers.follow_handler import FollowHandler
+
+        return FollowHandler(self.line_client)
+
+    @cached_property
+    def dispatcher(self) -> Dispatcher:
+        # ハンドラは該当イベントの初回受信時に生成する（コールドスタート短縮）
+        handlers = {
+            "message": LazyHandler(self.message_handler),
+            "postback": LazyHandler(self.postback_handler),
+            "join": LazyHandler(self.join_handler),
+            "leave": LazyHandler(self.leave_handler),
+            "memberJoined": LazyHandler(self.member_joined_handler),
+            "memberLeft": LazyHandler(self.member_left_handler),
+            "follow": LazyHandler(self.follow_handler),
+        }
+        return Dispatcher(handlers)
+
+
+@lru_cache(maxsize=1)
+def get_container() -> AppContainer:
+    """プロセス内で共有するコンテナを返す。"""
+    return AppContainer(get_settings())
 
 
 def build_dispatcher() -> Dispatcher:
-    settings = get_settings()
+    container = get_container()
 
-    level = getattr(logging, settings.log_level.upper(), logging.INFO)
+    level = getattr(logging, container.settings.log_level.upper(), logging.INFO)
     logging.basicConfig(level=level, force=True)
 
-    line_client = LineApiAdapter(settings.line_channel_access_token)
-    translation_adapter = GeminiTranslationAdapter(
-        api_key=settings.gemini_api_key,
-        model=settings.gemini_model,
-        timeout_seconds=settings.gemini_timeout_seconds,
-    )
-    translation_service = TranslationService(translation_adapter)
-    interface_translation = InterfaceTranslationService(translation_adapter)
-    language_detector = LanguageDetectionService()
-    language_pref_service = LanguagePreferenceAdapter(
-        api_key=settings.gemini_api_key,
-        model=settings.gemini_model,
-        timeout_seconds=settings.gemini_timeout_seconds,
-    )
-    group_prompt_path = str(Path(__file__).resolve().parent / "prompts" / "kotori_group_mention_prompt.txt")
-    command_router = OpenAIGroupMentionCommandRouter(
-        api_key=settings.openai_api_key,
-        model=settings.openai_group_mention_model,
-        prompt_path=group_prompt_path,
-        timeout_seconds=settings.gemini_timeout_seconds,
-    )
-    db_client = get_client(settings.neon_database_url)
-    repo = NeonMessageRepository(
-        db_client,
-        max_group_languages=settings.max_group_languages,
-        message_encryption_key=settings.message_encryption_key,
-    )
-    quota_service = QuotaService(repo)
-    lang_settings_service = LanguageSettingsService(
-        repo,
-        language_pref_service,
-        interface_translation,
-        settings.max_group_languages,
-    )
-    translation_flow_service = TranslationFlowService(
-        repo,
-        translation_service,
-        interface_translation,
-        quota_service,
-        max_context_messages=settings.max_context_messages,
-        translation_retry=settings.translation_retry,
-    )
-    prompt_path = str(Path(__file__).resolve().parent / "prompts" / "kotori_support_prompt.txt")
-    private_chat_responder = OpenAISupportAgent(
-        api_key=settings.openai_api_key,
-        support_model=settings.openai_support_model,
-        guardrail_model=settings.openai_guardrail_model,
-        prompt_path=prompt_path,
-    )
-    private_chat_support_service = PrivateChatSupportService(
-        repo=repo,
-        responder=private_chat_responder,
-        config=PrivateChatSupportConfig(history_limit=settings.private_chat_history_limit),
-    )
-    # サブスク関連の共通サービス
-    from ..domain.services.subscription_service import SubscriptionService
-
-    subscription_service = SubscriptionService(
-        repo,
-        stripe_secret_key=settings.stripe_secret_key,
-        stripe_price_monthly_id=settings.stripe_price_monthly_id,
-        subscription_frontend_base_url=settings.subscription_frontend_base_url,
-        checkout_api_base_url=settings.checkout_api_base_url,
-        subscription_token_secret=settings.subscription_token_secret,
-    )
-
-    message_handler = MessageHandler(
-        line_client=line_client,
-        translation_service=translation_service,
-        language_pref_service=language_pref_service,
-        command_router=command_router,
-        repo=repo,
-        max_context_messages=settings.max_context_messages,
-        max_group_languages=settings.max_group_languages,
-        translation_retry=settings.translation_retry,
-        bot_mention_name=settings.bot_mention_name,
-        interface_translation=interface_translation,
-        language_detector=language_detector,
-        stripe_secret_key=settings.stripe_secret_key,
-        stripe_price_monthly_id=settings.stripe_price_monthly_id,
-        free_quota_per_month=settings.free_quota_per_month,
-        standard_quota_per_month=settings.standard_quota_per_month,
-        pro_quota_per_month=settings.pro_quota_per_month,
-        subscription_frontend_base_url=settings.subscription_frontend_base_url,
-        checkout_api_base_url=settings.checkout_api_base_url,
-        subscription_service=subscription_service,
-        quota_service=quota_service,
-        translation_flow_service=translation_flow_service,
-        language_settings_service=lang_settings_service,
-        private_chat_support_service=private_chat_support_service,
-    )
-    postback_handler = PostbackHandler(
-        line_client,
-        repo,
-        max_group_languages=settings.max_group_languages,
-        interface_translation=interface_translation,
-        subscription_service=subscription_service,
-        language_settings_service=lang_settings_service,
-    )
-    join_handler = JoinHandler(line_client, repo)
-    leave_handler = LeaveHandler(subscription_service, repo)
-    member_joined_handler = MemberJoinedHandler(line_client, repo)
-    member_left_handler = MemberLeftHandler(
-        line_client,
-        repo,
-        subscription_service,
-        interface_translation=interface_translation,
-    )
-    follow_handler = FollowHandler(line_client)
-
-    handlers = {
-        "message": message_handler,
-        "postback": postback_handler,
-        "join": join_handler,
-        "leave": leave_handler,
-        "memberJoined": member_joined_handler,
-        "memberLeft": member_left_handler,
-        "follow": follow_handler,
-    }
-    return Dispatcher(handlers)
+    return container.dispatcher
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+import os
+
+
+def default_executor_workers() -> int:
+    """I/O 待ちが中心のため CPU 数より多めに確保する（標準ライブラリの既定値と同じ式）。"""
+    return min(32, (os.cpu_count() or 1) + 4)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Protocol
+import threading
+from typing import Callable, Dict, Optional, Protocol
 
 from ..domain import models
 
@@ -12,6 +13,24 @@ class Handler(Protocol):
     def handle(self, event: models.BaseEvent) -> None: ...
 
 
+class LazyHandler:
+    """初回イベント受信時にハンドラを生成するプロキシ。"""
+
+    def __init__(self, factory: Callable[[], Handler]) -> None:
+        self._factory = factory
+        self._handler: Optional[Handler] = None
+        self._lock = threading.Lock()
+
+    def handle(self, event: models.BaseEvent) -> None:
+        handler = self._handler
+        if handler is None:
+            with self._lock:
+                if self._handler is None:
+                    self._handler = self._factory()
+                handler = self._handler
+        handler.handle(event)
+
+
 class Dispatcher:
     def __init__(self, handlers: Dict[str, Handler]) -> None:
         self._handlers = handlers
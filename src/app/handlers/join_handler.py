@@ -22,25 +22,13 @@ class JoinHandler:
     def handle(self, event: models.JoinEvent) -> None:
         if not (event.group_id and event.reply_token):
             return
-        join_time = _event_timestamp(event) or datetime.now(timezone.utc)
+        join_time = event.occurred_at or datetime.now(timezone.utc)
         group_name = _fetch_group_name_safe(self._line, event.group_id)
-        self._repo.record_bot_joined_at(event.group_id, join_time)
-        if group_name:
-            self._repo.upsert_group_name(event.group_id, group_name)
-        self._repo.reset_group_language_settings(event.group_id)
-        self._repo.set_translation_enabled(event.group_id, False)
+        # 参加時刻記録・グループ名保存・言語設定リセット・翻訳停止を 1 往復で行う
+        self._repo.initialize_group(event.group_id, join_time, group_name)
         self._line.reply_text(event.reply_token, GROUP_PROMPT_MESSAGE)
 
 
-def _event_timestamp(event: models.BaseEvent):
-    try:
-        if event.timestamp:
-            return datetime.fromtimestamp(event.timestamp / 1000, tz=timezone.utc)
-    except Exception:
-        return None
-    return None
-
-
 def _fetch_group_name_safe(line_client: LinePort, group_id: str) -> str | None:
     """グループ名取得でエラーが出ても処理を継続するためのラッパー。"""
     try:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import time
 
 from ...domain import models
 from ...domain.ports import MessageRepositoryPort
@@ -8,13 +9,24 @@ from ...domain.services.subscription_service import SubscriptionService
 
 logger = logging.getLogger(__name__)
 
+CANCEL_RETRY_ATTEMPTS = 3
+# 解約リトライの待機秒数（指数バックオフ: 0.5s, 1s, ... 上限 8s）
+CANCEL_RETRY_BACKOFF_SECONDS = 0.5
+CANCEL_RETRY_MAX_BACKOFF_SECONDS = 8.0
+
 
 class LeaveHandler:
     """退会イベントでサブスクを自動キャンセルするハンドラ。"""
 
-    def __init__(self, subscription_service: SubscriptionService, repo: MessageRepositoryPort) -> None:
+    def __init__(
+        self,
+        subscription_service: SubscriptionService,
+        repo: MessageRepositoryPort,
+        retry_backoff_seconds: float = CANCEL_RETRY_BACKOFF_SECONDS,
+    ) -> None:
         self._subscription_service = subscription_service
         self._repo = repo
+        self._retry_backoff = max(0.0, retry_backoff_seconds)
 
     def handle(self, event: models.LeaveEvent) -> None:
         if not event.group_id:
@@ -30,8 +42,8 @@ class LeaveHandler:
                 exc_info=True,
             )
 
-        # サブスク解約は最大3回リトライする
-        for attempt in range(3):
+        # サブスク解約は最大3回リトライする（Stripe の一時障害に備えて間隔を指数的に空ける）
+        for attempt in range(CANCEL_RETRY_ATTEMPTS):
             result = self._subscription_service.cancel_subscription(event.group_id)
             if result:
                 logger.info(
@@ -43,4 +55,8 @@ class LeaveHandler:
                 "Auto cancel on leave failed",
                 extra={"group_id": event.group_id, "attempt": attempt + 1},
             )
+            if attempt < CANCEL_RETRY_ATTEMPTS - 1:
+                delay = min(self._retry_backoff * (2**attempt), CANCEL_RETRY_MAX_BACKOFF_SECONDS)
+                if delay:
+                    time.sleep(delay)
         logger.error("Auto cancel on leave gave up after retries", extra={"group_id": event.group_id})
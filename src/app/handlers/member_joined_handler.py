@@ -1,55 +1,53 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import List
 
 from ...domain import models
 from ...domain.ports import LinePort, MessageRepositoryPort
 
+# ボット参加直後はメンバー参加の挨拶を省略する（JoinHandler の案内と重複するため）
+GREETING_SUPPRESS_WINDOW = timedelta(minutes=10)
+
+# 挨拶文のうち参加者名に依存しない固定部分（イベントごとに組み立て直さない）
+MEMBER_JOINED_GUIDE_MESSAGE = (
+    "When you want to change the interpreter's language settings, please remove this bot from the group once and then invite it again!\n\n"
+    "通訳の言語設定を変更するときは、このボットを一度グループから削除してから、再度招待してね！\n\n"
+    "如果你想更改口译语言设置，请先将此机器人从群组中删除，然后再重新邀请它！\n\n"
+    "หากคุณต้องการเปลี่ยนการตั้งค่าภาษาของล่าม กรุณานำบอทนี้ออกจากกลุ่มก่อน แล้วค่อยเชิญกลับมาอีกครั้ง!"
+)
+
 
 class MemberJoinedHandler:
-    def __init__(self, line_client: LinePort, repo: MessageRepositoryPort) -> None:
+    def __init__(
+        self,
+        line_client: LinePort,
+        repo: MessageRepositoryPort,
+        executor: ThreadPoolExecutor | None = None,
+    ) -> None:
         self._line = line_client
         self._repo = repo
+        self._executor = executor or ThreadPoolExecutor(max_workers=2)
 
     def handle(self, event: models.MemberJoinedEvent) -> None:
         if not (event.group_id and event.reply_token):
             return
 
-        event_time = _event_timestamp(event) or datetime.now(timezone.utc)
-        bot_joined_at = self._repo.fetch_bot_joined_at(event.group_id)
+        event_time = event.occurred_at or datetime.now(timezone.utc)
+        joined_user_ids = [user_id for user_id in event.joined_user_ids if user_id]
 
-        for user_id in event.joined_user_ids:
-            if not user_id:
-                continue
-            self._repo.ensure_group_member(event.group_id, user_id)
+        # 参加時刻の取得とメンバー登録は独立しているので並行して DB に投げる
+        joined_at_future = self._executor.submit(self._repo.fetch_bot_joined_at, event.group_id)
+        self._repo.ensure_group_members(event.group_id, joined_user_ids)
+        bot_joined_at = joined_at_future.result()
 
-        if bot_joined_at and (event_time - bot_joined_at) < timedelta(minutes=10):
+        if bot_joined_at and (event_time - bot_joined_at) < GREETING_SUPPRESS_WINDOW:
             return
 
-        joined_names: List[str] = []
-        for user_id in event.joined_user_ids:
-            if not user_id:
-                continue
-            name = self._line.get_display_name("group", event.group_id, user_id)
-            if name:
-                joined_names.append(name)
+        names_by_user = self._line.get_display_names("group", event.group_id, joined_user_ids)
+        joined_names: List[str] = [names_by_user[user_id] for user_id in joined_user_ids if user_id in names_by_user]
 
         prefix = "、".join(joined_names) if joined_names else "everyone"
-        message = (
-            f"Hello {prefix} !\n\n"
-            "When you want to change the interpreter's language settings, please remove this bot from the group once and then invite it again!\n\n"
-            "通訳の言語設定を変更するときは、このボットを一度グループから削除してから、再度招待してね！\n\n"
-            "如果你想更改口译语言设置，请先将此机器人从群组中删除，然后再重新邀请它！\n\n"
-            "หากคุณต้องการเปลี่ยนการตั้งค่าภาษาของล่าม กรุณานำบอทนี้ออกจากกลุ่มก่อน แล้วค่อยเชิญกลับมาอีกครั้ง!"
-        )
+        message = f"Hello {prefix} !\n\n{MEMBER_JOINED_GUIDE_MESSAGE}"
         self._line.reply_text(event.reply_token, message)
-
-
-def _event_timestamp(event: models.BaseEvent):
-    try:
-        if event.timestamp:
-            return datetime.fromtimestamp(event.timestamp / 1000, tz=timezone.utc)
-    except Exception:
-        return None
-    return None
@@ -2,14 +2,14 @@ from __future__ import annotations
 
 import logging
 import json
-import base64
-import zlib
 import re
+import threading
 import time
-from functools import partial
+from collections import OrderedDict
+from itertools import islice
 from datetime import datetime, timezone
 from calendar import monthrange
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 from concurrent.futures import ThreadPoolExecutor, Future
 
 import requests
@@ -26,8 +26,8 @@ from ...domain.services.interface_translation_service import InterfaceTranslatio
 from ...domain.services.language_detection_service import LanguageDetectionService
 from ...infra.gemini_translation import GeminiRateLimitError
 from ...presentation.reply_formatter import (
-    MAX_REPLY_LENGTH,
     _wrap_bidi_isolate,
+    join_within_limit,
     strip_source_echo,
 )
 from ..subscription_texts import (
@@ -39,11 +39,24 @@ from ..subscription_templates import (
     build_subscription_cancel_confirm,
     build_subscription_menu_message,
 )
+from ...domain.services.bounded_cache import TEMPLATE_TRANSLATION_CACHE_SIZE, BoundedLRUCache
 from ...domain.services.subscription_service import SubscriptionService
 from ...domain.services.quota_service import QuotaService
 from ...domain.services.translation_flow_service import TranslationFlowService
-from ...domain.services.language_settings_service import LanguageSettingsService
+from ...domain.services.language_settings_service import (
+    LanguageSettingsService,
+    encode_language_postback_payload,
+)
+from ...domain.services.language_codes import is_english_language_code
 from ...domain.services.private_chat_support_service import PrivateChatSupportService
+from ...domain.services.retry_policy import (
+    DEFAULT_BACKOFF_BASE_SECONDS,
+    DEFAULT_BACKOFF_CAP_SECONDS,
+    DEFAULT_RETRY_SLEEP_BUDGET_SECONDS,
+    RetryRule,
+    backoff_delay,
+    resolve_retry_rule,
+)
 from ...domain.services.plan_policy import (
     FREE_PLAN,
     PRO_PLAN,
@@ -54,14 +67,53 @@ from ...domain.services.plan_policy import (
     resolve_effective_plan,
     stop_translation_on_quota,
 )
+from ..concurrency import default_executor_workers
 from .postback_handler import _build_cancel_message, _build_completion_message
 
 logger = logging.getLogger(__name__)
 
 RATE_LIMIT_MESSAGE = "You have reached the rate limit. Please try again later."
-_last_rate_limit_message: Dict[str, str] = {}
+# レート制限通知はグループ/ユーザーごとのトークンバケットで間引く（障害時に LINE へ連投しない）
+RATE_LIMIT_NOTICE_BURST = 1.0
+RATE_LIMIT_NOTICE_REFILL_SECONDS = 600.0
+_RATE_LIMIT_NOTICE_MAX_KEYS = 4096
+_rate_limit_buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+_rate_limit_buckets_lock = threading.Lock()
 LINE_REPLY_TEXT_LIMIT = 5000
 
+# メッセージごとに使う正規表現はモジュール読み込み時に一度だけコンパイルする
+_MULTISPACE_RE = re.compile(r"\s{2,}")
+_BULLET_RE = re.compile(r"(?<!\n)(- )")
+_EXCESS_NEWLINES_RE = re.compile(r"\n{3,}")
+_CRLF_RE = re.compile(r"\r\n?")
+# メンション除去後のコマンド先頭に残りがちな区切り記号
+_COMMAND_LEADING_CHARS = "-—–:：、，,。.!！?？ "
+
+
+def _take_rate_limit_notice_token(key: str, now: Optional[float] = None) -> bool:
+    """key のバケットからトークンを 1 つ取り出せたら True。古いキーから捨てて件数を抑える。"""
+    now = time.monotonic() if now is None else now
+    with _rate_limit_buckets_lock:
+        tokens, last = _rate_limit_buckets.get(key, (RATE_LIMIT_NOTICE_BURST, now))
+        tokens = min(RATE_LIMIT_NOTICE_BURST, tokens + (now - last) / RATE_LIMIT_NOTICE_REFILL_SECONDS)
+        allowed = tokens >= 1.0
+        _rate_limit_buckets[key] = (tokens - 1.0 if allowed else tokens, now)
+        _rate_limit_buckets.move_to_end(key)
+        while len(_rate_limit_buckets) > _RATE_LIMIT_NOTICE_MAX_KEYS:
+            _rate_limit_buckets.popitem(last=False)
+    return allowed
+
+
+def _refund_rate_limit_notice_token(key: str) -> None:
+    """通知を送れなかった場合に、取り出したトークンを key のバケットへ戻す。"""
+    with _rate_limit_buckets_lock:
+        entry = _rate_limit_buckets.get(key)
+        if entry is None:
+            return
+        tokens, last = entry
+        _rate_limit_buckets[key] = (min(RATE_LIMIT_NOTICE_BURST, tokens + 1.0), last)
+
+
 # 利用方法案内文言
 USAGE_MESSAGE = (
     "After setting your language preferences, feel free to chat in any language. "
@@ -105,20 +157,33 @@ class MessageHandler:
         checkout_api_base_url: str = "",
         subscription_service: SubscriptionService | None = None,
         executor: ThreadPoolExecutor | None = None,
+        executor_max_workers: Optional[int] = None,
         quota_service: QuotaService | None = None,
         translation_flow_service: TranslationFlowService | None = None,
         language_settings_service: LanguageSettingsService | None = None,
         private_chat_support_service: PrivateChatSupportService | None = None,
+        retry_backoff_base: float = DEFAULT_BACKOFF_BASE_SECONDS,
+        retry_backoff_cap: float = DEFAULT_BACKOFF_CAP_SECONDS,
+        retry_error_policy: Optional[Dict[type, RetryRule]] = None,
     ) -> None:
         self._line = line_client
         self._translation = translation_service
         self._interface_translation = interface_translation
+        # リトライ時のログ用タイムアウト値は構築時に一度だけ解決しておく
+        self._translation_timeout = getattr(getattr(translation_service, "_translator", None), "_timeout", None)
+        self._interface_timeout = getattr(getattr(interface_translation, "_translator", None), "_timeout", None)
         self._lang_detector = language_detector
         self._command_router = command_router
         self._repo = repo
         self._max_group_languages = max_group_languages
         self._translation_retry = translation_retry
+        self._retry_backoff_base = max(0.0, retry_backoff_base)
+        self._retry_backoff_cap = max(0.0, retry_backoff_cap)
+        self._retry_error_policy = retry_error_policy or self._default_retry_error_policy()
         self._bot_mention_name = bot_mention_name
+        self._mention_re = (
+            re.compile(rf"@\s*{re.escape(bot_mention_name)}", re.IGNORECASE) if bot_mention_name else None
+        )
         self._free_quota = free_quota_per_month
         self._standard_quota = standard_quota_per_month
         self._pro_quota = pro_quota_per_month
@@ -145,7 +210,20 @@ class MessageHandler:
             max_group_languages,
         )
         self._private_chat_support = private_chat_support_service
-        self._executor = executor or ThreadPoolExecutor(max_workers=4)
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=executor_max_workers or default_executor_workers(),
+            thread_name_prefix="msghdlr",
+        )
+        # (原文, 指示言語, force) -> 翻訳済みテンプレート。同じ案内文で Gemini を呼び直さない
+        self._template_cache: BoundedLRUCache[Tuple[str, str, bool], List[str]] = BoundedLRUCache(
+            TEMPLATE_TRANSLATION_CACHE_SIZE
+        )
+        # (固定文言, 言語, allow_same_language) -> 訳文。使い方・不明指示の案内を言語単位で使い回す
+        self._constant_translation_cache: BoundedLRUCache[Tuple[str, str, bool], str] = BoundedLRUCache(
+            TEMPLATE_TRANSLATION_CACHE_SIZE
+        )
+        # 1 イベントの処理中だけ有効なグループ言語のキャッシュ（同一イベント内の重複 DB 読み込みを避ける）
+        self._event_scope = threading.local()
 
     def handle(self, event: models.MessageEvent) -> None:
         if not event.reply_token:
@@ -154,8 +232,18 @@ class MessageHandler:
         if not event.group_id or not event.user_id:
             return
 
-        timestamp = datetime.fromtimestamp(event.timestamp / 1000, tz=timezone.utc)
+        # イベント時刻はイベントごとに一度だけ変換したものを全経路で共有する
+        timestamp = event.occurred_at or datetime.now(timezone.utc)
+        self._event_scope.group_languages = {}
+        self._event_scope.pending_replies = []
+        try:
+            self._handle_event(event, timestamp)
+        finally:
+            # 返信はメッセージ保存と並行して送り、ここで完了を待つ（Lambda 凍結前に必ず送り切る）
+            self._await_pending_replies()
+            self._event_scope.group_languages = None
 
+    def _handle_event(self, event: models.MessageEvent, timestamp: datetime) -> None:
         # 個人チャットはサポート応答を返す。
         if event.sender_type == "user" and event.group_id == event.user_id:
             sender_name, _deferred_name = self._resolve_sender_name(event)
@@ -163,7 +251,13 @@ class MessageHandler:
             return
 
         self._repo.ensure_group_member(event.group_id, event.user_id)
-        sender_name, deferred_name = self._resolve_sender_name(event)
+        command_text = self._extract_command_text(event)
+        # コマンドでは送信者名をメッセージ保存にしか使わないため、名前解決（LINE API）をコマンド処理と並行させる
+        name_future = self._submit_sender_name(event) if command_text is not None else None
+        if name_future is None:
+            sender_name, deferred_name = self._resolve_sender_name(event)
+        else:
+            sender_name, deferred_name = event.user_id, None
 
         logger.info(
             "Handling message event | group=%s user=%s sender=%s text=%.40s",
@@ -174,13 +268,15 @@ class MessageHandler:
         )
 
         try:
-            self._process_group_message(event, sender_name, deferred_name)
+            self._process_group_message(event, sender_name, deferred_name, command_text)
         except GeminiRateLimitError:
             logger.warning("Gemini rate limited; notifying user")
             self._send_rate_limit_notice(event)
         except Exception:
             logger.exception("Message handling failed")
         finally:
+            if name_future is not None:
+                sender_name = self._await_sender_name(name_future, event)
             try:
                 self._record_message(event, sender_name=sender_name, timestamp=timestamp)
             except Exception:
@@ -191,9 +287,9 @@ class MessageHandler:
         event: models.MessageEvent,
         sender_name: str,
         deferred_display_name: str | None,
+        command_text: Optional[str] = None,
     ) -> bool:
-        """グループ向けメッセージのディスパッチを担当。"""
-        command_text = self._extract_command_text(event)
+        """グループ向けメッセージのディスパッチを担当。command_text は _handle_event で抽出済みの値（None は通常メッセージ）。"""
         # メンションさえ含まれていればコマンド扱い（空文字でも許可）
         if command_text is not None:
             return self._handle_command(event, command_text)
@@ -247,12 +343,62 @@ class MessageHandler:
             logger.exception("Failed to persist direct assistant message")
 
     # --- internal helpers ---
+    def _fetch_group_languages(self, group_id: str) -> List[str]:
+        """グループ言語を取得する。イベント処理中は最初の取得結果を使い回す。"""
+        scope = getattr(self, "_event_scope", None)
+        cache = getattr(scope, "group_languages", None) if scope is not None else None
+        if cache is not None and group_id in cache:
+            return list(cache[group_id])
+        fetcher = getattr(self._repo, "fetch_group_languages", None)
+        languages = list(fetcher(group_id) or []) if fetcher else []
+        if cache is not None:
+            cache[group_id] = languages
+        return list(languages)
+
+    def _invalidate_group_languages(self, group_id: str) -> None:
+        """言語設定を書き換えた後に呼び、次回の取得で DB を読み直させる。"""
+        scope = getattr(self, "_event_scope", None)
+        cache = getattr(scope, "group_languages", None) if scope is not None else None
+        if cache is not None:
+            cache.pop(group_id, None)
+
     def _reply_text(self, event: models.MessageEvent, text: Optional[str]) -> bool:
         if not event.reply_token or not text:
             return False
         self._line.reply_text(event.reply_token, text[:LINE_REPLY_TEXT_LIMIT])
         return True
 
+    def _reply_text_deferred(self, event: models.MessageEvent, text: Optional[str]) -> bool:
+        """応答確認用の返信を executor に回し、後続の DB 書き込みと並行させる。
+
+        handle() の外から呼ばれた場合は同期で送る。
+        """
+        return self._defer_reply(self._reply_text, event, text)
+
+    def _reply_messages_deferred(self, event: models.MessageEvent, messages: Sequence[dict]) -> bool:
+        """_reply_text_deferred の複数メッセージ版。"""
+        return self._defer_reply(self._reply_messages, event, messages)
+
+    def _defer_reply(self, sender: Callable[..., bool], event: models.MessageEvent, payload) -> bool:
+        pending = getattr(getattr(self, "_event_scope", None), "pending_replies", None)
+        if pending is None or not event.reply_token or not payload:
+            return sender(event, payload)
+        try:
+            pending.append(self._executor.submit(sender, event, payload))
+        except Exception:
+            logger.debug("Executor submission failed; fallback to sync", exc_info=True)
+            return sender(event, payload)
+        return True
+
+    def _await_pending_replies(self) -> None:
+        pending = getattr(self._event_scope, "pending_replies", None) or []
+        self._event_scope.pending_replies = None
+        for future in pending:
+            try:
+                future.result()
+            except Exception:
+                logger.exception("Failed to send deferred reply")
+
     def _reply_messages(self, event: models.MessageEvent, messages: Sequence[dict]) -> bool:
         if not event.reply_token or not messages:
             return False
@@ -260,27 +406,32 @@ class MessageHandler:
         for message in messages:
             if not isinstance(message, dict):
                 continue
-            item = dict(message)
-            if item.get("type") == "text":
-                item["text"] = (item.get("text") or "")[:LINE_REPLY_TEXT_LIMIT]
-            normalized.append(item)
+            if message.get("type") == "text":
+                # 上限内のテキスト（大半のケース）はコピーせずにそのまま渡す
+                text = message.get("text")
+                if text is None or len(text) > LINE_REPLY_TEXT_LIMIT:
+                    message = {**message, "text": (text or "")[:LINE_REPLY_TEXT_LIMIT]}
+            normalized.append(message)
         if not normalized:
             return False
         self._line.reply_messages(event.reply_token, normalized)
         return True
 
-    def _attempt_language_enrollment(self, event: models.MessageEvent) -> bool:
-        plan_key = self._resolve_effective_plan_for_group(event.group_id)
+    def _attempt_language_enrollment(self, event: models.MessageEvent, plan_key: Optional[str] = None) -> bool:
+        """plan_key を渡した場合はプランを再取得しない。"""
+        if plan_key is None:
+            plan_key = self._resolve_effective_plan_for_group(event.group_id)
         bundle = self._language_settings.propose(
             event,
             max_languages=language_limit_for(plan_key),
         )
         if not bundle:
             return False
+        # 確認待ち状態の記録は propose 内で返信前に済んでいるので、返信はメッセージ保存と並行させてよい
         if bundle.messages:
-            self._reply_messages(event, list(bundle.messages))
+            self._reply_messages_deferred(event, list(bundle.messages))
         elif bundle.texts:
-            self._reply_text(event, bundle.texts[0])
+            self._reply_text_deferred(event, bundle.texts[0])
         logger.info(
             "Language enrollment prompt sent",
             extra={"group_id": event.group_id, "user_id": event.user_id},
@@ -319,14 +470,16 @@ class MessageHandler:
         return self._normalize_command_text(stripped)
 
     def _extract_command_text_from_text(self, text: str) -> Optional[str]:
-        name = self._bot_mention_name
-        if not name:
+        mention_re = self._mention_re
+        if mention_re is None:
             return None
-        # メンションとしての @<bot name> が含まれているときだけコマンド扱いする
-        pattern = rf"@\s*{re.escape(name)}"
-        if not re.search(pattern, text, flags=re.IGNORECASE):
+        # パターンは必ず "@" で始まるため、含まれない通常メッセージは正規表現を通さない
+        if "@" not in text:
+            return None
+        # メンションとしての @<bot name> が含まれているときだけコマンド扱いする（検索と置換を 1 回の走査で行う）
+        stripped, replaced = mention_re.subn(" ", text, count=1)
+        if not replaced:
             return None
-        stripped = re.sub(pattern, " ", text, count=1, flags=re.IGNORECASE)
         return self._normalize_command_text(stripped)
 
     @staticmethod
@@ -339,18 +492,21 @@ class MessageHandler:
 
     @staticmethod
     def _normalize_command_text(text: str) -> str:
-        stripped = re.sub(r"\s{2,}", " ", text).strip()
-        stripped = stripped.lstrip("-—–:：、，,。.!！?？ ")
+        stripped = _MULTISPACE_RE.sub(" ", text).strip()
+        stripped = stripped.lstrip(_COMMAND_LEADING_CHARS)
         return stripped or ""
 
     def _handle_command(self, event: models.MessageEvent, command_text: str) -> bool:
         instr_future: Future[str] | None = None
-        try:
-            instr_future = self._executor.submit(self._lang_detector.detect, command_text)
-        except Exception:
-            logger.debug("Executor submission failed; fallback to sync", exc_info=True)
+        # ローカルの言語判定をルーター（LLM）の往復と並行させる。メンションだけの空コマンドは判定しようがないので投げない
+        if command_text:
+            try:
+                instr_future = self._executor.submit(self._lang_detector.detect, command_text)
+            except Exception:
+                logger.debug("Executor submission failed; fallback to sync", exc_info=True)
 
         runtime = self._fetch_command_runtime_state(event.group_id)
+        self._forget_checkout_url_if_subscribed(event.group_id, runtime.subscription_status)
         router_input = self._build_command_router_input(command_text, runtime)
         decision = self._command_router.decide(router_input)
         action = decision.action or "unknown"
@@ -373,7 +529,7 @@ class MessageHandler:
             return True
 
         if action == "language_settings":
-            return self._handle_language_settings(event, decision, command_text)
+            return self._handle_language_settings(event, decision, command_text, runtime=runtime)
 
         if action == "howto":
             message = (decision.ack_text or "").strip()
@@ -386,14 +542,14 @@ class MessageHandler:
             self._repo.set_translation_enabled(event.group_id, False)
             base_ack = "I will pause translation. Please mention me again when you want to resume."
             ack = decision.ack_text or self._safe_translate_for_instruction(base_ack, instruction_lang)
-            self._reply_text(event, ack)
+            self._reply_text_deferred(event, ack)
             return True
 
         if action == "resume":
             self._repo.set_translation_enabled(event.group_id, True)
             base_ack = "I will resume the translation."
             ack = decision.ack_text or self._safe_translate_for_instruction(base_ack, instruction_lang)
-            self._reply_text(event, ack)
+            self._reply_text_deferred(event, ack)
             return True
 
         if action == "subscription_menu":
@@ -447,7 +603,7 @@ class MessageHandler:
             logger.debug("Failed to fetch translation_enabled for command runtime", exc_info=True)
 
         try:
-            languages = list(getattr(self._repo, "fetch_group_languages", lambda *_: [])(group_id))
+            languages = self._fetch_group_languages(group_id)
         except Exception:
             logger.debug("Failed to fetch languages for command runtime", exc_info=True)
             languages = []
@@ -497,7 +653,7 @@ class MessageHandler:
         return self._safe_translate_for_instruction(COMMAND_ROUTER_ERROR_BASE, instruction_lang)
 
     def _safe_translate_for_instruction(self, base_text: str, instruction_lang: str) -> str:
-        if not instruction_lang or instruction_lang.lower().startswith("en"):
+        if not instruction_lang or is_english_language_code(instruction_lang):
             return base_text
         try:
             translated = self._translate_template(base_text, instruction_lang, force=True)
@@ -512,7 +668,9 @@ class MessageHandler:
         event: models.MessageEvent,
         decision: models.CommandDecision,
         command_text: Optional[str] = None,
+        runtime: Optional[models.TranslationRuntimeState] = None,
     ) -> bool:
+        """runtime を渡した場合はそこからプランを求め、ランタイム状態を再取得しない。"""
         op = decision.operation or "reset_all"
         valid_ops = {"reset_all", "add_and_remove", "add", "remove"}
         if op not in valid_ops:
@@ -520,10 +678,13 @@ class MessageHandler:
             return self._respond_unknown_instruction(event, decision.instruction_language, command_text)
         add_langs = [(lang.code, lang.name) for lang in decision.languages_to_add]
         remove_codes = [lang.code for lang in decision.languages_to_remove]
-        plan_key = self._resolve_effective_plan_for_group(event.group_id)
+        if runtime is not None:
+            plan_key = self._resolve_effective_plan_key(runtime.subscription_status, runtime.entitlement_plan)
+        else:
+            plan_key = self._resolve_effective_plan_for_group(event.group_id)
         language_limit = language_limit_for(plan_key)
 
-        current_langs = self._dedup_language_codes(self._repo.fetch_group_languages(event.group_id))
+        current_langs = self._dedup_language_codes(self._fetch_group_languages(event.group_id))
         if op in {"add", "add_and_remove"}:
             if self._would_exceed_language_limit(
                 current_langs,
@@ -531,15 +692,16 @@ class MessageHandler:
                 remove_codes,
                 max_languages=language_limit,
             ):
-                logger.info(
-                    "Language update rejected: exceeds max",
-                    extra={
-                        "group_id": event.group_id,
-                        "current": current_langs,
-                        "add": [code for code, _ in add_langs],
-                        "remove": remove_codes,
-                    },
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Language update rejected: exceeds max",
+                        extra={
+                            "group_id": event.group_id,
+                            "current": current_langs,
+                            "add": [code for code, _ in add_langs],
+                            "remove": remove_codes,
+                        },
+                    )
                 msg = self._build_language_limit_message(
                     decision.instruction_language,
                     max_languages=language_limit,
@@ -549,6 +711,7 @@ class MessageHandler:
 
         if op == "reset_all":
             self._repo.reset_group_language_settings(event.group_id)
+            self._invalidate_group_languages(event.group_id)
             # 言語設定モード中は翻訳停止
             self._repo.set_translation_enabled(event.group_id, False)
             # リセット時は必ずガイダンス文言を返す（LLM 生成のあいまいな承諾メッセージを避ける）
@@ -556,30 +719,37 @@ class MessageHandler:
                 "Your language settings have been reset. Please tell us all the languages ​​you would like to translate.",
                 decision.instruction_language,
             )
-            self._reply_text(event, ack)
+            self._reply_text_deferred(event, ack)
             return True
 
+        normalized_add: List[Tuple[str, str]] = []
         if op == "add_and_remove":
+            # current_langs は重複除去済みなので、削除後の集合は差集合 1 回で求まる
             remove_set = {code.lower() for code in remove_codes if code}
-            after_remove = [lang for lang in current_langs if lang not in remove_set]
-            normalized_add = self._normalize_new_languages(add_langs, set(after_remove))
-            if remove_codes:
-                self._repo.remove_group_languages(event.group_id, remove_codes)
-            if normalized_add:
-                self._repo.add_group_languages(event.group_id, normalized_add)
+            normalized_add = self._normalize_new_languages(add_langs, set(current_langs).difference(remove_set))
         elif op == "add":
             normalized_add = self._normalize_new_languages(add_langs, set(current_langs))
-            if normalized_add:
-                self._repo.add_group_languages(event.group_id, normalized_add)
-        elif op == "remove":
+            remove_codes = []
+
+        # 言語の削除・追加と翻訳再開（言語変更後は翻訳を再開する）を 1 回の書き込みにまとめる
+        updater = getattr(self._repo, "apply_group_language_update", None)
+        if updater:
+            updater(
+                event.group_id,
+                add_languages=normalized_add,
+                remove_codes=remove_codes,
+                translation_enabled=True,
+            )
+        else:
             if remove_codes:
                 self._repo.remove_group_languages(event.group_id, remove_codes)
-
-        # 言語変更後は翻訳再開
-        self._repo.set_translation_enabled(event.group_id, True)
+            if normalized_add:
+                self._repo.add_group_languages(event.group_id, normalized_add)
+            self._repo.set_translation_enabled(event.group_id, True)
+        self._invalidate_group_languages(event.group_id)
 
         ack = decision.ack_text or self._translate_template("言語設定を更新しました。", decision.instruction_language)
-        self._reply_text(event, ack)
+        self._reply_text_deferred(event, ack)
         return True
 
     def _respond_unknown_instruction(
@@ -604,6 +774,7 @@ class MessageHandler:
         started = time.perf_counter()
         runtime = self._repo.fetch_translation_runtime_state(event.group_id)
         self._log_translation_stage("runtime_fetched", started, event.group_id)
+        self._forget_checkout_url_if_subscribed(event.group_id, runtime.subscription_status)
 
         plan_key, language_limit, candidate_languages, removed_languages = self._prepare_translation_context(event, runtime)
         logger.info(
@@ -618,7 +789,7 @@ class MessageHandler:
                 "group has no language preferences yet; attempting enrollment",
                 extra={"group_id": event.group_id, "user_id": event.user_id},
             )
-            if self._attempt_language_enrollment(event):
+            if self._attempt_language_enrollment(event, plan_key=plan_key):
                 return True
 
         if not runtime.translation_enabled:
@@ -627,12 +798,29 @@ class MessageHandler:
                 extra={"group_id": event.group_id, "user_id": event.user_id},
             )
             # 停止理由に応じた案内を返して終了
-            self._send_pause_notice(event)
+            self._send_pause_notice(event, runtime=runtime)
             return True
 
         limit = self._quota_limit_for_plan(plan_key)
         stop_translation_on_limit = stop_translation_on_quota(plan_key)
 
+        # 言語数超過の案内文は本文翻訳と独立しているため、翻訳が許可された時点で翻訳 API 呼び出しを並行させる。
+        # クオータ超過で止まる場合は案内文の翻訳も呼ばない
+        shrink_notice_futures: List[Future[str]] = []
+
+        def _start_shrink_notice() -> None:
+            future = self._submit_shrink_notice(
+                event.group_id,
+                language_limit,
+                removed_languages,
+                candidate_languages,
+            )
+            if future is not None:
+                shrink_notice_futures.append(future)
+
+        # 直近メッセージの取得（DB 読み込み）をクオータ判定（DB 書き込み）と並行させる
+        context_future = self._submit_context_fetch(event.group_id)
+
         self._log_translation_stage("before_translation_run", started, event.group_id)
 
         flow = self._translation_flow.run(
@@ -645,8 +833,11 @@ class MessageHandler:
             period_start=runtime.period_start,
             period_end=runtime.period_end,
             quota_anchor_day=runtime.quota_anchor_day,
+            context_future=context_future,
+            on_allowed=_start_shrink_notice,
         )
         self._log_translation_stage("after_translation_run", started, event.group_id)
+        shrink_notice_future = shrink_notice_futures[0] if shrink_notice_futures else None
 
         if self._handle_blocked_translation_flow(event, flow, period_end=runtime.period_end):
             return True
@@ -660,10 +851,14 @@ class MessageHandler:
                 limit=limit,
                 plan_key=plan_key,
                 period_end=runtime.period_end,
+                candidate_languages=candidate_languages,
+                shrink_notice_future=shrink_notice_future,
             )
             self._maybe_upsert_deferred_display_name(event, deferred_display_name)
             self._log_translation_stage("after_line_reply", started, event.group_id)
         else:
+            if shrink_notice_future is not None:
+                shrink_notice_future.cancel()
             logger.warning(
                 "Translation finished without reply text | group=%s candidates=%s plan=%s period=%s",
                 event.group_id,
@@ -685,7 +880,8 @@ class MessageHandler:
         removed_languages: List[str] = []
         if len(raw_languages) > language_limit:
             removed_languages = self._repo.shrink_group_languages(event.group_id, language_limit)
-            raw_languages = self._dedup_language_codes(self._repo.fetch_group_languages(event.group_id))
+            self._invalidate_group_languages(event.group_id)
+            raw_languages = self._dedup_language_codes(self._fetch_group_languages(event.group_id))
         candidate_languages = self._limit_language_codes(raw_languages, max_languages=language_limit)
         return plan_key, language_limit, candidate_languages, removed_languages
 
@@ -724,15 +920,19 @@ class MessageHandler:
         limit: int,
         plan_key: str,
         period_end: Optional[datetime],
+        candidate_languages: Optional[Sequence[str]] = None,
+        shrink_notice_future: Future[str] | None = None,
     ) -> None:
         messages: List[dict] = []
-        if removed_languages:
-            base = (
-                f"Your current plan allows up to {language_limit} languages. "
-                "Older language settings were removed automatically: "
-                f"{', '.join(removed_languages)}"
+        if shrink_notice_future is not None:
+            messages.append({"type": "text", "text": shrink_notice_future.result()})
+        elif removed_languages:
+            shrink_notice = self._build_shrink_notice(
+                event.group_id,
+                language_limit,
+                removed_languages,
+                candidate_languages,
             )
-            shrink_notice = self._build_multilingual_interface_message(base, event.group_id)
             messages.append({"type": "text", "text": shrink_notice})
 
         messages.append({"type": "text", "text": flow.reply_text})
@@ -755,6 +955,48 @@ class MessageHandler:
             return
         self._reply_messages(event, messages)
 
+    def _build_shrink_notice(
+        self,
+        group_id: str,
+        language_limit: int,
+        removed_languages: Sequence[str],
+        languages: Optional[Sequence[str]] = None,
+    ) -> str:
+        base = (
+            f"Your current plan allows up to {language_limit} languages. "
+            "Older language settings were removed automatically: "
+            f"{', '.join(removed_languages)}"
+        )
+        return self._build_multilingual_interface_message(base, group_id, languages=languages)
+
+    def _submit_shrink_notice(
+        self,
+        group_id: str,
+        language_limit: int,
+        removed_languages: Sequence[str],
+        languages: Sequence[str],
+    ) -> Future[str] | None:
+        if not removed_languages:
+            return None
+        try:
+            return self._executor.submit(
+                self._build_shrink_notice,
+                group_id,
+                language_limit,
+                list(removed_languages),
+                list(languages),
+            )
+        except Exception:
+            logger.debug("Executor submission failed; fallback to sync", exc_info=True)
+            return None
+
+    def _submit_context_fetch(self, group_id: str) -> Future[List[models.ContextMessage]] | None:
+        try:
+            return self._executor.submit(self._translation_flow.fetch_context_messages, group_id)
+        except Exception:
+            logger.debug("Executor submission failed; fallback to sync", exc_info=True)
+            return None
+
     def _maybe_upsert_deferred_display_name(
         self,
         event: models.MessageEvent,
@@ -795,6 +1037,7 @@ class MessageHandler:
         )
         effective_plan = self._resolve_effective_plan_key(status, entitlement_plan)
         paid = effective_plan in {STANDARD_PLAN, PRO_PLAN}
+        self._forget_checkout_url_if_subscribed(event.group_id, status)
 
         portal_url = self._subscription_service.create_checkout_url(event.group_id)
         upgrade_url = self._subscription_service.create_checkout_url(event.group_id)
@@ -810,6 +1053,7 @@ class MessageHandler:
             include_upgrade=effective_plan != PRO_PLAN,
             include_cancel=paid,
             translate=lambda text: self._translate_template(text, instruction_lang, force=True),
+            translate_many=lambda texts: self._translate_template(list(texts), instruction_lang, force=True),
             truncate=self._truncate,
             normalize_text=self._normalize_template_text,
         )
@@ -839,6 +1083,7 @@ class MessageHandler:
         confirm = build_subscription_cancel_confirm(
             group_id=event.group_id,
             translate=lambda text: self._translate_template(text, instruction_lang, force=True),
+            translate_many=lambda texts: self._translate_template(list(texts), instruction_lang, force=True),
             truncate=self._truncate,
             normalize_text=self._normalize_template_text,
             base_confirm_text=SUBS_CANCEL_CONFIRM_TEXT,
@@ -904,7 +1149,7 @@ class MessageHandler:
             period_key=period_key,
             period_end=period_end,
         )
-        messages = [{"type": "text", "text": notice_text[:5000]}]
+        messages = [{"type": "text", "text": notice_text}]
         if url:
             # URL は左右書字方向混在時に誤判定されやすいため別メッセージで送る
             messages.append({"type": "text", "text": url})
@@ -938,7 +1183,7 @@ class MessageHandler:
                 f"{reset_line}\n"
                 "To continue using the service, please review plans from the link below."
             )
-            url = self._subscription_service.create_checkout_url(group_id)
+            needs_checkout_url = True
         elif normalized == STANDARD_PLAN:
             reset_date = self._resolve_quota_reset_date(period_key=period_key, period_end=period_end)
             reset_line = (
@@ -951,7 +1196,7 @@ class MessageHandler:
                 f"{reset_line}\n"
                 "To unlock a higher limit now, upgrade to the Pro plan from the link below."
             )
-            url = self._subscription_service.create_checkout_url(group_id)
+            needs_checkout_url = True
         else:
             reset_date = self._resolve_quota_reset_date(period_key=period_key, period_end=period_end)
             reset_line = (
@@ -963,15 +1208,33 @@ class MessageHandler:
                 f"The Pro plan monthly limit ({limit:,} messages) has been reached and translation has stopped.\n"
                 f"{reset_line}"
             )
-            url = None
+            needs_checkout_url = False
+
+        # 購入リンク生成（Stripe 呼び出しの可能性あり）と案内文の翻訳は独立しているので並行させる
+        url_future: Future[Optional[str]] | None = None
+        if needs_checkout_url:
+            try:
+                url_future = self._executor.submit(self._subscription_service.create_checkout_url, group_id)
+            except Exception:
+                logger.debug("Executor submission failed; fallback to sync", exc_info=True)
 
         return self._build_multilingual_notice(
             base,
             group_id,
-            url,
+            None,
             add_missing_link_notice=(paid is not True and normalized != PRO_PLAN),
+            url_resolver=(lambda: self._resolve_checkout_url(group_id, url_future)) if needs_checkout_url else None,
         )
 
+    def _resolve_checkout_url(self, group_id: str, url_future: Future[Optional[str]] | None) -> Optional[str]:
+        if url_future is not None:
+            try:
+                return url_future.result()
+            except Exception:
+                logger.warning("Checkout URL creation failed", exc_info=True)
+                return None
+        return self._subscription_service.create_checkout_url(group_id)
+
     def _resolve_quota_reset_date(
         self,
         *,
@@ -993,11 +1256,19 @@ class MessageHandler:
         except (TypeError, ValueError):
             return None
 
-    def _send_pause_notice(self, event: models.MessageEvent) -> None:
-        """translation_enabled=False のときに理由別の案内を返す。"""
+    def _send_pause_notice(
+        self,
+        event: models.MessageEvent,
+        runtime: Optional[models.TranslationRuntimeState] = None,
+    ) -> None:
+        """translation_enabled=False のときに理由別の案内を返す。
+
+        runtime を渡した場合は再取得せずにそのまま使う。
+        """
         runtime_fetcher = getattr(self._repo, "fetch_translation_runtime_state", None)
-        if runtime_fetcher:
+        if runtime is None and runtime_fetcher:
             runtime = runtime_fetcher(event.group_id)
+        if runtime is not None:
             plan_key = self._resolve_effective_plan_key(runtime.subscription_status, runtime.entitlement_plan)
             period_start = runtime.period_start
             period_end = runtime.period_end
@@ -1012,13 +1283,18 @@ class MessageHandler:
             quota_anchor_day = None
 
         limit = self._quota_limit_for_plan(plan_key)
-        period_key = self._current_period_key(
-            plan_key=plan_key,
-            period_start=period_start,
-            period_end=period_end,
-            quota_anchor_day=quota_anchor_day,
-        )
-        usage = self._repo.get_usage(event.group_id, period_key)
+        if runtime is not None and runtime.period_key:
+            # ランタイム取得時に算出済みの周期キーと利用数をそのまま使う
+            period_key = runtime.period_key
+            usage = runtime.usage
+        else:
+            period_key = self._current_period_key(
+                plan_key=plan_key,
+                period_start=period_start,
+                period_end=period_end,
+                quota_anchor_day=quota_anchor_day,
+            )
+            usage = self._repo.get_usage(event.group_id, period_key)
 
         # 上限超過が原因で停止している場合
         if usage >= limit:
@@ -1040,7 +1316,7 @@ class MessageHandler:
             url,
             add_missing_link_notice=False,
         )
-        messages = [{"type": "text", "text": notice_text[:5000]}]
+        messages = [{"type": "text", "text": notice_text}]
         if url:
             messages.append({"type": "text", "text": url})
         self._reply_messages(event, messages)
@@ -1052,9 +1328,15 @@ class MessageHandler:
         url: Optional[str],
         *,
         add_missing_link_notice: bool = True,
+        url_resolver: Optional[Callable[[], Optional[str]]] = None,
     ) -> tuple[str, Optional[str]]:
-        """案内文と言語混在時に崩れないための URL を分離して返す。"""
+        """案内文と言語混在時に崩れないための URL を分離して返す。
+
+        url_resolver を渡すと、翻訳の完了後に URL を確定させる（並行生成した URL の受け取り用）。
+        """
         translated_block = self._build_multilingual_interface_message(base_text, group_id)
+        if url_resolver is not None:
+            url = url_resolver()
         lines = [translated_block]
         if not url and add_missing_link_notice:
             lines.append("(Unable to generate purchase link at this time, please contact administrator.)")
@@ -1087,56 +1369,82 @@ class MessageHandler:
         group_id: str,
         precomputed_languages: Optional[List[str]] = None,
     ) -> str:
-        base_targets = list(precomputed_languages or self._repo.fetch_group_languages(group_id))
+        base_targets = list(precomputed_languages or self._fetch_group_languages(group_id))
         if instruction_lang:
             base_targets.append(instruction_lang)
+        # _limit_language_codes で小文字化・重複除去済み（以降は lower() し直さない）
         targets_list = self._limit_language_codes(base_targets)
 
         # 英語はベース文をそのまま使用し、翻訳リクエストには含めない
-        translation_targets = [
-            lang for lang in targets_list if not lang.lower().startswith("en")
-        ]
-
-        translations = self._invoke_translation_with_retry(
-            sender_name="System",
-            message_text=USAGE_MESSAGE,
-            timestamp=datetime.now(timezone.utc),
-            context=[],
-            candidate_languages=translation_targets,
-        )
+        translation_targets = [lang for lang in targets_list if not is_english_language_code(lang)]
 
-        targets_lower = {lang.lower() for lang in targets_list}
+        text_by_lang = self._translate_constant(USAGE_MESSAGE, translation_targets)
 
         lines: List[str] = []
-        if any(lang.startswith("en") for lang in targets_lower):
+        if len(translation_targets) < len(targets_list):
             lines.append(_wrap_bidi_isolate(USAGE_MESSAGE, "en"))
+        lines.extend(
+            _wrap_bidi_isolate(strip_source_echo(USAGE_MESSAGE, text), lang) for lang, text in text_by_lang.items()
+        )
 
-        seen_langs = set()
-        for item in translations:
-            lang_code = item.lang.lower()
-            if lang_code in seen_langs:
-                continue
-            seen_langs.add(lang_code)
-            cleaned = strip_source_echo(USAGE_MESSAGE, item.text)
-            lines.append(_wrap_bidi_isolate(cleaned, lang_code))
-
-        return "\n\n".join(lines)[:MAX_REPLY_LENGTH]
+        return join_within_limit(lines)
 
     def _build_unknown_response(self, instruction_lang: str) -> str:
-        translations = self._invoke_translation_with_retry(
-            sender_name="System",
-            message_text=UNKNOWN_INSTRUCTION_BASE,
-            timestamp=datetime.now(timezone.utc),
-            context=[],
-            candidate_languages=[instruction_lang] if instruction_lang else [],
+        translated = self._translate_constant(
+            UNKNOWN_INSTRUCTION_BASE,
+            [instruction_lang.lower()] if instruction_lang else [],
             allow_same_language=True,
         )
-        if not translations:
+        if not translated:
             return self._normalize_bullet_newlines(UNKNOWN_INSTRUCTION_BASE)
-        text = strip_source_echo(UNKNOWN_INSTRUCTION_BASE, translations[0].text)
+        text = strip_source_echo(UNKNOWN_INSTRUCTION_BASE, next(iter(translated.values())))
         normalized = self._normalize_bullet_newlines(text or UNKNOWN_INSTRUCTION_BASE)
         return normalized
 
+    def _translate_constant(
+        self,
+        base_text: str,
+        languages: Sequence[str],
+        *,
+        allow_same_language: bool = False,
+    ) -> Dict[str, str]:
+        """固定文言を languages（小文字化済み）へ翻訳し、言語 -> 訳文を返す。
+
+        訳文は言語ごとにプロセス内で使い回し、まだ持っていない言語だけをまとめて翻訳する。
+        """
+        cached: Dict[str, str] = {}
+        missing: List[str] = []
+        for lang in languages:
+            text = self._constant_translation_cache.get((base_text, lang, allow_same_language))
+            if text is None:
+                missing.append(lang)
+            else:
+                cached[lang] = text
+
+        fresh: Dict[str, str] = {}
+        if missing:
+            translations = self._invoke_translation_with_retry(
+                sender_name="System",
+                message_text=base_text,
+                timestamp=datetime.now(timezone.utc),
+                context=[],
+                candidate_languages=missing,
+                allow_same_language=allow_same_language,
+            )
+            # 同じ言語が複数返った場合は先頭を採用する
+            for item in translations or []:
+                if item.text:
+                    fresh.setdefault(item.lang.lower(), item.text)
+            # 依頼と異なる言語で返った訳を依頼言語の訳として残さないよう、返ってきた言語コードでだけ保持する
+            for lang, text in fresh.items():
+                self._constant_translation_cache.put((base_text, lang, allow_same_language), text)
+
+        # 依頼順に並べ、想定外の言語で返ってきた訳は末尾に付ける
+        result = {lang: text for lang in languages if (text := cached.get(lang) or fresh.get(lang))}
+        for lang, text in fresh.items():
+            result.setdefault(lang, text)
+        return result
+
     def _translate_interface_single(self, base_text: str, instruction_lang: str, group_id: str) -> str:
         """インターフェース文言を 1 言語で返す。instruction_lang が無い場合はグループの主要言語を使用。"""
 
@@ -1152,10 +1460,10 @@ class MessageHandler:
                 logger.warning("translate_interface_single failed", exc_info=True)
 
         # グループ主要言語へフォールバック
-        languages = getattr(self._repo, "fetch_group_languages", lambda *_: [])(group_id)
+        languages = self._fetch_group_languages(group_id)
         primary = None
         for lang in languages:
-            if lang and not lang.lower().startswith("en"):
+            if lang and not is_english_language_code(lang):
                 primary = lang
                 break
 
@@ -1172,12 +1480,12 @@ class MessageHandler:
 
     def _normalize_bullet_newlines(self, text: str) -> str:
         """箇条書きのハイフンの前に改行を強制して読みやすくする。"""
-        return re.sub(r"(?<!\n)(- )", "\n- ", text)
+        return _BULLET_RE.sub("\n- ", text)
 
     def _build_language_limit_message(self, instruction_lang: str, *, max_languages: Optional[int] = None) -> str:
         limit = max_languages if max_languages is not None else self._max_group_languages
         base = LANGUAGE_LIMIT_MESSAGE_EN.format(limit=limit)
-        if not instruction_lang or instruction_lang.lower().startswith("en"):
+        if not instruction_lang or is_english_language_code(instruction_lang):
             return base
 
         manual = None
@@ -1204,9 +1512,10 @@ class MessageHandler:
         if not instruction_lang:
             return base_text
 
-        lowered = instruction_lang.lower()
-        if lowered.startswith("en") and not force:
+        # 英語（ベース言語）はそのまま返す。判定は先頭 2 文字だけで行い、小文字化はキャッシュキー用に後で 1 回だけ
+        if not force and is_english_language_code(instruction_lang):
             return base_text
+        lowered = instruction_lang.lower()
 
         if not originals:
             return base_text
@@ -1214,6 +1523,11 @@ class MessageHandler:
         delimiter = "\n---\n"
         joined = delimiter.join(originals)
 
+        cache_key = (joined, lowered, force)
+        cached = self._template_cache.get(cache_key)
+        if cached is not None:
+            return list(cached) if is_sequence else cached[0]
+
         translations = self._invoke_translation_with_retry(
             sender_name="System",
             message_text=joined,
@@ -1230,14 +1544,15 @@ class MessageHandler:
             return base_text
 
         normalized = [self._normalize_template_text(part or orig) for part, orig in zip(parts, originals)]
+        self._template_cache.put(cache_key, normalized)
         if is_sequence:
-            return normalized
+            return list(normalized)
         return normalized[0]
 
     def _record_message(self, event: models.MessageEvent, sender_name: str, timestamp: Optional[datetime] = None) -> None:
         if not event.group_id or not event.user_id:
             return
-        ts = timestamp or datetime.fromtimestamp(event.timestamp / 1000, tz=timezone.utc)
+        ts = timestamp or event.occurred_at or datetime.now(timezone.utc)
         record = models.StoredMessage(
             group_id=event.group_id,
             user_id=event.user_id,
@@ -1261,17 +1576,15 @@ class MessageHandler:
             return []
 
         return self._run_with_retry(
-            label="Gemini translation",
-            func=partial(
-                self._translation.translate,
-                sender_name=sender_name,
-                message_text=message_text,
-                timestamp=timestamp,
-                context_messages=context,
-                candidate_languages=candidate_languages,
-                allow_same_language=allow_same_language,
-            ),
-            timeout_seconds=getattr(getattr(self._translation, "_translator", None), "_timeout", None),
+            "Gemini translation",
+            self._translation.translate,
+            timeout_seconds=self._translation_timeout,
+            sender_name=sender_name,
+            message_text=message_text,
+            timestamp=timestamp,
+            context_messages=context,
+            candidate_languages=candidate_languages,
+            allow_same_language=allow_same_language,
         )
 
     def _invoke_interface_translation_with_retry(
@@ -1283,80 +1596,125 @@ class MessageHandler:
             return []
 
         return self._run_with_retry(
-            label="Gemini interface translation",
-            func=partial(self._interface_translation.translate, base_text, target_languages),
-            timeout_seconds=getattr(getattr(self._interface_translation, "_translator", None), "_timeout", None),
+            "Gemini interface translation",
+            self._interface_translation.translate,
+            base_text,
+            target_languages,
+            timeout_seconds=self._interface_timeout,
         )
 
-    def _run_with_retry(self, label: str, func, timeout_seconds: int | None = None):
-        """翻訳系リトライ共通処理。"""
-        last_error: Exception | None = None
-        for attempt in range(self._translation_retry):
-            try:
-                return func()
-            except requests.exceptions.Timeout as exc:
-                logger.warning(
-                    "%s timeout",
-                    label,
-                    extra={"attempt": attempt + 1, "timeout_seconds": timeout_seconds},
-                )
-                last_error = exc
-            except Exception as exc:  # pylint: disable=broad-except
-                if isinstance(exc, GeminiRateLimitError):
-                    last_error = exc
-                    break
-                logger.warning(
-                    "%s failed (attempt %s/%s)",
-                    label,
-                    attempt + 1,
-                    self._translation_retry,
-                )
-                last_error = exc
-            time.sleep(0.5 * (attempt + 1))
+    def _default_retry_error_policy(self) -> Dict[type, RetryRule]:
+        """例外種別ごとの既定リトライ方針。
 
-        logger.error("%s failed after retries", label)
-        if last_error:
-            raise last_error
-        return []
+        タイムアウトは短い間隔で素早く再試行し、レート制限は回復に時間がかかるため
+        長めの間隔で 1 回だけ再試行する。
+        """
+        retries = max(1, self._translation_retry)
+        return {
+            requests.exceptions.Timeout: RetryRule(retries, 0.25, 2.0),
+            GeminiRateLimitError: RetryRule(2, 5.0, 30.0),
+            Exception: RetryRule(retries, self._retry_backoff_base, self._retry_backoff_cap),
+        }
 
-    def _build_multilingual_interface_message(self, base_text: str, group_id: str) -> str:
-        languages = self._limit_language_codes(self._repo.fetch_group_languages(group_id))
+    def _run_with_retry(
+        self,
+        label: str,
+        func,
+        *args,
+        timeout_seconds: int | None = None,
+        error_policy: Optional[Dict[type, RetryRule]] = None,
+        **kwargs,
+    ):
+        """翻訳系リトライ共通処理。func(*args, **kwargs) を呼び、試行回数と待機間隔は例外種別ごとに error_policy で決める。
+
+        例外種別が入れ替わっても、総試行回数は最も多いルールの max_attempts を超えない。
+        待機の合計は timeout_seconds（未指定なら既定値）までに抑える。
+        """
+        policy = error_policy or self._retry_error_policy
+        max_total_attempts = max((rule.max_attempts for rule in policy.values()), default=1)
+        sleep_budget = DEFAULT_RETRY_SLEEP_BUDGET_SECONDS
+        if timeout_seconds is not None:
+            sleep_budget = min(sleep_budget, max(0.0, float(timeout_seconds)))
+        attempts: Dict[type, int] = {}
+        total_attempts = 0
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except Exception as exc:  # pylint: disable=broad-except
+                error_key, rule = resolve_retry_rule(exc, policy)
+                if rule is None:
+                    raise
+                attempt = attempts.get(error_key, 0) + 1
+                attempts[error_key] = attempt
+                total_attempts += 1
+                if isinstance(exc, requests.exceptions.Timeout):
+                    logger.warning(
+                        "%s timeout",
+                        label,
+                        extra={"attempt": attempt, "timeout_seconds": timeout_seconds},
+                    )
+                elif isinstance(exc, GeminiRateLimitError):
+                    logger.warning("%s rate limited (attempt %s/%s)", label, attempt, rule.max_attempts)
+                else:
+                    logger.warning("%s failed (attempt %s/%s)", label, attempt, rule.max_attempts)
+                if attempt >= rule.max_attempts or total_attempts >= max_total_attempts:
+                    logger.error("%s failed after retries", label)
+                    raise
+                # 同時失敗時に再試行が揃わないようジッター付きで待つ
+                delay = min(backoff_delay(attempt - 1, rule.base_delay, rule.cap_delay), sleep_budget)
+                if delay:
+                    sleep_budget -= delay
+                    time.sleep(delay)
+
+    def _build_multilingual_interface_message(
+        self,
+        base_text: str,
+        group_id: str,
+        languages: Optional[Sequence[str]] = None,
+    ) -> str:
+        """languages を渡した場合はグループ言語を再取得せずにそれを使う。"""
+        if languages is None:
+            languages = self._fetch_and_limit_languages(group_id)
+        else:
+            languages = self._limit_language_codes(languages)
 
         # ベース文は英語前提でそのまま使用する
         base_text_en = base_text or ""
 
-        translate_targets = [lang for lang in languages if lang.lower() != "en"]
+        # languages は _limit_language_codes で小文字化済み
+        translate_targets = [lang for lang in languages if not is_english_language_code(lang)]
+        if not translate_targets:
+            # 英語（en-US 等の地域付きを含む）だけ、または言語未設定なら翻訳 API を呼ばない
+            return base_text_en
         translations = self._invoke_interface_translation_with_retry(base_text_en, translate_targets)
 
         if not translations:
             return base_text_en
 
-        text_by_lang = {}
+        # 同じ言語が複数返った場合は先頭を採用する
+        text_by_lang: Dict[str, str] = {}
         for item in translations:
             lowered = item.lang.lower()
-            if lowered in text_by_lang:
-                continue
-            cleaned = strip_source_echo(base_text_en, item.text)
-            text_by_lang[lowered] = cleaned or item.text or base_text_en
-
-        lines: List[str] = []
-        for lang in languages:
-            lowered = lang.lower()
-            if lowered == "en":
-                text = base_text_en  # ベース英語文をそのまま使う
-            else:
-                text = text_by_lang.get(lowered, base_text_en)
-            text = (text or base_text_en).strip()
-            lines.append(_wrap_bidi_isolate(text, lowered))
+            if lowered not in text_by_lang:
+                text_by_lang[lowered] = strip_source_echo(base_text_en, item.text) or item.text or base_text_en
 
-        return "\n\n".join(lines)[:MAX_REPLY_LENGTH]
+        # 英語はベース文をそのまま使う
+        text_by_lang.update((lang, base_text_en) for lang in languages if is_english_language_code(lang))
+        return join_within_limit(
+            _wrap_bidi_isolate((text_by_lang.get(lang) or base_text_en).strip(), lang) for lang in languages
+        )
 
     def _send_rate_limit_notice(self, event: models.MessageEvent) -> None:
         key = event.group_id or event.user_id or "unknown"
-        if _last_rate_limit_message.get(key) == RATE_LIMIT_MESSAGE:
+        if not _take_rate_limit_notice_token(key):
             return
-        if self._reply_text(event, RATE_LIMIT_MESSAGE):
-            _last_rate_limit_message[key] = RATE_LIMIT_MESSAGE
+        sent = False
+        try:
+            sent = self._reply_text(event, RATE_LIMIT_MESSAGE)
+        finally:
+            # 返信に失敗したら通知を抑止しない（次のイベントで改めて案内する）
+            if not sent:
+                _refund_rate_limit_notice_token(key)
 
     def _prepare_language_prompt_texts(self, supported, preference: models.LanguagePreference) -> Dict[str, str]:
         primary_lang = (preference.primary_language or "").lower()
@@ -1406,8 +1764,11 @@ class MessageHandler:
         """軽微な生成ゆらぎで先頭に挿入される余白を除去し、空行を詰める。"""
         if not text:
             return ""
-        normalized = text.replace("\r\n", "\n").replace("\r", "\n").strip()
-        normalized = re.sub(r"\n{3,}", "\n\n", normalized)
+        # 大半の文言は改行コードが LF のみで空行も少ないため、該当するときだけ置換する
+        normalized = _CRLF_RE.sub("\n", text) if "\r" in text else text
+        normalized = normalized.strip()
+        if "\n\n\n" in normalized:
+            normalized = _EXCESS_NEWLINES_RE.sub("\n\n", normalized)
         return normalized
 
     @staticmethod
@@ -1432,6 +1793,22 @@ class MessageHandler:
             return name, name
         return event.user_id, None
 
+    def _submit_sender_name(self, event: models.MessageEvent) -> Future[tuple[str, str | None]] | None:
+        try:
+            return self._executor.submit(self._resolve_sender_name, event)
+        except Exception:
+            logger.debug("Executor submission failed; fallback to sync", exc_info=True)
+            return None
+
+    @staticmethod
+    def _await_sender_name(future: Future[tuple[str, str | None]], event: models.MessageEvent) -> str:
+        try:
+            sender_name, _deferred_name = future.result()
+            return sender_name
+        except Exception:
+            logger.warning("Failed to resolve sender name", exc_info=True)
+            return event.user_id or "Unknown"
+
     def _log_translation_stage(self, stage: str, started: float, group_id: str) -> None:
         logger.info(
             "Translation stage | stage=%s elapsed_ms=%.2f group=%s",
@@ -1442,8 +1819,7 @@ class MessageHandler:
 
     @staticmethod
     def _build_simple_confirm_text(languages) -> str:
-        names = [lang.name or lang.code for lang in languages]
-        filtered = [name for name in names if name]
+        filtered = [name for lang in languages if (name := lang.name or lang.code)]
         if not filtered:
             return "Do you want to enable translation?"
         if len(filtered) == 1:
@@ -1451,11 +1827,12 @@ class MessageHandler:
         elif len(filtered) == 2:
             joined = " and ".join(filtered)
         else:
-            joined = ", ".join(filtered[:-1]) + ", and " + filtered[-1]
+            joined = ", ".join(islice(filtered, len(filtered) - 1)) + ", and " + filtered[-1]
         return f"Do you want to enable translation for {joined}?"
 
     def _fetch_and_limit_languages(self, group_id: str) -> List[str]:
-        return self._limit_language_codes(self._repo.fetch_group_languages(group_id))
+        """グループ言語を上限件数に絞って返す（取得はイベント単位で memo 化される）。"""
+        return self._limit_language_codes(self._fetch_group_languages(group_id))
 
     def _resolve_effective_plan_for_group(self, group_id: str) -> str:
         runtime_fetcher = getattr(self._repo, "fetch_translation_runtime_state", None)
@@ -1496,6 +1873,11 @@ class MessageHandler:
     def _is_active_subscription(status: Optional[str]) -> bool:
         return status in {"active", "trialing"}
 
+    def _forget_checkout_url_if_subscribed(self, group_id: Optional[str], status: Optional[str]) -> None:
+        # Stripe webhook は別 Lambda で動くため、契約済みを観測した時点で手元の Checkout URL を捨てる
+        if group_id and self._is_active_subscription(status):
+            self._subscription_service.invalidate_checkout_url(group_id)
+
     def _resolve_effective_plan_key(self, status: Optional[str], entitlement_plan: Optional[str]) -> str:
         plan_key = resolve_effective_plan(status, entitlement_plan)
         if self._is_active_subscription(status) and plan_key == FREE_PLAN:
@@ -1521,23 +1903,13 @@ class MessageHandler:
         *,
         max_languages: Optional[int] = None,
     ) -> bool:
+        """current_langs は _dedup_language_codes 済み（小文字・重複なし）の一覧を受け取る。"""
         limit = max_languages if max_languages is not None else self._max_group_languages
-        remove_set = {code.lower() for code in remove_codes if code}
-        remaining = [code.lower() for code in current_langs if code and code.lower() not in remove_set]
-
-        to_add: list[str] = []
+        remove_set = set(self._dedup_language_codes(remove_codes))
+        remaining = [code for code in current_langs if code not in remove_set]
         seen = set(remaining)
-        for code, _name in add_langs:
-            if not code:
-                continue
-            lowered = code.lower()
-            if lowered in seen:
-                continue
-            seen.add(lowered)
-            to_add.append(lowered)
-
-        final_count = len(remaining) + len(to_add)
-        return final_count > limit
+        to_add = [code for code in self._dedup_language_codes([code for code, _ in add_langs]) if code not in seen]
+        return len(remaining) + len(to_add) > limit
 
     def _limit_language_choices(self, languages: Sequence[models.LanguageChoice]) -> Tuple[List[models.LanguageChoice], List[models.LanguageChoice]]:
         limited: List[models.LanguageChoice] = []
@@ -1555,15 +1927,9 @@ class MessageHandler:
         return limited, dropped
 
     def _dedup_language_codes(self, languages: Sequence[str]) -> List[str]:
-        deduped: List[str] = []
-        seen = set()
-        for code in languages:
-            lowered = (code or "").lower()
-            if not lowered or lowered in seen:
-                continue
-            seen.add(lowered)
-            deduped.append(lowered)
-        return deduped
+        # dict.fromkeys で出現順を保ったまま重複を除く（小文字化後に比較）
+        lowered = ((code or "").lower() for code in languages)
+        return list(dict.fromkeys(code for code in lowered if code))
 
     def _limit_language_codes(self, languages: Sequence[str], max_languages: Optional[int] = None) -> List[str]:
         limit = max_languages if max_languages is not None else self._max_group_languages
@@ -1581,43 +1947,4 @@ class MessageHandler:
             normalized.append((lowered, name))
         return normalized
 
-    @staticmethod
-    def _encode_postback_payload(payload: Dict, max_bytes: int = 280) -> str:
-        """Encode payload for LINE postback with size guard (LINE上限≈300 bytes)."""
-        def _encode(data: Dict) -> str:
-            raw = json.dumps(data, separators=(",", ":")).encode("utf-8")
-            compressed = base64.urlsafe_b64encode(zlib.compress(raw)).decode("ascii").rstrip("=")
-            return f"langpref2={compressed}"
-
-        encoded = _encode(payload)
-        if len(encoded.encode("utf-8")) <= max_bytes:
-            return encoded
-
-        # try shortening optional texts first
-        def _shrink_text(key: str, factor: float = 0.6) -> bool:
-            if key in payload and payload[key]:
-                text = payload[key]
-                new_len = max(int(len(text) * factor), 32)
-                payload[key] = text[:new_len]
-                return True
-            return False
-
-        optional_keys = ("limit_text", "cancel_text", "completion_text")
-        for key in optional_keys:
-            # try shrinking this key up to 3 times before moving on
-            for _ in range(3):
-                changed = _shrink_text(key)
-                encoded = _encode(payload)
-                if len(encoded.encode("utf-8")) <= max_bytes:
-                    return encoded
-                if not changed:
-                    break
-            # drop the key entirely if still too large
-            if key in payload:
-                payload.pop(key, None)
-                encoded = _encode(payload)
-                if len(encoded.encode("utf-8")) <= max_bytes:
-                    return encoded
-
-        encoded = _encode(payload)
-        return encoded[:max_bytes]
+    _encode_postback_payload = staticmethod(encode_language_postback_payload)
@@ -7,8 +7,9 @@ from ...domain import models
 from ...domain.ports import LinePort, MessageRepositoryPort
 from ...domain.services.interface_translation_service import InterfaceTranslationService
 from ...domain.services.subscription_service import SubscriptionService
+from ...domain.services.language_codes import is_english_language_code
 from ...domain.services.language_settings_service import LanguageSettingsService
-from ...presentation.reply_formatter import strip_source_echo
+from ...presentation.reply_formatter import join_within_limit, strip_source_echo
 from ..subscription_texts import (
     SUBS_CANCEL_CONFIRM_TEXT,
     SUBS_CANCEL_DONE_TEXT,
@@ -81,17 +82,19 @@ class PostbackHandler:
                 limit_text=payload.get("limit_text"),
             )
             if not bundle:
-                logger.info(
-                    "Duplicate language confirmation ignored",
-                    extra={"group_id": event.group_id, "languages": [code for code, _ in tuples]},
-                )
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Duplicate language confirmation ignored",
+                        extra={"group_id": event.group_id, "languages": [code for code, _ in tuples]},
+                    )
                 return
             if event.reply_token and bundle.texts:
                 self._line.reply_text(event.reply_token, bundle.texts[0])
-            logger.info(
-                "Language preferences saved",
-                extra={"group_id": event.group_id, "languages": [code for code, _ in tuples]},
-            )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Language preferences saved",
+                    extra={"group_id": event.group_id, "languages": [code for code, _ in tuples]},
+                )
         elif action == "cancel":
             bundle = self._lang_settings.cancel(
                 group_id=event.group_id,
@@ -110,7 +113,7 @@ class PostbackHandler:
 
     def _build_multilingual_message(self, base_text: str, group_id: str) -> str:
         languages = self._repo.fetch_group_languages(group_id)
-        targets = [lang for lang in languages if lang and not lang.lower().startswith("en")]
+        targets = [lang for lang in languages if lang and not is_english_language_code(lang)]
         if not self._interface_translation or not targets:
             return base_text
 
@@ -133,13 +136,13 @@ class PostbackHandler:
             if text and text not in lines:
                 lines.append(text)
 
-        return "\n\n".join(lines)[:5000]
+        return join_within_limit(lines)
 
     def _translate_for_group(self, base_text: str, group_id: str) -> str:
         languages = self._repo.fetch_group_languages(group_id)
         primary = None
         for lang in languages:
-            if lang and not lang.lower().startswith("en"):
+            if lang and not is_english_language_code(lang):
                 primary = lang
                 break
         if not primary or not self._interface_translation:
@@ -5,23 +5,34 @@ import json
 import zlib
 from typing import Dict, Optional
 
+from ..domain.services.language_payload import (
+    LANGUAGE_PAYLOAD_KEY,
+    LANGUAGE_PAYLOAD_ZDICT,
+    LANGUAGE_PAYLOAD_ZDICT_PREFIX,
+    LANGUAGE_PAYLOAD_ZLIB_PREFIX,
+)
+
 
 def decode_postback_payload(data: str) -> Optional[Dict]:
     """LINE postback data を decode する共通ユーティリティ。
 
-    - 言語設定: "langpref=" / "langpref2=" で zlib 圧縮 + base64
+    - 言語設定: "langpref=" は base64 のみ、"langpref2=" は zlib 圧縮、
+      "langpref3=" はプリセット辞書付き zlib 圧縮（いずれも base64）
     - サブスク操作: "subctrl=" で base64
     """
     if not data:
         return None
 
-    if data.startswith("langpref"):
-        prefix, token = data.split("=", 1)
+    if data.startswith(LANGUAGE_PAYLOAD_KEY):
+        token = data.split("=", 1)[1]
         padding = "=" * (-len(token) % 4)
         try:
             blob = base64.urlsafe_b64decode(token + padding)
-            if prefix == "langpref2":
+            if data.startswith(LANGUAGE_PAYLOAD_ZLIB_PREFIX):
                 blob = zlib.decompress(blob)
+            elif data.startswith(LANGUAGE_PAYLOAD_ZDICT_PREFIX):
+                decompressor = zlib.decompressobj(zdict=LANGUAGE_PAYLOAD_ZDICT)
+                blob = decompressor.decompress(blob) + decompressor.flush()
             decoded = blob.decode("utf-8")
             return json.loads(decoded)
         except Exception:  # pylint: disable=broad-except
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, List, Optional, Sequence
 
 from .subscription_postback import encode_subscription_payload
 from .subscription_texts import (
@@ -14,10 +14,24 @@ from .subscription_texts import (
 from ..domain.services.subscription_service import SubscriptionService
 
 TranslateFn = Callable[[str], str]
+TranslateManyFn = Callable[[Sequence[str]], Sequence[str]]
 TruncateFn = Callable[[str, int], str]
 NormalizeFn = Callable[[str], str]
 
 
+def _translate_texts(
+    texts: List[str],
+    translate: TranslateFn,
+    translate_many: Optional[TranslateManyFn],
+) -> Dict[str, str]:
+    """テンプレートで使う文言をまとめて翻訳する。translate_many があれば 1 回の呼び出しで済ませる。"""
+    if translate_many:
+        translated = list(translate_many(texts) or [])
+        if len(translated) == len(texts):
+            return {text: (result or text) for text, result in zip(texts, translated)}
+    return {text: (translate(text) or text) for text in texts}
+
+
 def build_subscription_menu_message(
     *,
     group_id: str,
@@ -32,25 +46,34 @@ def build_subscription_menu_message(
     translate: TranslateFn,
     truncate: TruncateFn,
     normalize_text: NormalizeFn,
+    translate_many: Optional[TranslateManyFn] = None,
 ) -> Optional[Dict]:
     summary = SubscriptionService.build_subscription_summary_text(
         status,
         period_end,
         plan_key=effective_plan,
     )
-    translated_summary = translate(summary) or summary
-    body_text = truncate(normalize_text(translated_summary), 120)
+    texts = [summary, SUBS_MENU_TITLE, SUBS_MENU_TEXT]
+    if portal_url:
+        texts.append(SUBS_VIEW_LABEL)
+    if include_cancel:
+        texts.append(SUBS_CANCEL_LABEL)
+    if include_upgrade and upgrade_url:
+        texts.append(SUBS_UPGRADE_LABEL)
+    translated = _translate_texts(texts, translate, translate_many)
+
+    body_text = truncate(normalize_text(translated[summary]), 120)
 
-    title = translate(SUBS_MENU_TITLE) or SUBS_MENU_TITLE
-    alt_text = translate(SUBS_MENU_TEXT) or SUBS_MENU_TEXT
+    title = translated[SUBS_MENU_TITLE]
+    alt_text = translated[SUBS_MENU_TEXT]
 
     actions = []
     if portal_url:
-        label = translate(SUBS_VIEW_LABEL) or SUBS_VIEW_LABEL
+        label = translated[SUBS_VIEW_LABEL]
         actions.append({"type": "uri", "label": truncate(label, 20), "uri": portal_url})
 
     if include_cancel:
-        label = translate(SUBS_CANCEL_LABEL) or SUBS_CANCEL_LABEL
+        label = translated[SUBS_CANCEL_LABEL]
         payload = encode_subscription_payload({
             "kind": "cancel",
             "group_id": group_id,
@@ -59,7 +82,7 @@ def build_subscription_menu_message(
         actions.append({"type": "postback", "label": truncate(label, 20), "data": payload})
 
     if include_upgrade and upgrade_url:
-        label = translate(SUBS_UPGRADE_LABEL) or SUBS_UPGRADE_LABEL
+        label = translated[SUBS_UPGRADE_LABEL]
         actions.append({"type": "uri", "label": truncate(label, 20), "uri": upgrade_url})
 
     if not actions:
@@ -84,10 +107,12 @@ def build_subscription_cancel_confirm(
     truncate: TruncateFn,
     normalize_text: NormalizeFn,
     base_confirm_text: str,
+    translate_many: Optional[TranslateManyFn] = None,
 ) -> Dict:
-    confirm_text = translate(base_confirm_text) or base_confirm_text
-    yes_label = translate("Yes") or "Yes"
-    no_label = translate("No") or "No"
+    translated = _translate_texts([base_confirm_text, "Yes", "No"], translate, translate_many)
+    confirm_text = translated[base_confirm_text]
+    yes_label = translated["Yes"]
+    no_label = translated["No"]
 
     payload_yes = encode_subscription_payload({"kind": "cancel_confirm", "group_id": group_id})
     payload_no = encode_subscription_payload({"kind": "cancel_reject", "group_id": group_id})
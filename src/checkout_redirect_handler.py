@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import importlib
 import json
 import logging
 import secrets
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Dict, Optional, Tuple
 from urllib.error import HTTPError, URLError
 from urllib.parse import quote, urlencode
@@ -956,11 +956,14 @@ def _get_repo() -> NeonMessageRepository:
     return _repo
 
 
+@lru_cache(maxsize=1)
 def _import_stripe():
+    # 初回呼び出し時にだけ読み込み、未インストールの結果も含めてプロセス内で使い回す
     try:
-        return importlib.import_module("stripe")
+        import stripe
     except ModuleNotFoundError:
         return None
+    return stripe
 
 
 def _redirect_response(location: str) -> Dict[str, Any]:
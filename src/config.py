@@ -11,6 +11,8 @@ class Settings:
     line_channel_access_token: str
     gemini_api_key: str
     neon_database_url: str
+    # Lambda ランタイム用の Neon pooled (PgBouncer) 接続先。未設定時は neon_database_url を使う
+    neon_pooled_database_url: str = ""
     gemini_model: str = "gemini-flash-latest"
     command_model: str = "gemini-flash-latest"
     bot_mention_name: str = "通訳AI"
@@ -73,6 +75,7 @@ def get_settings() -> Settings:
         line_channel_access_token=required["LINE_CHANNEL_ACCESS_TOKEN"],
         gemini_api_key=required["GEMINI_API_KEY"],
         neon_database_url=required["NEON_DATABASE_URL"],
+        neon_pooled_database_url=env.get("NEON_POOLED_DATABASE_URL", ""),
         gemini_model=env.get("GEMINI_MODEL", "gemini-flash-latest"),
         command_model=env.get("COMMAND_MODEL", env.get("GEMINI_MODEL", "gemini-flash-latest")),
         bot_mention_name=env.get("BOT_MENTION_NAME", "通訳AI"),
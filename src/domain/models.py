@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import cached_property
 from typing import List, Optional, Sequence
 
 
@@ -15,6 +16,16 @@ class BaseEvent:
     sender_type: str
     timestamp: int = 0
 
+    @cached_property
+    def occurred_at(self) -> Optional[datetime]:
+        """timestamp(ms) を UTC の datetime に変換した値。イベントごとに一度だけ計算する。"""
+        if not self.timestamp:
+            return None
+        try:
+            return datetime.fromtimestamp(self.timestamp / 1000, tz=timezone.utc)
+        except (TypeError, ValueError, OverflowError, OSError):
+            return None
+
 
 @dataclass(frozen=True)
 class Mentionee:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional, Sequence, Tuple, Protocol
+from typing import Dict, List, Optional, Sequence, Tuple, Protocol
 
 from .models import (
     ConversationMessage,
@@ -26,6 +26,10 @@ class LinePort:
 
     def get_display_name(self, source_type: str, container_id: Optional[str], user_id: str) -> Optional[str]: ...
 
+    def get_display_names(
+        self, source_type: str, container_id: Optional[str], user_ids: Sequence[str]
+    ) -> Dict[str, str]: ...
+
     def get_group_name(self, group_id: str) -> Optional[str]: ...
 
 
@@ -44,6 +48,8 @@ class LanguagePreferencePort:
 class MessageRepositoryPort:
     def ensure_group_member(self, group_id: str, user_id: str) -> None: ...
 
+    def ensure_group_members(self, group_id: str, user_ids: Sequence[str]) -> None: ...
+
     def mark_group_member_left(self, group_id: str, user_id: str, left_at: Optional[datetime] = None) -> None: ...
 
     def get_group_member_display_name(self, group_id: str, user_id: str) -> Optional[str]: ...
@@ -69,6 +75,15 @@ class MessageRepositoryPort:
 
     def remove_group_languages(self, group_id: str, lang_codes: Sequence[str]) -> None: ...
 
+    def apply_group_language_update(
+        self,
+        group_id: str,
+        *,
+        add_languages: Sequence[Tuple[str, str]],
+        remove_codes: Sequence[str],
+        translation_enabled: bool,
+    ) -> None: ...
+
     def shrink_group_languages(self, group_id: str, keep_limit: int) -> List[str]: ...
 
     def set_translation_enabled(self, group_id: str, enabled: bool) -> None: ...
@@ -81,6 +96,8 @@ class MessageRepositoryPort:
 
     def fetch_bot_joined_at(self, group_id: str) -> Optional[datetime]: ...
 
+    def initialize_group(self, group_id: str, joined_at: datetime, group_name: Optional[str] = None) -> None: ...
+
     def upsert_group_name(self, group_id: str, group_name: str) -> None: ...
 
     # Stripe 課金/利用カウント
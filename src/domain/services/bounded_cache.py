@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# 固定文言（案内・確認・未対応言語など）の翻訳結果を保持する件数の上限
+TEMPLATE_TRANSLATION_CACHE_SIZE = 512
+
+
+class BoundedLRUCache(Generic[K, V]):
+    """スレッドセーフな件数上限付き LRU キャッシュ。
+
+    ttl_seconds を指定すると、登録から期限を過ぎた項目は取得時に削除し、追加時にも
+    先頭（最も使われていない側）から期限切れの項目を掃除する。
+    """
+
+    def __init__(self, max_size: int, *, ttl_seconds: Optional[float] = None) -> None:
+        self._max_size = max(1, max_size)
+        self._ttl = ttl_seconds
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._is_expired(entry[0], time.monotonic()):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: K, value: V) -> None:
+        now = time.monotonic()
+        with self._lock:
+            self._entries[key] = (now, value)
+            self._entries.move_to_end(key)
+            while self._entries:
+                oldest_key, (stored_at, _value) = next(iter(self._entries.items()))
+                if len(self._entries) <= self._max_size and not self._is_expired(stored_at, now):
+                    break
+                del self._entries[oldest_key]
+
+    def pop(self, key: K) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _is_expired(self, stored_at: float, now: float) -> bool:
+        return self._ttl is not None and now - stored_at >= self._ttl
@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+
+def is_english_language_code(code: str) -> bool:
+    """en / en-US / EN などの英語コードか（大文字小文字は区別しない）。"""
+    return code[:2].lower() == "en"
@@ -1,10 +1,27 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from langdetect import LangDetectException, detect, DetectorFactory
 
 # 乱数シードを固定して言語判定結果のブレを防ぐ
 DetectorFactory.seed = 0
 
+# 判定結果をキャッシュする文字数の上限（メンションのコマンド文程度の短文だけを対象にする）
+DETECTION_CACHE_MAX_TEXT_LENGTH = 200
+
+
+@lru_cache(maxsize=4096)
+def _detect_cached(text: str) -> str:
+    return _detect(text)
+
+
+def _detect(text: str) -> str:
+    try:
+        return detect(text)
+    except LangDetectException:
+        return ""
+
 
 class LanguageDetectionService:
     """メッセージ言語を判定するための薄いユーティリティ。"""
@@ -12,7 +29,7 @@ class LanguageDetectionService:
     def detect(self, text: str) -> str:
         if not text:
             return ""
-        try:
-            return detect(text)
-        except LangDetectException:
-            return ""
+        # シード固定で判定は入力に対して決定的なので、同じ短文は結果を使い回す
+        if len(text) <= DETECTION_CACHE_MAX_TEXT_LENGTH:
+            return _detect_cached(text)
+        return _detect(text)
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+# 言語設定 postback ペイロードのプレフィックスと圧縮辞書。エンコード側（言語設定サービス）と
+# デコード側（postback 復号）で共有するため、他モジュールに依存させないこと
+LANGUAGE_PAYLOAD_KEY = "langpref"
+# base64 のみ
+LANGUAGE_PAYLOAD_PLAIN_PREFIX = "langpref="
+# zlib 圧縮（旧形式。デコードのみ対応）
+LANGUAGE_PAYLOAD_ZLIB_PREFIX = "langpref2="
+# プリセット辞書付き zlib 圧縮
+LANGUAGE_PAYLOAD_ZDICT_PREFIX = "langpref3="
+
+# LANGUAGE_PAYLOAD_ZDICT_PREFIX で使う zlib のプリセット辞書。ペイロードに毎回現れるキーや定型文を先に与えておくと、
+# 数百バイトの短い JSON でも圧縮が効く。送信済み postback を復号できなくなるため内容は変更しないこと
+# （変更が必要な場合は新しいプレフィックスを追加する）。
+LANGUAGE_PAYLOAD_ZDICT = (
+    '{"kind":"language_confirm","action":"cancel","primary_language":"ja",'
+    '"cancel_text":"Language update has been cancelled. Please tell me all languages again.",'
+    '"limit_text":"You can set up to 5 translation languages. Please specify 5 or fewer.",'
+    '"completion_text":"English, Japanese, and Thai have been set as the translation languages.",'
+    '"kind":"language_confirm","action":"confirm","languages":[{"code":"en","name":"English"},'
+    '{"code":"ja","name":"日本語"},{"code":"zh","name":"中文"},{"code":"th","name":"ไทย"},'
+    '{"code":"ko","name":"한국어"}],"primary_language":"'
+).encode("utf-8")
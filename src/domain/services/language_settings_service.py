@@ -1,12 +1,91 @@
 from __future__ import annotations
 
+import base64
+import json
+import zlib
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, List, Sequence, Tuple
 
 from .. import models
 from ..ports import LanguagePreferencePort, MessageRepositoryPort
+from .bounded_cache import TEMPLATE_TRANSLATION_CACHE_SIZE, BoundedLRUCache
 from .interface_translation_service import InterfaceTranslationService
+from .language_codes import is_english_language_code
+from .language_payload import (
+    LANGUAGE_PAYLOAD_PLAIN_PREFIX,
+    LANGUAGE_PAYLOAD_ZDICT,
+    LANGUAGE_PAYLOAD_ZDICT_PREFIX,
+)
 from ...presentation.reply_formatter import RTL_LANG_PREFIXES, _wrap_bidi_isolate, strip_source_echo
 
+def _encode_language_payload(data: Dict, max_bytes: int) -> str:
+    # 非 ASCII をエスケープしない方が UTF-8 で短くなる（CJK は 6 バイト -> 3 バイト）
+    raw = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return _encode_language_raw(raw, max_bytes)
+
+
+@lru_cache(maxsize=256)
+def _encode_language_raw(raw: bytes, max_bytes: int) -> str:
+    # 同じ言語・同じ文言の確認ボタンは繰り返し作られるため、圧縮結果をバイト列単位で使い回す。
+    # base64 の出力は ASCII のみなので、文字数がそのままバイト数になる
+    plain_length = len(LANGUAGE_PAYLOAD_PLAIN_PREFIX) + _b64_unpadded_length(len(raw))
+    if plain_length <= max_bytes:
+        # 上限に収まるなら圧縮しない（小さいペイロードは zlib でかえって長くなる）
+        return LANGUAGE_PAYLOAD_PLAIN_PREFIX + base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+    compressor = zlib.compressobj(level=9, zdict=LANGUAGE_PAYLOAD_ZDICT)
+    blob = compressor.compress(raw) + compressor.flush()
+    if len(LANGUAGE_PAYLOAD_ZDICT_PREFIX) + _b64_unpadded_length(len(blob)) < plain_length:
+        return LANGUAGE_PAYLOAD_ZDICT_PREFIX + base64.urlsafe_b64encode(blob).rstrip(b"=").decode("ascii")
+    # 圧縮しても短くならない場合だけ非圧縮版を組み立てる
+    return LANGUAGE_PAYLOAD_PLAIN_PREFIX + base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _b64_unpadded_length(size: int) -> int:
+    """size バイトを base64 化して末尾の "=" を除いた文字数。"""
+    return (size * 4 + 2) // 3
+
+
+_MIN_OPTIONAL_TEXT_LENGTH = 32
+
+
+def encode_language_postback_payload(payload: Dict, max_bytes: int = 280) -> str:
+    """Encode payload for LINE postback with size guard (LINE上限≈300 bytes)."""
+    encoded = _encode_language_payload(payload, max_bytes)
+    if len(encoded) <= max_bytes:
+        return encoded
+
+    # 任意テキストを順に、収まる最大の長さまで二分探索で切り詰める（短くしても収まらなければキーごと落とす）
+    optional_keys = ("limit_text", "cancel_text", "completion_text")
+    for key in optional_keys:
+        text = payload.get(key)
+        if not text:
+            payload.pop(key, None)
+            continue
+        shortest = min(_MIN_OPTIONAL_TEXT_LENGTH, len(text))
+        payload[key] = text[:shortest]
+        best = _encode_language_payload(payload, max_bytes)
+        if len(best) > max_bytes:
+            payload.pop(key, None)
+            encoded = _encode_language_payload(payload, max_bytes)
+            if len(encoded) <= max_bytes:
+                return encoded
+            continue
+        low, high = shortest + 1, len(text) - 1
+        while low <= high:
+            mid = (low + high) // 2
+            payload[key] = text[:mid]
+            candidate = _encode_language_payload(payload, max_bytes)
+            if len(candidate) <= max_bytes:
+                best = candidate
+                low = mid + 1
+            else:
+                high = mid - 1
+        return best
+
+    encoded = _encode_language_payload(payload, max_bytes)
+    return encoded[:max_bytes]
+
 
 class LanguageSettingsService:
     """言語設定フロー（解析→確認→保存）を担当するサービス。"""
@@ -22,6 +101,10 @@ class LanguageSettingsService:
         self._pref = preference_analyzer
         self._interface_translation = interface_translation
         self._max_group_languages = max_group_languages
+        # 同じ言語・同じ文言の組み合わせは繰り返し現れるため、翻訳結果を LRU で使い回す
+        self._template_cache: BoundedLRUCache[Tuple[str, str, bool], List[str]] = BoundedLRUCache(
+            TEMPLATE_TRANSLATION_CACHE_SIZE
+        )
 
     def propose(self, event: models.MessageEvent, *, max_languages: int | None = None) -> models.ReplyBundle | None:
         limit = self._resolved_limit(max_languages)
@@ -59,7 +142,7 @@ class LanguageSettingsService:
                 return models.ReplyBundle(messages=messages)
             return None
 
-        prompt_texts = self._prepare_language_prompt_texts(limited_supported, result)
+        prompt_texts = self._prepare_language_prompt_texts(limited_supported, result, max_languages=limit)
         confirm_payload = self._encode_postback_payload(
             {
                 "kind": "language_confirm",
@@ -67,7 +150,7 @@ class LanguageSettingsService:
                 "languages": [{"code": lang.code, "name": lang.name} for lang in limited_supported],
                 "primary_language": prompt_texts["primary_language"],
                 "completion_text": prompt_texts["completion_text"],
-                "limit_text": self._build_language_limit_message(result.primary_language, max_languages=limit),
+                "limit_text": prompt_texts["limit_text"],
             }
         )
         cancel_payload = self._encode_postback_payload(
@@ -155,20 +238,26 @@ class LanguageSettingsService:
     def _format_unsupported_message(
         self, unsupported: Sequence[models.LanguageChoice], instruction_lang: str
     ) -> str:
-        names = [lang.name or lang.code for lang in unsupported if lang.code]
-        filtered = [name for name in names if name]
-        base = "The following languages are not supported: " + ", ".join(filtered)
+        # code があれば name or code は必ず真なので、空要素の除外は code の判定だけで足りる
+        base = "The following languages are not supported: " + ", ".join(
+            lang.name or lang.code for lang in unsupported if lang.code
+        )
+        if not instruction_lang or is_english_language_code(instruction_lang):
+            return base
         translated = self._translate_template(base, instruction_lang, force=True)
         return translated or base
 
     def _build_language_limit_message(self, instruction_lang: str, *, max_languages: int | None = None) -> str:
-        limit = self._resolved_limit(max_languages)
-        base = f"You can set up to {limit} translation languages. Please specify {limit} or fewer."
-        if not instruction_lang or instruction_lang.lower().startswith("en"):
+        base = self._build_language_limit_base(max_languages)
+        if not instruction_lang or is_english_language_code(instruction_lang):
             return base
         translated = self._translate_template(base, instruction_lang, force=True)
         return translated or base
 
+    def _build_language_limit_base(self, max_languages: int | None) -> str:
+        limit = self._resolved_limit(max_languages)
+        return f"You can set up to {limit} translation languages. Please specify {limit} or fewer."
+
     def _resolved_limit(self, max_languages: int | None) -> int:
         if max_languages is None:
             return self._max_group_languages
@@ -176,25 +265,31 @@ class LanguageSettingsService:
             return 1
         return max_languages
 
-    def _prepare_language_prompt_texts(self, supported, preference: models.LanguagePreference) -> Dict[str, str]:
+    def _prepare_language_prompt_texts(
+        self,
+        supported,
+        preference: models.LanguagePreference,
+        *,
+        max_languages: int | None = None,
+    ) -> Dict[str, str]:
         primary_lang = (preference.primary_language or "").lower()
 
         base_confirm = self._build_simple_confirm_text(supported)
         base_cancel = self._build_cancel_message()
         base_confirm_label = preference.confirm_label or "OK"
         base_cancel_label = preference.cancel_label or "Cancel"
+        # 確認ボタンの postback に埋め込む上限超過文言も同じ翻訳リクエストにまとめる
+        base_limit = self._build_language_limit_base(max_languages)
+        originals = [base_confirm, base_cancel, base_confirm_label, base_cancel_label, base_limit]
 
-        translated = self._translate_template(
-            [base_confirm, base_cancel, base_confirm_label, base_cancel_label],
-            primary_lang,
-            force=True,
-        )
+        translated = self._translate_template(originals, primary_lang, force=True)
         (
             translated_confirm,
             translated_cancel,
             translated_confirm_label,
             translated_cancel_label,
-        ) = translated if isinstance(translated, list) else [base_confirm, base_cancel, base_confirm_label, base_cancel_label]
+            translated_limit,
+        ) = translated if isinstance(translated, list) else originals
 
         confirm_text = self._normalize_template_text(translated_confirm or base_confirm)
         confirm_text = self._truncate(confirm_text or base_confirm, 240)
@@ -206,6 +301,9 @@ class LanguageSettingsService:
         cancel_text = self._normalize_template_text(translated_cancel or base_cancel)
         cancel_text = self._truncate(cancel_text or base_cancel, 240)
 
+        # 英語（または未判定）のときは従来どおり上限文言を翻訳せずに使う
+        limit_text = base_limit if not primary_lang or is_english_language_code(primary_lang) else (translated_limit or base_limit)
+
         return {
             "confirm_text": confirm_text,
             "confirm_label": translated_confirm_label or base_confirm_label,
@@ -213,6 +311,7 @@ class LanguageSettingsService:
             "completion_text": completion_text,
             "cancel_text": cancel_text,
             "primary_language": primary_lang,
+            "limit_text": limit_text,
         }
 
     def _translate_template(
@@ -232,41 +331,53 @@ class LanguageSettingsService:
         if not instruction_lang:
             return base_text
 
-        lowered = instruction_lang.lower()
-        if lowered.startswith("en") and not force:
+        # 英語（ベース言語）はそのまま返す。判定は先頭 2 文字だけで行い、小文字化はキャッシュキー用に後で 1 回だけ
+        if not force and is_english_language_code(instruction_lang):
             return base_text
+        lowered = instruction_lang.lower()
 
         if not originals:
             return base_text
 
+        # 同じ文言が複数含まれる場合（ボタンラベル等）は一度だけ翻訳し、結果を元の位置へ戻す
+        unique = list(dict.fromkeys(originals))
         delimiter = "\n---\n"
-        joined = delimiter.join(originals)
+        joined = delimiter.join(unique)
 
         if not self._interface_translation or getattr(self._interface_translation, "_translator", None) is None:
             return base_text
 
-        translations = self._interface_translation.translate(joined, [instruction_lang])
-        if not translations:
-            return base_text
+        cache_key = (joined, lowered, force)
+        normalized = self._template_cache.get(cache_key)
 
-        translated = strip_source_echo(joined, translations[0].text) or translations[0].text or joined
-        parts = translated.split(delimiter)
-        if len(parts) != len(originals):
-            return base_text
+        if normalized is None:
+            translations = self._interface_translation.translate(joined, [instruction_lang])
+            if not translations:
+                return base_text
+
+            translated = strip_source_echo(joined, translations[0].text) or translations[0].text or joined
+            parts = translated.split(delimiter)
+            if len(parts) != len(unique):
+                return base_text
 
-        normalized = [self._normalize_template_text(part or orig) for part, orig in zip(parts, originals)]
-        if is_sequence:
-            return normalized
-        return normalized[0]
+            normalized = [self._normalize_template_text(part or orig) for part, orig in zip(parts, unique)]
+            self._template_cache.put(cache_key, normalized)
+
+        if not is_sequence:
+            return normalized[0]
+        if len(unique) == len(originals):
+            return list(normalized)
+        translated_by_original = dict(zip(unique, normalized))
+        return [translated_by_original[text] for text in originals]
 
     def _build_multilingual_completion_message(self, base_text: str, languages: Sequence[Tuple[str, str]]) -> str:
         deduped = [code.lower() for code, _ in languages if code]
         deduped = [lang for idx, lang in enumerate(deduped) if lang and lang not in deduped[:idx]]
 
         # 英語が設定に含まれる場合のみ英語行を出す
-        include_en = any(lang.startswith("en") for lang in deduped)
+        include_en = any(is_english_language_code(lang) for lang in deduped)
 
-        target_langs = [lang for lang in deduped if not lang.startswith("en")]
+        target_langs = [lang for lang in deduped if not is_english_language_code(lang)]
         if not self._interface_translation or not target_langs:
             return base_text if include_en else "\n\n".join([base_text.strip()] if include_en else [])
 
@@ -305,51 +416,12 @@ class LanguageSettingsService:
                 seen_texts.add(cleaned)
         return "\n\n".join(lines)
 
-    @staticmethod
-    def _encode_postback_payload(payload: Dict, max_bytes: int = 280) -> str:
-        import base64
-        import json
-        import zlib
-
-        def _encode(data: Dict) -> str:
-            raw = json.dumps(data, separators=(",", ":")).encode("utf-8")
-            compressed = base64.urlsafe_b64encode(zlib.compress(raw)).decode("ascii").rstrip("=")
-            return f"langpref2={compressed}"
-
-        encoded = _encode(payload)
-        if len(encoded.encode("utf-8")) <= max_bytes:
-            return encoded
-
-        def _shrink_text(key: str, factor: float = 0.6) -> bool:
-            if key in payload and payload[key]:
-                text = payload[key]
-                new_len = max(int(len(text) * factor), 32)
-                payload[key] = text[:new_len]
-                return True
-            return False
-
-        optional_keys = ("limit_text", "cancel_text", "completion_text")
-        for key in optional_keys:
-            for _ in range(3):
-                changed = _shrink_text(key)
-                encoded = _encode(payload)
-                if len(encoded.encode("utf-8")) <= max_bytes:
-                    return encoded
-                if not changed:
-                    break
-            if key in payload:
-                payload.pop(key, None)
-                encoded = _encode(payload)
-                if len(encoded.encode("utf-8")) <= max_bytes:
-                    return encoded
-
-        encoded = _encode(payload)
-        return encoded[:max_bytes]
+    _encode_postback_payload = staticmethod(encode_language_postback_payload)
 
     @staticmethod
     def _build_simple_confirm_text(limited_supported) -> str:
-        names = [lang.name or lang.code for lang in limited_supported if lang.code]
-        filtered = [name for name in names if name]
+        # code があれば name or code は必ず空でないため、1 回の内包表記で足りる
+        filtered = [lang.name or lang.code for lang in limited_supported if lang.code]
         if not filtered:
             return "Do you want to enable translation?"
         if len(filtered) == 1:
@@ -357,7 +429,7 @@ class LanguageSettingsService:
         elif len(filtered) == 2:
             joined = " and ".join(filtered)
         else:
-            joined = ", ".join(filtered[:-1]) + ", and " + filtered[-1]
+            joined = ", ".join(islice(filtered, len(filtered) - 1)) + ", and " + filtered[-1]
         return f"Do you want to enable translation for {joined}?"
 
     @staticmethod
@@ -1,17 +1,59 @@
 from __future__ import annotations
 
+import random
 import time
-from typing import Callable, TypeVar
+from dataclasses import dataclass
+from typing import Callable, Mapping, Optional, Tuple, TypeVar
 
 T = TypeVar("T")
 
+DEFAULT_BACKOFF_BASE_SECONDS = 0.5
+DEFAULT_BACKOFF_CAP_SECONDS = 8.0
+# 1 回の呼び出しで再試行の待機に使ってよい合計秒数（返信トークンの期限と Lambda のタイムアウトを守る）
+DEFAULT_RETRY_SLEEP_BUDGET_SECONDS = 8.0
+
+
+def backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """指数バックオフ + フルジッターの待機秒数（attempt は 0 始まり）。"""
+    ceiling = min(cap, base * (2**attempt))
+    if ceiling <= 0:
+        return 0.0
+    return random.uniform(0, ceiling)
+
+
+@dataclass(frozen=True)
+class RetryRule:
+    """例外種別ごとの試行回数と待機秒数の上下限。"""
+
+    max_attempts: int
+    base_delay: float
+    cap_delay: float
+
+
+def resolve_retry_rule(
+    exc: BaseException,
+    policy: Mapping[type, RetryRule],
+) -> Tuple[Optional[type], Optional[RetryRule]]:
+    """例外の MRO を先頭からたどり、最も具体的に一致するルールを返す。"""
+    for klass in type(exc).__mro__:
+        rule = policy.get(klass)
+        if rule is not None:
+            return klass, rule
+    return None, None
+
 
 class RetryPolicy:
     """シンプルなリトライポリシー。エラーを呼び出し側に再送出する。"""
 
-    def __init__(self, retries: int, backoff_base: float = 0.5) -> None:
+    def __init__(
+        self,
+        retries: int,
+        backoff_base: float = DEFAULT_BACKOFF_BASE_SECONDS,
+        backoff_cap: float = DEFAULT_BACKOFF_CAP_SECONDS,
+    ) -> None:
         self._retries = max(1, retries)
         self._backoff = max(0.0, backoff_base)
+        self._backoff_cap = max(0.0, backoff_cap)
 
     def run(self, func: Callable[[], T]) -> T:
         last_error: Exception | None = None
@@ -20,9 +62,10 @@ class RetryPolicy:
                 return func()
             except Exception as exc:  # pylint: disable=broad-except
                 last_error = exc
-                sleep = self._backoff * (attempt + 1)
-                if attempt < self._retries - 1 and sleep:
-                    time.sleep(sleep)
+                if attempt < self._retries - 1:
+                    sleep = backoff_delay(attempt, self._backoff, self._backoff_cap)
+                    if sleep:
+                        time.sleep(sleep)
         if last_error:
             raise last_error
         raise RuntimeError("RetryPolicy failed without capturing an exception")
@@ -2,15 +2,22 @@ from __future__ import annotations
 
 import importlib
 import logging
+import threading
 from datetime import datetime, timedelta, timezone
 from urllib.parse import quote_plus
 from typing import Optional
 
 from ..ports import MessageRepositoryPort
+from .bounded_cache import BoundedLRUCache
 from ...infra.signed_token import issue_token
 
 logger = logging.getLogger(__name__)
 
+# Stripe Checkout セッション URL の再利用期間（セッション自体の有効期限 24h より十分短くする）
+CHECKOUT_URL_CACHE_TTL_SECONDS = 600.0
+# Checkout セッション URL を保持するグループ数の上限
+CHECKOUT_URL_CACHE_MAX_GROUPS = 1024
+
 
 class SubscriptionService:
     """Stripe 連携と DB 同期を担うサブスク管理サービス。"""
@@ -32,13 +39,21 @@ class SubscriptionService:
         # API Gateway 側のベース URL (/checkout リダイレクトを提供)
         self._checkout_api_base_url = checkout_api_base_url.rstrip("/") if checkout_api_base_url else ""
         self._subscription_token_secret = subscription_token_secret or ""
+        # group_id -> URL。同一グループへの案内で Stripe を何度も呼ばない
+        self._checkout_url_cache: BoundedLRUCache[str, str] = BoundedLRUCache(
+            CHECKOUT_URL_CACHE_MAX_GROUPS,
+            ttl_seconds=CHECKOUT_URL_CACHE_TTL_SECONDS,
+        )
+        self._checkout_url_lock = threading.Lock()
+        self._stripe_module = None
+        self._stripe_unavailable = False
 
     def create_checkout_url(self, group_id: str) -> Optional[str]:
         token_url = self._build_plan_url(group_id, scope="checkout")
         if token_url:
             return token_url
         # 後方互換: 旧設定では session_id 導線を返す
-        return self._create_legacy_checkout_url(group_id)
+        return self._create_legacy_checkout_url_cached(group_id)
 
     def create_support_contact_url(self, group_id: str) -> Optional[str]:
         return self._build_plan_url(group_id, scope="support", page_path="/contact.html")
@@ -60,6 +75,24 @@ class SubscriptionService:
         )
         return f"{self._subscription_frontend_base_url}{page_path}?st={quote_plus(token)}"
 
+    def invalidate_checkout_url(self, group_id: str) -> None:
+        """契約済みになったグループの Checkout URL を破棄する（完了済みセッションを案内しない）。"""
+        self._checkout_url_cache.pop(group_id)
+
+    def _create_legacy_checkout_url_cached(self, group_id: str) -> Optional[str]:
+        """Checkout セッション URL を TTL 付きで再利用する。同時要求は 1 回の作成にまとめる。"""
+        cached = self._checkout_url_cache.get(group_id)
+        if cached:
+            return cached
+        with self._checkout_url_lock:
+            cached = self._checkout_url_cache.get(group_id)
+            if cached:
+                return cached
+            url = self._create_legacy_checkout_url(group_id)
+            if url:
+                self._checkout_url_cache.put(group_id, url)
+            return url
+
     def _create_legacy_checkout_url(self, group_id: str) -> Optional[str]:
         stripe = self._load_stripe()
         if not stripe:
@@ -217,10 +250,15 @@ class SubscriptionService:
             return f"Plan: Free (status: {status})"
         return "Plan: Free (no subscription)"
 
-    @staticmethod
-    def _load_stripe():
-        try:
-            return importlib.import_module("stripe")
-        except ModuleNotFoundError:
-            logger.warning("stripe SDK not available")
+    def _load_stripe(self):
+        # 読み込み結果（未インストールの場合も含む）はインスタンスに保持し、以降は再試行しない
+        if self._stripe_unavailable:
             return None
+        if self._stripe_module is None:
+            try:
+                self._stripe_module = importlib.import_module("stripe")
+            except ModuleNotFoundError:
+                logger.warning("stripe SDK not available")
+                self._stripe_unavailable = True
+                return None
+        return self._stripe_module
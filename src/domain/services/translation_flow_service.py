@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from concurrent.futures import Future
 from dataclasses import dataclass
 import logging
 from datetime import datetime, timezone
-from typing import List, Sequence
+from typing import Callable, List, Sequence
 
 import requests
 
@@ -59,8 +60,14 @@ class TranslationFlowService:
         period_end: datetime | None,
         quota_anchor_day: int | None = None,
         paid: bool | None = None,
+        context_future: Future[List[models.ContextMessage]] | None = None,
+        on_allowed: Callable[[], None] | None = None,
     ) -> TranslationFlowResult:
-        """クオータ判定→翻訳実行→返信文生成までを一括で行う。"""
+        """クオータ判定→翻訳実行→返信文生成までを一括で行う。
+
+        context_future を渡した場合は、クオータ判定と並行して先読みした直近メッセージを使う。
+        on_allowed は翻訳が許可された直後（翻訳 API 呼び出しの前）に呼ぶ。
+        """
 
         if stop_translation_on_limit is None:
             if paid is not None:
@@ -81,13 +88,21 @@ class TranslationFlowService:
         )
 
         if not decision.allowed:
+            if context_future is not None:
+                context_future.cancel()
             return TranslationFlowResult(decision=decision, reply_text=None)
 
+        if on_allowed is not None:
+            on_allowed()
+
         increment = 1
         group_id = event.group_id or ""
 
-        context_messages = self._repo.fetch_recent_messages(event.group_id, self._max_context)
-        timestamp = datetime.fromtimestamp(event.timestamp / 1000, tz=timezone.utc)
+        if context_future is not None:
+            context_messages = context_future.result()
+        else:
+            context_messages = self.fetch_context_messages(event.group_id)
+        timestamp = event.occurred_at or datetime.now(timezone.utc)
         try:
             translations = self._invoke_translation_with_retry(
                 sender_name=sender_name,
@@ -117,6 +132,10 @@ class TranslationFlowService:
         reply_text = build_translation_reply(event.text, translations)
         return TranslationFlowResult(decision=decision, reply_text=reply_text)
 
+    def fetch_context_messages(self, group_id: str | None) -> List[models.ContextMessage]:
+        """翻訳の文脈に使う直近メッセージを取得する（呼び出し側で先読みできるよう公開）。"""
+        return self._repo.fetch_recent_messages(group_id, self._max_context)
+
     def _rollback_usage(self, *, group_id: str, period_key: str, increment: int) -> None:
         """失敗時にクオータを元に戻すヘルパー。"""
 
@@ -55,11 +55,18 @@ class _ContextMessage:
 class GeminiTranslationAdapter(TranslationPort):
     """Gemini への I/O を担当するインフラ層のアダプタ。"""
 
-    def __init__(self, api_key: str, model: str, timeout_seconds: int = 10) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        timeout_seconds: int = 10,
+        session: requests.Session | None = None,
+    ) -> None:
         self._api_key = api_key
         self._model = model
         self._timeout = timeout_seconds
-        self._session = requests.Session()
+        # 同じ Gemini エンドポイントを叩くアダプタ間でセッション（keep-alive 接続）を共有できるようにする
+        self._session = session or requests.Session()
 
     def translate(self, request: TranslationRequest) -> List[TranslationResult]:
         if not request.candidate_languages:
@@ -78,12 +85,13 @@ class GeminiTranslationAdapter(TranslationPort):
         payload = self._build_payload(source, context, list(request.candidate_languages))
         url = f"https://generativelanguage.googleapis.com/v1beta/models/{self._model}:generateContent"
 
-        logger.debug(
-            "Gemini request prepared | model=%s targets=%s context_count=%s",
-            self._model,
-            list(request.candidate_languages),
-            len(context),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Gemini request prepared | model=%s targets=%s context_count=%s",
+                self._model,
+                list(request.candidate_languages),
+                len(context),
+            )
 
         response = self._session.post(
             url,
@@ -114,12 +122,13 @@ class GeminiTranslationAdapter(TranslationPort):
             for item in translations
             if item.get("lang") and item.get("text") and item["lang"].lower() in allowed
         ]
-        logger.info(
-            "Gemini translations parsed | model=%s count=%s langs=%s",
-            self._model,
-            len(results),
-            [item.lang for item in results],
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Gemini translations parsed | model=%s count=%s langs=%s",
+                self._model,
+                len(results),
+                [item.lang for item in results],
+            )
         return results
 
     def _build_payload(
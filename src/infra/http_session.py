@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def build_shared_session(pool_maxsize: int) -> requests.Session:
+    """複数スレッドから同時に使う requests.Session を作る。
+
+    Cookie・認証ヘッダなどのセッション状態に依存しないステートレスな POST 専用とする。
+    接続プールを同時に使うスレッド数以上にしておき、プールが溢れて接続を作り捨てないようにする。
+    """
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_maxsize=max(1, pool_maxsize)))
+    return session
@@ -60,11 +60,18 @@ LANGUAGE_PREF_SCHEMA = {
 class LanguagePreferenceAdapter(LanguagePreferencePort):
     """Gemini を使った言語設定推定クライアント。"""
 
-    def __init__(self, api_key: str, model: str, timeout_seconds: int = 10) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        timeout_seconds: int = 10,
+        session: requests.Session | None = None,
+    ) -> None:
         self._api_key = api_key
         self._model = model
         self._timeout = timeout_seconds
-        self._session = requests.Session()
+        # 同じ Gemini エンドポイントを叩くアダプタ間でセッション（keep-alive 接続）を共有できるようにする
+        self._session = session or requests.Session()
 
     def analyze(self, text: str) -> LanguagePreference | None:
         if not text or not text.strip():
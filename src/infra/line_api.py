@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Sequence
 
 import requests
 
@@ -10,11 +11,26 @@ from ..domain.ports import LinePort
 
 logger = logging.getLogger(__name__)
 
+# LINE のテキストメッセージ 1 件あたりの最大文字数
+TEXT_MESSAGE_MAX_LENGTH = 5000
+
+# プロフィール一括取得時の同時リクエスト数上限
+PROFILE_FETCH_MAX_WORKERS = 8
+
 
 class LineApiError(RuntimeError):
     pass
 
 
+def _encode_json(payload) -> bytes:
+    """送信ボディを UTF-8 の JSON バイト列にする。
+
+    requests の json= は非 ASCII を \\uXXXX にエスケープするため、
+    多言語テキストではボディが約 2 倍に膨らむ。
+    """
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
 class LineApiAdapter(LinePort):
     BASE_URL = "https://api.line.me"
 
@@ -28,16 +44,18 @@ class LineApiAdapter(LinePort):
         )
 
     def reply_text(self, reply_token: str, text: str) -> None:
-        self.reply_messages(reply_token, [{"type": "text", "text": text[:5000]}])
+        # 文字数の切り詰めは _sanitize_message に一本化する
+        self.reply_messages(reply_token, [{"type": "text", "text": text}])
 
     def reply_messages(self, reply_token: str, messages):  # type: ignore[override]
         url = f"{self.BASE_URL}/v2/bot/message/reply"
         sanitized = [self._sanitize_message(msg) for msg in messages[:5]]
         payload = {"replyToken": reply_token, "messages": sanitized}
-        response = self._session.post(url, json=payload, timeout=5)
+        body = _encode_json(payload)
+        response = self._session.post(url, data=body, timeout=5)
         if not response.ok:
             body_excerpt = (response.text or "")[:500]
-            payload_excerpt = json.dumps(payload, ensure_ascii=False)[:500]
+            payload_excerpt = body.decode("utf-8")[:500]
             logger.error(
                 "LINE reply failed: status=%s body=%s payload=%s types=%s count=%s",
                 response.status_code,
@@ -50,8 +68,8 @@ class LineApiAdapter(LinePort):
 
     def push_text(self, to: str, text: str) -> None:
         url = f"{self.BASE_URL}/v2/bot/message/push"
-        payload = {"to": to, "messages": [{"type": "text", "text": (text or '')[:5000]}]}
-        response = self._session.post(url, json=payload, timeout=5)
+        payload = {"to": to, "messages": [{"type": "text", "text": (text or '')[:TEXT_MESSAGE_MAX_LENGTH]}]}
+        response = self._session.post(url, data=_encode_json(payload), timeout=5)
         if not response.ok:
             logger.warning(
                 "LINE push failed",
@@ -82,6 +100,29 @@ class LineApiAdapter(LinePort):
         data = response.json()
         return data.get("displayName")
 
+    def get_display_names(
+        self,
+        source_type: str,
+        container_id: Optional[str],
+        user_ids: Sequence[str],
+    ) -> Dict[str, str]:
+        """複数ユーザーの表示名を並列に取得する。取得できなかったユーザーは含めない。"""
+        unique_ids = [user_id for user_id in dict.fromkeys(user_ids) if user_id]
+        if not unique_ids:
+            return {}
+        if len(unique_ids) == 1:
+            names = [self.get_display_name(source_type, container_id, unique_ids[0])]
+        else:
+            workers = min(PROFILE_FETCH_MAX_WORKERS, len(unique_ids))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                names = list(
+                    executor.map(
+                        lambda user_id: self.get_display_name(source_type, container_id, user_id),
+                        unique_ids,
+                    )
+                )
+        return {user_id: name for user_id, name in zip(unique_ids, names) if name}
+
     def get_group_name(self, group_id: str) -> Optional[str]:
         """LINE グループサマリからグループ名を取得する。"""
         url = f"{self.BASE_URL}/v2/bot/group/{group_id}/summary"
@@ -103,6 +144,8 @@ class LineApiAdapter(LinePort):
 
     @staticmethod
     def _sanitize_message(message):
-        if message.get("type") == "text" and message.get("text"):
-            message = {**message, "text": message["text"][:5000]}
+        # 上限内のメッセージ（大半のケース）はコピーせずそのまま返す
+        text = message.get("text")
+        if message.get("type") == "text" and text and len(text) > TEXT_MESSAGE_MAX_LENGTH:
+            message = {**message, "text": text[:TEXT_MESSAGE_MAX_LENGTH]}
         return message
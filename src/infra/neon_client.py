@@ -3,18 +3,29 @@ from __future__ import annotations
 import logging
 from contextlib import contextmanager
 from typing import Generator, Optional
+from urllib.parse import urlparse
 
 from psycopg_pool import ConnectionPool
 
 logger = logging.getLogger(__name__)
 
 
+def is_pooled_endpoint(dsn: str) -> bool:
+    """Neon の pooled (PgBouncer) エンドポイントかどうかをホスト名の `-pooler` で判定する。"""
+    host = urlparse(dsn).hostname or ""
+    return "-pooler" in host
+
+
 class NeonClient:
     """psycopg ConnectionPool の薄いラッパー（既存実装をそのまま転写）。"""
 
     def __init__(self, dsn: str, min_size: int = 1, max_size: int = 4) -> None:
-        self._pool = ConnectionPool(conninfo=dsn, min_size=min_size, max_size=max_size)
-        logger.debug("Initialized Neon connection pool")
+        kwargs = {}
+        if is_pooled_endpoint(dsn):
+            # PgBouncer (transaction mode) はサーバー側 prepared statement を共有できないため無効化する
+            kwargs["prepare_threshold"] = None
+        self._pool = ConnectionPool(conninfo=dsn, min_size=min_size, max_size=max_size, kwargs=kwargs)
+        logger.debug("Initialized Neon connection pool", extra={"pooled": bool(kwargs)})
 
     @contextmanager
     def connection(self):  # type: ignore[override]
@@ -66,6 +66,37 @@ class NeonMessageRepository(MessageRepositoryPort):
                     (group_id, user_id),
                 )
 
+    def ensure_group_members(self, group_id: str, user_ids: Sequence[str]) -> None:
+        """複数メンバーの登録/再有効化を 1 ステートメントで行う。"""
+        unique_ids = [user_id for user_id in dict.fromkeys(user_ids) if user_id]
+        if not group_id or not unique_ids:
+            return
+        with self._client.cursor() as cur:
+            try:
+                cur.execute(
+                    """
+                    INSERT INTO group_members (group_id, user_id, display_name, display_name_updated_at, active, left_at)
+                    SELECT %s, member.user_id, NULL, NULL, TRUE, NULL
+                    FROM unnest(%s::text[]) AS member(user_id)
+                    ON CONFLICT (group_id, user_id)
+                    DO UPDATE SET
+                        active = TRUE,
+                        left_at = NULL
+                    """,
+                    (group_id, unique_ids),
+                )
+            except errors.UndefinedColumn:
+                cur.execute(
+                    """
+                    INSERT INTO group_members (group_id, user_id, display_name, display_name_updated_at)
+                    SELECT %s, member.user_id, NULL, NULL
+                    FROM unnest(%s::text[]) AS member(user_id)
+                    ON CONFLICT (group_id, user_id)
+                    DO NOTHING
+                    """,
+                    (group_id, unique_ids),
+                )
+
     def mark_group_member_left(self, group_id: str, user_id: str, left_at: Optional[datetime] = None) -> None:
         if not group_id or not user_id:
             return
@@ -427,33 +458,41 @@ class NeonMessageRepository(MessageRepositoryPort):
         if not languages:
             return
         existing = self.fetch_group_languages(group_id)
-        remaining = max(self._max_group_languages - len(existing), 0)
-        normalized = self._normalize_languages(languages, existing)
-        limited = normalized[:remaining]
-        if not limited:
-            logger.info(
-                "Language add skipped due to limit",
-                extra={"group_id": group_id, "requested": [code for code, _ in languages]},
-            )
-            return
         with self._client.cursor() as cur:
-            cur.executemany(
-                """
-                INSERT INTO group_languages (group_id, lang_code, lang_name)
-                VALUES (%s, %s, %s)
-                ON CONFLICT (group_id, lang_code) DO UPDATE SET lang_name = EXCLUDED.lang_name
-                """,
-                [(group_id, code, name) for code, name in limited],
-            )
+            self._insert_languages_within_limit(cur, group_id, languages, existing)
 
     def remove_group_languages(self, group_id: str, lang_codes: Sequence[str]) -> None:
         if not lang_codes:
             return
         with self._client.cursor() as cur:
-            cur.execute(
-                "DELETE FROM group_languages WHERE group_id = %s AND lang_code = ANY(%s)",
-                (group_id, list({code.lower() for code in lang_codes})),
-            )
+            self._delete_languages(cur, group_id, list({code.lower() for code in lang_codes}))
+
+    def apply_group_language_update(
+        self,
+        group_id: str,
+        *,
+        add_languages: Sequence[Tuple[str, str]],
+        remove_codes: Sequence[str],
+        translation_enabled: bool,
+    ) -> None:
+        """言語の削除・追加と translation_enabled の更新を 1 トランザクションでまとめて行う。"""
+        remove_list = list({code.lower() for code in remove_codes if code})
+        try:
+            with self._client.connection() as conn:
+                with conn.cursor() as cur:
+                    if remove_list:
+                        self._delete_languages(cur, group_id, remove_list)
+                    if add_languages:
+                        cur.execute("SELECT lang_code FROM group_languages WHERE group_id = %s", (group_id,))
+                        existing = [row[0] for row in cur.fetchall()]
+                        self._insert_languages_within_limit(cur, group_id, add_languages, existing)
+                    self._upsert_translation_enabled(cur, group_id, translation_enabled)
+        except errors.UndefinedTable:
+            # 後方互換: group_settings 未作成の環境では個別更新にフォールバック（上のトランザクションはロールバック済み）
+            logger.warning("Fused language update unavailable; falling back", extra={"group_id": group_id})
+            self.remove_group_languages(group_id, remove_list)
+            self.add_group_languages(group_id, add_languages)
+            self.set_translation_enabled(group_id, translation_enabled)
 
     def shrink_group_languages(self, group_id: str, keep_limit: int) -> List[str]:
         """古い登録順で言語を絞り込む。削除した言語コードを返す。"""
@@ -476,24 +515,13 @@ class NeonMessageRepository(MessageRepositoryPort):
                     return []
 
                 remove_codes = all_codes[keep_limit:]
-                cur.execute(
-                    "DELETE FROM group_languages WHERE group_id = %s AND lang_code = ANY(%s)",
-                    (group_id, remove_codes),
-                )
+                self._delete_languages(cur, group_id, remove_codes)
                 return remove_codes
 
     def set_translation_enabled(self, group_id: str, enabled: bool) -> None:
         try:
             with self._client.cursor() as cur:
-                cur.execute(
-                    """
-                    INSERT INTO group_settings (group_id, translation_enabled)
-                    VALUES (%s, %s)
-                    ON CONFLICT (group_id)
-                    DO UPDATE SET translation_enabled = EXCLUDED.translation_enabled, updated_at = NOW()
-                    """,
-                    (group_id, enabled),
-            )
+                self._upsert_translation_enabled(cur, group_id, enabled)
         except errors.UndefinedTable:
             # 後方互換: group_settings が未作成でも致命的エラーにしない
             logger.warning(
@@ -1435,6 +1463,50 @@ class NeonMessageRepository(MessageRepositoryPort):
             normalized.append((lowered, name))
         return normalized
 
+    def _insert_languages_within_limit(
+        self,
+        cur,
+        group_id: str,
+        languages: Sequence[Tuple[str, str]],
+        existing: Sequence[str],
+    ) -> None:
+        """既存言語を除いた上で、上限に収まる分だけ言語を登録する。"""
+        remaining = max(self._max_group_languages - len(existing), 0)
+        limited = self._normalize_languages(languages, existing)[:remaining]
+        if not limited:
+            logger.info(
+                "Language add skipped due to limit",
+                extra={"group_id": group_id, "requested": [code for code, _ in languages]},
+            )
+            return
+        cur.executemany(
+            """
+            INSERT INTO group_languages (group_id, lang_code, lang_name)
+            VALUES (%s, %s, %s)
+            ON CONFLICT (group_id, lang_code) DO UPDATE SET lang_name = EXCLUDED.lang_name
+            """,
+            [(group_id, code, name) for code, name in limited],
+        )
+
+    @staticmethod
+    def _delete_languages(cur, group_id: str, lang_codes: Sequence[str]) -> None:
+        cur.execute(
+            "DELETE FROM group_languages WHERE group_id = %s AND lang_code = ANY(%s)",
+            (group_id, list(lang_codes)),
+        )
+
+    @staticmethod
+    def _upsert_translation_enabled(cur, group_id: str, enabled: bool) -> None:
+        cur.execute(
+            """
+            INSERT INTO group_settings (group_id, translation_enabled)
+            VALUES (%s, %s)
+            ON CONFLICT (group_id)
+            DO UPDATE SET translation_enabled = EXCLUDED.translation_enabled, updated_at = NOW()
+            """,
+            (group_id, enabled),
+        )
+
     def record_bot_joined_at(self, group_id: str, joined_at: datetime) -> None:
         ts = joined_at
         if ts.tzinfo is None:
@@ -1450,6 +1522,60 @@ class NeonMessageRepository(MessageRepositoryPort):
         with self._client.cursor() as cur:
             cur.execute(query, (group_id, BOT_JOIN_MARKER, BOT_JOIN_MARKER, ts))
 
+    def initialize_group(self, group_id: str, joined_at: datetime, group_name: Optional[str] = None) -> None:
+        """ボット参加時の初期化（参加時刻記録・グループ名保存・言語設定リセット・翻訳停止）を 1 ステートメントで行う。"""
+        ts = joined_at
+        if ts.tzinfo is None:
+            ts = ts.replace(tzinfo=timezone.utc)
+        params = {
+            "group_id": group_id,
+            "bot_marker": BOT_JOIN_MARKER,
+            "joined_at": ts,
+            "group_name": group_name or None,
+        }
+        try:
+            with self._client.cursor() as cur:
+                # 同一ステートメント内で同じ行を二重更新できないため、ボット参加マーカー行のプロンプト状態は
+                # 参加時刻の upsert 側でリセットし、それ以外の行を reset_prompts でリセットする
+                # （従来の reset_group_language_settings と同じく全行がリセットされる）
+                cur.execute(
+                    """
+                    WITH bot_joined AS (
+                        INSERT INTO group_members (group_id, user_id, display_name, display_name_updated_at, joined_at)
+                        VALUES (%(group_id)s, %(bot_marker)s, %(bot_marker)s, NOW(), %(joined_at)s)
+                        ON CONFLICT (group_id, user_id)
+                        DO UPDATE SET
+                            joined_at = EXCLUDED.joined_at,
+                            last_prompted_at = NULL,
+                            last_completed_at = NULL
+                    ),
+                    cleared_languages AS (
+                        DELETE FROM group_languages WHERE group_id = %(group_id)s
+                    ),
+                    reset_prompts AS (
+                        UPDATE group_members
+                        SET last_prompted_at = NULL, last_completed_at = NULL
+                        WHERE group_id = %(group_id)s AND user_id <> %(bot_marker)s
+                    )
+                    INSERT INTO group_settings (group_id, translation_enabled, group_name, updated_at)
+                    VALUES (%(group_id)s, FALSE, %(group_name)s, NOW())
+                    ON CONFLICT (group_id)
+                    DO UPDATE SET
+                        translation_enabled = FALSE,
+                        group_name = COALESCE(EXCLUDED.group_name, group_settings.group_name),
+                        updated_at = NOW()
+                    """,
+                    params,
+                )
+        except (errors.UndefinedColumn, errors.UndefinedTable):
+            # 後方互換: group_settings 未整備の環境では従来の個別更新にフォールバック
+            logger.warning("Fused group initialization unavailable; falling back", extra={"group_id": group_id})
+            self.record_bot_joined_at(group_id, ts)
+            if group_name:
+                self.upsert_group_name(group_id, group_name)
+            self.reset_group_language_settings(group_id)
+            self.set_translation_enabled(group_id, False)
+
     def fetch_bot_joined_at(self, group_id: str) -> Optional[datetime]:
         with self._client.cursor() as cur:
             cur.execute(
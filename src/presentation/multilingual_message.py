@@ -4,19 +4,14 @@ import logging
 from typing import List, Sequence
 
 from ..domain.services.interface_translation_service import InterfaceTranslationService
-from .reply_formatter import strip_source_echo
+from ..domain.services.language_codes import is_english_language_code
+from .reply_formatter import join_within_limit, strip_source_echo
 
 
 def dedup_lang_codes(languages: Sequence[str]) -> List[str]:
-    seen = set()
-    deduped: List[str] = []
-    for code in languages:
-        lowered = (code or "").lower()
-        if not lowered or lowered in seen:
-            continue
-        seen.add(lowered)
-        deduped.append(lowered)
-    return deduped
+    # 小文字化は 1 コードにつき 1 回。dict.fromkeys で出現順を保ったまま重複を除く
+    lowered = ((code or "").lower() for code in languages)
+    return list(dict.fromkeys(code for code in lowered if code))
 
 
 def build_multilingual_message(
@@ -35,7 +30,7 @@ def build_multilingual_message(
     if not normalized_languages or not translator:
         return trimmed
 
-    target_langs = [lang for lang in normalized_languages if not lang.startswith("en")]
+    target_langs = [lang for lang in normalized_languages if not is_english_language_code(lang)]
     text_by_lang = {}
     if target_langs:
         try:
@@ -54,11 +49,12 @@ def build_multilingual_message(
 
     lines: List[str] = [trimmed]
     for lang in normalized_languages:
-        if lang.startswith("en"):
+        if is_english_language_code(lang):
             continue
         translated = text_by_lang.get(lang)
         if not translated or translated in lines:
             continue
         lines.append(translated)
 
-    return "\n\n".join(lines).strip()[:5000]
+    # 各行は strip 済みで先頭行も空でないため、連結後に strip し直す必要はない
+    return join_within_limit(lines)
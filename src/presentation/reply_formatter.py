@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import re
-from typing import List, Sequence
+from functools import lru_cache
+from typing import Iterable, List, Sequence
 
 from ..domain.models import TranslationResult
 
@@ -35,8 +36,7 @@ def strip_source_echo(source_text: str, translated_text: str) -> str:
         return ""
 
     # "<source> - <translation>" などのパターン
-    prefix_pattern = rf"^{re.escape(source)}\s*[-:：、，,。\u3000]*"
-    candidate = re.sub(prefix_pattern, "", candidate, flags=re.IGNORECASE)
+    candidate = _source_echo_prefix_re(source).sub("", candidate)
 
     # "(<translation>)" 形式
     if candidate.startswith(source):
@@ -45,6 +45,12 @@ def strip_source_echo(source_text: str, translated_text: str) -> str:
     return candidate.strip()
 
 
+@lru_cache(maxsize=256)
+def _source_echo_prefix_re(source: str) -> "re.Pattern[str]":
+    # 1 つの原文に対して翻訳先言語の数だけ呼ばれるため、エスケープとコンパイルは原文ごとに 1 回で済ませる
+    return re.compile(rf"^{re.escape(source)}\s*[-:：、，,。\u3000]*", re.IGNORECASE)
+
+
 def _wrap_bidi_isolate(text: str, lang: str) -> str:
     """行単位で双方向テキストを安定させるラッパー。
 
@@ -66,14 +72,31 @@ def _wrap_bidi_isolate(text: str, lang: str) -> str:
     return f"\u200E\u202A{text}\u202C\u200E"
 
 
+def join_within_limit(parts: Iterable[str], separator: str = "\n\n", limit: int = MAX_REPLY_LENGTH) -> str:
+    """separator.join(parts)[:limit] と同じ結果を返す。
+
+    上限に達した時点で打ち切るため、それ以降の要素は評価も連結もしない（parts はジェネレータでよい）。
+    """
+    chunks: List[str] = []
+    remaining = limit
+    for index, part in enumerate(parts):
+        if index:
+            if remaining <= len(separator):
+                chunks.append(separator[:remaining])
+                break
+            chunks.append(separator)
+            remaining -= len(separator)
+        if len(part) >= remaining:
+            chunks.append(part[:remaining])
+            break
+        chunks.append(part)
+        remaining -= len(part)
+    return "".join(chunks)
+
+
 def format_translations(translations: List[TranslationResult]) -> str:
-    lines: List[str] = []
-    for item in translations:
-        text = (item.text or "").strip()
-        if text:
-            lines.append(_wrap_bidi_isolate(text, item.lang))
-    joined = "\n\n".join(lines)
-    return joined[:MAX_REPLY_LENGTH]
+    stripped = (((item.text or "").strip(), item.lang) for item in translations)
+    return join_within_limit(_wrap_bidi_isolate(text, lang) for text, lang in stripped if text)
 
 
 def build_translation_reply(original_text: str, translations: List[TranslationResult]) -> str:
@@ -0,0 +1,43 @@
+from src.domain.services import bounded_cache
+from src.domain.services.bounded_cache import BoundedLRUCache
+
+
+def test_bounded_cache_evicts_least_recently_used():
+    cache = BoundedLRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # a を最近使ったので b が先に追い出される
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_bounded_cache_drops_expired_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(bounded_cache.time, "monotonic", lambda: now[0])
+    cache = BoundedLRUCache(10, ttl_seconds=60)
+    cache.put("a", 1)
+    now[0] += 30
+    cache.put("b", 2)
+
+    now[0] += 30  # a は期限切れ、b はまだ有効
+    cache.put("c", 3)
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    now[0] += 30
+    assert cache.get("b") is None
+
+
+def test_bounded_cache_pop_removes_entry():
+    cache = BoundedLRUCache(2)
+    cache.put("a", 1)
+    cache.pop("a")
+    cache.pop("missing")
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
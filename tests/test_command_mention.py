@@ -92,3 +92,83 @@ def test_command_metadata_keeps_other_mentions():
     ]
 
     assert handler._extract_command_text(_event(text, destination="BOT", mentionees=mentionees)) == "@alice stop"
+
+
+def test_default_executor_size_is_configurable():
+    handler = MessageHandler(
+        line_client=_Dummy(),
+        translation_service=_Dummy(),
+        interface_translation=_Dummy(),
+        language_detector=_Dummy(),
+        language_pref_service=_Dummy(),
+        command_router=_Dummy(),
+        repo=_Dummy(),
+        max_context_messages=1,
+        max_group_languages=5,
+        translation_retry=1,
+        bot_mention_name="bot",
+        executor_max_workers=7,
+    )
+
+    assert handler._executor._max_workers == 7
+    assert _build_handler()._executor._max_workers >= 5
+
+
+def test_rate_limit_notice_bucket_refills_over_time(monkeypatch):
+    from collections import OrderedDict
+
+    from src.app.handlers import message_handler as module
+
+    monkeypatch.setattr(module, "_rate_limit_buckets", OrderedDict())
+    refill = module.RATE_LIMIT_NOTICE_REFILL_SECONDS
+
+    assert module._take_rate_limit_notice_token("G", now=0.0) is True
+    assert module._take_rate_limit_notice_token("G", now=1.0) is False
+    assert module._take_rate_limit_notice_token("other", now=1.0) is True
+    assert module._take_rate_limit_notice_token("G", now=refill + 1.0) is True
+
+
+def test_rate_limit_notice_buckets_are_bounded(monkeypatch):
+    from collections import OrderedDict
+
+    from src.app.handlers import message_handler as module
+
+    monkeypatch.setattr(module, "_rate_limit_buckets", OrderedDict())
+    monkeypatch.setattr(module, "_RATE_LIMIT_NOTICE_MAX_KEYS", 2)
+
+    for key in ("a", "b", "c"):
+        module._take_rate_limit_notice_token(key, now=0.0)
+
+    assert list(module._rate_limit_buckets) == ["b", "c"]
+
+
+def test_rate_limit_notice_token_is_refunded_when_reply_fails(monkeypatch):
+    from collections import OrderedDict
+    from dataclasses import replace
+
+    import pytest
+
+    from src.app.handlers import message_handler as module
+
+    monkeypatch.setattr(module, "_rate_limit_buckets", OrderedDict())
+
+    class _FailingLine:
+        def __init__(self):
+            self.calls = 0
+
+        def reply_text(self, _token, _text):
+            self.calls += 1
+            raise RuntimeError("LINE API error")
+
+    handler = _build_handler()
+    handler._line = _FailingLine()
+    event = _event("hello")
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            handler._send_rate_limit_notice(event)
+    assert handler._line.calls == 2
+
+    # 返信トークンが無く送れなかった場合も、次の通知の機会を残す
+    handler._send_rate_limit_notice(replace(event, reply_token=None))
+    assert module._take_rate_limit_notice_token("G1") is True
@@ -43,3 +43,24 @@ def test_get_settings_reads_contact_env_vars(monkeypatch):
     assert settings.contact_rate_limit_max == 9
     assert settings.contact_rate_limit_window_seconds == 120
     assert settings.contact_ip_hash_salt == "salt-123"
+
+
+def test_get_settings_reads_neon_pooled_url(monkeypatch):
+    monkeypatch.setenv("LINE_CHANNEL_SECRET", "x")
+    monkeypatch.setenv("LINE_CHANNEL_ACCESS_TOKEN", "x")
+    monkeypatch.setenv("GEMINI_API_KEY", "x")
+    monkeypatch.setenv("NEON_DATABASE_URL", "postgres://u:p@ep-x.ap-southeast-1.aws.neon.tech/db")
+    monkeypatch.setenv("NEON_POOLED_DATABASE_URL", "postgres://u:p@ep-x-pooler.ap-southeast-1.aws.neon.tech/db")
+
+    get_settings.cache_clear()
+    settings = get_settings()
+
+    assert settings.neon_database_url == "postgres://u:p@ep-x.ap-southeast-1.aws.neon.tech/db"
+    assert settings.neon_pooled_database_url == "postgres://u:p@ep-x-pooler.ap-southeast-1.aws.neon.tech/db"
+
+
+def test_is_pooled_endpoint_checks_pooler_host():
+    from src.infra.neon_client import is_pooled_endpoint
+
+    assert is_pooled_endpoint("postgres://u:p@ep-x-pooler.ap-southeast-1.aws.neon.tech/db?sslmode=require")
+    assert not is_pooled_endpoint("postgres://u:p@ep-x.ap-southeast-1.aws.neon.tech/db")
@@ -0,0 +1,38 @@
+from unittest.mock import MagicMock
+
+from src.app.dispatcher import Dispatcher, LazyHandler
+from src.domain import models
+
+
+def _event(event_type="follow"):
+    return models.FollowEvent(
+        event_type=event_type,
+        reply_token="rpt",
+        group_id=None,
+        user_id="uid",
+        sender_type="user",
+        timestamp=0,
+    )
+
+
+def test_lazy_handler_builds_once_on_first_event():
+    inner = MagicMock()
+    factory = MagicMock(return_value=inner)
+    dispatcher = Dispatcher({"follow": LazyHandler(factory)})
+
+    factory.assert_not_called()
+
+    dispatcher.dispatch(_event())
+    dispatcher.dispatch(_event())
+
+    factory.assert_called_once_with()
+    assert inner.handle.call_count == 2
+
+
+def test_lazy_handler_is_not_built_for_other_event_types():
+    factory = MagicMock()
+    dispatcher = Dispatcher({"follow": LazyHandler(factory)})
+
+    dispatcher.dispatch(_event("unfollow"))
+
+    factory.assert_not_called()
@@ -143,3 +143,69 @@ def test_translate_truncates_long_texts(monkeypatch, fixed_datetime):
 
     assert len(body["context_messages"][0]["text"]) == 250
     assert body["context_messages"][0]["text"].endswith("...")
+
+
+def test_translate_uses_injected_shared_session(fixed_datetime):
+    session = DummySession(response_data=_build_default_response())
+    client = GeminiTranslationAdapter(api_key="api-key", model="gemini-pro", timeout_seconds=7, session=session)
+
+    client.translate(
+        TranslationRequest(
+            sender_name="Bob",
+            message_text="Hello",
+            timestamp=fixed_datetime,
+            candidate_languages=["ja"],
+            context_messages=[],
+        )
+    )
+
+    assert len(session.calls) == 1
+
+
+def test_shared_session_is_sized_for_concurrent_threads(monkeypatch, fixed_datetime):
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    from src.infra.http_session import build_shared_session
+
+    workers = 4
+    session = build_shared_session(pool_maxsize=workers)
+    assert session.get_adapter("https://generativelanguage.googleapis.com")._pool_maxsize == workers
+
+    barrier = threading.Barrier(workers, timeout=5)
+
+    def fake_send(_adapter, request, **_kwargs):
+        # 全スレッドが同時に送信中になるまで待ち、応答が取り違えられないことを確かめる
+        barrier.wait()
+        sent = json.loads(json.loads(request.body)["contents"][0]["parts"][0]["text"])
+        text = sent["source_message"]["text"]
+        response = requests.Response()
+        response.status_code = 200
+        response.request = request
+        response.url = request.url
+        response._content = json.dumps(
+            {"candidates": [{"content": {"parts": [{"text": json.dumps({"translations": [{"lang": "ja", "text": text}]})}]}}]}
+        ).encode("utf-8")
+        return response
+
+    monkeypatch.setattr(HTTPAdapter, "send", fake_send)
+    client = GeminiTranslationAdapter(api_key="api-key", model="gemini-pro", timeout_seconds=7, session=session)
+
+    def translate(index):
+        return client.translate(
+            TranslationRequest(
+                sender_name="Bob",
+                message_text=f"message {index}",
+                timestamp=fixed_datetime,
+                candidate_languages=["ja"],
+                context_messages=[],
+            )
+        )[0].text
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(translate, range(workers)))
+
+    assert results == [f"message {index}" for index in range(workers)]
@@ -22,14 +22,17 @@ def test_join_handler_saves_group_name_and_calls_repo():
     repo = MagicMock()
 
     handler = JoinHandler(line, repo)
-    event = _make_event(timestamp_ms=int(datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc).timestamp() * 1000))
+    joined_at = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+    event = _make_event(timestamp_ms=int(joined_at.timestamp() * 1000))
 
     handler.handle(event)
 
-    repo.record_bot_joined_at.assert_called_once()
-    repo.upsert_group_name.assert_called_once_with("gid", "Sample Group")
-    repo.reset_group_language_settings.assert_called_once_with("gid")
-    repo.set_translation_enabled.assert_called_once_with("gid", False)
+    # 参加時刻・グループ名・言語リセット・翻訳停止は 1 回の repo 呼び出しにまとめる
+    repo.initialize_group.assert_called_once_with("gid", joined_at, "Sample Group")
+    repo.record_bot_joined_at.assert_not_called()
+    repo.upsert_group_name.assert_not_called()
+    repo.reset_group_language_settings.assert_not_called()
+    repo.set_translation_enabled.assert_not_called()
     line.reply_text.assert_called_once()
 
 
@@ -43,8 +46,8 @@ def test_join_handler_continues_when_group_name_missing():
 
     handler.handle(event)
 
-    repo.record_bot_joined_at.assert_called_once()
-    repo.upsert_group_name.assert_not_called()
+    repo.initialize_group.assert_called_once()
+    assert repo.initialize_group.call_args[0][2] is None
     line.reply_text.assert_called_once()
 
 
@@ -58,5 +61,14 @@ def test_join_handler_swallows_group_name_errors():
 
     handler.handle(event)
 
-    repo.record_bot_joined_at.assert_called_once()
+    repo.initialize_group.assert_called_once()
     line.reply_text.assert_called_once()
+
+
+def test_event_occurred_at_converts_ms_timestamp_once():
+    joined_at = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+    event = _make_event(timestamp_ms=int(joined_at.timestamp() * 1000))
+
+    assert event.occurred_at == joined_at
+    assert event.occurred_at is event.occurred_at
+    assert _make_event(timestamp_ms=0).occurred_at is None
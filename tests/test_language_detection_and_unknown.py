@@ -229,3 +229,26 @@ def test_language_settings_invalid_operation_returns_unknown_instruction():
     handler._handle_command(event, "unsupported")
 
     assert line_client.last_text == UNKNOWN_INSTRUCTION_BASE
+
+
+def test_language_detection_reuses_result_for_short_text(monkeypatch):
+    from src.domain.services import language_detection_service as module
+
+    calls = []
+
+    def _fake_detect(text):
+        calls.append(text)
+        return "ja"
+
+    module._detect_cached.cache_clear()
+    monkeypatch.setattr(module, "detect", _fake_detect)
+    detector = LanguageDetectionService()
+
+    assert detector.detect("言語設定") == "ja"
+    assert detector.detect("言語設定") == "ja"
+    long_text = "あ" * (module.DETECTION_CACHE_MAX_TEXT_LENGTH + 1)
+    detector.detect(long_text)
+    detector.detect(long_text)
+    module._detect_cached.cache_clear()
+
+    assert calls == ["言語設定", long_text, long_text]
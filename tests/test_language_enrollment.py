@@ -245,16 +245,12 @@ def test_language_enrollment_uses_instruction_language_texts():
 
 
 def _decode_payload(data: str):
-    import base64
-    import json
-    import zlib
+    from src.app.subscription_postback import decode_postback_payload
 
-    assert data.startswith("langpref2=")
-    raw = data.split("=", 1)[1]
-    padding = "=" * (-len(raw) % 4)
-    decoded = base64.urlsafe_b64decode(raw + padding)
-    decompressed = zlib.decompress(decoded)
-    return json.loads(decompressed)
+    assert data.startswith(("langpref=", "langpref2=", "langpref3="))
+    payload = decode_postback_payload(data)
+    assert payload is not None
+    return payload
 
 
 def test_language_enrollment_rejects_over_five():
@@ -549,3 +545,195 @@ def test_postback_sends_multilingual_completion():
     assert parts[0] == "English, Japanese, and Thai have been set as the translation languages."
     assert "(ja)" in parts[1]
     assert "(th)" in parts[2]
+
+
+def test_language_enrollment_translates_prompt_and_limit_texts_in_one_call():
+    class _CountingInterfaceTranslation(DummyInterfaceTranslation):
+        def __init__(self):
+            super().__init__()
+            self.calls = []
+
+        def translate(self, text, languages):
+            self.calls.append((text, list(languages)))
+            parts = text.split("\n---\n")
+            return [models.TranslationResult(lang=languages[0], text="\n---\n".join(f"[ja] {p}" for p in parts))]
+
+    fake_result = models.LanguagePreference(
+        supported=[models.LanguageChoice(code="en", name="English"), models.LanguageChoice(code="ja", name="日本語")],
+        unsupported=[],
+        confirm_label="OK",
+        cancel_label="Cancel",
+        primary_language="ja",
+    )
+    interface_translation = _CountingInterfaceTranslation()
+    line = DummyLineClient()
+    handler = MessageHandler(
+        line_client=line,
+        translation_service=DummyTranslationService(),
+        interface_translation=interface_translation,
+        language_detector=LanguageDetectionService(),
+        language_pref_service=DummyLangPrefService(fake_result),
+        command_router=DummyCommandRouter(),
+        repo=DummyRepo(),
+        max_context_messages=1,
+        max_group_languages=5,
+        translation_retry=1,
+        bot_mention_name="bot",
+    )
+    event = models.MessageEvent(
+        event_type="message",
+        reply_token="reply-token",
+        timestamp=0,
+        text="English, 日本語",
+        user_id="U",
+        group_id="G",
+        sender_type="group",
+    )
+
+    handler._attempt_language_enrollment(event)
+
+    assert len(interface_translation.calls) == 1
+    template = line.sent["messages"][0]["template"]
+    confirm_payload = _decode_payload(template["actions"][0]["data"])
+    assert confirm_payload["limit_text"].startswith("[ja] You can set up to")
+
+    # 同じ言語・同じ候補での再設定は翻訳結果をキャッシュから使い回す
+    handler._attempt_language_enrollment(event)
+    assert len(interface_translation.calls) == 1
+
+
+def test_encode_postback_payload_skips_compression_for_small_payloads():
+    from src.app.subscription_postback import decode_postback_payload
+
+    small = {"kind": "language_confirm", "action": "cancel", "primary_language": "ja"}
+    large = {
+        "kind": "language_confirm",
+        "action": "confirm",
+        "primary_language": "ja",
+        "completion_text": "日本語 and English have been set as the translation languages. " * 3,
+    }
+
+    small_data = MessageHandler._encode_postback_payload(dict(small))  # type: ignore[attr-defined]
+    large_data = MessageHandler._encode_postback_payload(dict(large))  # type: ignore[attr-defined]
+
+    assert small_data.startswith("langpref=")
+    assert decode_postback_payload(small_data) == small
+    assert large_data.startswith("langpref3=")
+    assert len(large_data) <= 280
+    assert decode_postback_payload(large_data) == large
+
+
+def test_template_translation_sends_duplicate_texts_once():
+    from src.domain.services.language_settings_service import LanguageSettingsService
+
+    class _RecordingInterfaceTranslation(DummyInterfaceTranslation):
+        def __init__(self):
+            super().__init__()
+            self.texts = []
+
+        def translate(self, text, languages):
+            self.texts.append(text)
+            parts = text.split("\n---\n")
+            return [models.TranslationResult(lang=languages[0], text="\n---\n".join(f"[ja] {p}" for p in parts))]
+
+    interface_translation = _RecordingInterfaceTranslation()
+    service = LanguageSettingsService(DummyRepo(), None, interface_translation, 5)
+
+    result = service._translate_template(["OK", "Cancel", "OK"], "ja", force=True)
+
+    assert result == ["[ja] OK", "[ja] Cancel", "[ja] OK"]
+    assert interface_translation.texts == ["OK\n---\nCancel"]
+
+
+def test_unsupported_message_skips_translation_for_english():
+    from src.domain.services.language_codes import is_english_language_code
+    from src.domain.services.language_settings_service import LanguageSettingsService
+
+    class _FailingInterfaceTranslation(DummyInterfaceTranslation):
+        def translate(self, *_args, **_kwargs):
+            raise AssertionError("English notices should not be translated")
+
+    service = LanguageSettingsService(DummyRepo(), None, _FailingInterfaceTranslation(), 5)
+    unsupported = [models.LanguageChoice(code="sa", name="Sanskrit")]
+
+    assert service._format_unsupported_message(unsupported, "EN-us") == "The following languages are not supported: Sanskrit"
+    assert is_english_language_code("en") and not is_english_language_code("ja")
+
+
+def test_unsupported_message_falls_back_to_code_and_skips_blank_codes():
+    from src.domain.services.language_settings_service import LanguageSettingsService
+
+    service = LanguageSettingsService(DummyRepo(), None, DummyInterfaceTranslation(), 5)
+    unsupported = [
+        models.LanguageChoice(code="sa", name="Sanskrit"),
+        models.LanguageChoice(code="", name="Ghost"),
+        models.LanguageChoice(code="xx", name=""),
+    ]
+
+    assert service._format_unsupported_message(unsupported, "") == "The following languages are not supported: Sanskrit, xx"
+
+
+def test_simple_confirm_text_joins_language_names():
+    from src.domain.services.language_settings_service import LanguageSettingsService
+
+    choices = [
+        models.LanguageChoice(code="en", name="English"),
+        models.LanguageChoice(code="ja", name=""),
+        models.LanguageChoice(code="", name="Ignored"),
+        models.LanguageChoice(code="th", name="Thai"),
+    ]
+
+    expected = "Do you want to enable translation for English, ja, and Thai?"
+    assert LanguageSettingsService._build_simple_confirm_text(choices) == expected
+    assert MessageHandler._build_simple_confirm_text(choices[:2]) == "Do you want to enable translation for English and ja?"
+
+
+def test_language_settings_uses_command_runtime_for_plan():
+    class _NoPlanLookupRepo(RecordingRepo):
+        def fetch_translation_runtime_state(self, *_args, **_kwargs):
+            raise AssertionError("runtime state should be reused from the command")
+
+    line = RecordingLineClient()
+    repo = _NoPlanLookupRepo(initial=["en", "ja"])
+    handler = MessageHandler(
+        line_client=line,
+        translation_service=DummyTranslationService(),
+        interface_translation=DummyInterfaceTranslation(),
+        language_detector=LanguageDetectionService(),
+        language_pref_service=DummyLangPrefService(models.LanguagePreference(supported=[])),
+        command_router=DummyCommandRouter(),
+        repo=repo,
+        max_context_messages=1,
+        max_group_languages=5,
+        translation_retry=1,
+        bot_mention_name="bot",
+    )
+    runtime = models.TranslationRuntimeState(
+        translation_enabled=True,
+        group_languages=["en", "ja"],
+        subscription_status=None,
+        period_start=None,
+        period_end=None,
+        period_key="2026-10",
+        usage=0,
+        limit_notice_plan=None,
+    )
+    decision = models.CommandDecision(
+        action="language_settings",
+        operation="add",
+        languages_to_add=[models.LanguageChoice(code="es", name="Spanish")],
+        instruction_language="en",
+    )
+    event = models.MessageEvent(
+        event_type="message",
+        reply_token="token",
+        timestamp=0,
+        text="@bot add Spanish",
+        user_id="U",
+        group_id="G",
+        sender_type="group",
+    )
+
+    handler._handle_language_settings(event, decision, event.text, runtime=runtime)
+
+    assert "es" in repo.languages
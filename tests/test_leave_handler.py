@@ -1,9 +1,19 @@
 from unittest.mock import MagicMock
 
+import pytest
+
+from src.app.handlers import leave_handler
 from src.app.handlers.leave_handler import LeaveHandler
 from src.domain import models
 
 
+@pytest.fixture(autouse=True)
+def _sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(leave_handler.time, "sleep", recorded.append)
+    return recorded
+
+
 def _make_event(group_id="gid"):
     return models.LeaveEvent(
         event_type="leave",
@@ -65,3 +75,23 @@ def test_leave_handler_continues_when_reset_fails():
     handler.handle(_make_event())
 
     subscription_service.cancel_subscription.assert_called_once_with("gid")
+
+
+def test_leave_handler_backs_off_exponentially_between_retries(_sleeps):
+    subscription_service = MagicMock()
+    subscription_service.cancel_subscription.side_effect = [False, False, False]
+    handler = LeaveHandler(subscription_service, MagicMock(), retry_backoff_seconds=0.5)
+
+    handler.handle(_make_event())
+
+    # 最終試行の後は待たない
+    assert _sleeps == [0.5, 1.0]
+
+
+def test_leave_handler_does_not_sleep_after_success(_sleeps):
+    subscription_service = MagicMock()
+    handler = LeaveHandler(subscription_service, MagicMock())
+
+    handler.handle(_make_event())
+
+    assert _sleeps == []
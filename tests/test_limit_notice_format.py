@@ -99,3 +99,27 @@ def test_free_limit_notice_includes_reset_date():
     assert url == "https://short.example.com/cs"
     assert "2026-02-28" in notice
     assert "Free quota" in notice
+
+
+def test_limit_notice_creates_checkout_url_while_translating():
+    import threading
+
+    handler = _build_handler()
+    url_started = threading.Event()
+
+    def _translate(base, _gid):
+        # 翻訳中に購入リンク生成が別スレッドで始まっていること
+        assert url_started.wait(timeout=2)
+        return base
+
+    def _create_checkout_url(_gid):
+        url_started.set()
+        return "https://short.example.com/cs"
+
+    handler._build_multilingual_interface_message = _translate  # type: ignore[assignment]
+    handler._subscription_service.create_checkout_url = _create_checkout_url  # type: ignore[attr-defined]
+
+    notice, url = handler._build_limit_reached_notice_text("group1", paid=False, limit=50)
+
+    assert url == "https://short.example.com/cs"
+    assert "Unable to generate purchase link" not in notice
@@ -95,3 +95,50 @@ def test_pause_notice_over_quota_sets_limit_notice_plan():
     expected_period_key = f"{now.year:04d}-{now.month:02d}-01"
     assert repo.set_calls == [("group1", expected_period_key, "free")]
 
+
+
+class _NoUsageRepo(_FakeRepo):
+    def get_usage(self, _group_id, _period_key):
+        raise AssertionError("usage should come from runtime")
+
+
+def test_pause_notice_reuses_runtime_period_key_and_usage():
+    line = _DummyLine()
+    repo = _NoUsageRepo(usage=0)
+    handler = MessageHandler(
+        line_client=line,
+        translation_service=_DummyTranslation(),
+        interface_translation=_DummyInterfaceTranslation(),
+        language_detector=_DummyLanguageDetector(),
+        language_pref_service=_DummyLanguagePref(),
+        command_router=_DummyCommandRouter(),
+        repo=repo,
+        max_context_messages=1,
+        max_group_languages=5,
+        translation_retry=1,
+        bot_mention_name="bot",
+        free_quota_per_month=50,
+    )
+    runtime = models.TranslationRuntimeState(
+        translation_enabled=False,
+        group_languages=["en"],
+        subscription_status=None,
+        period_start=None,
+        period_end=None,
+        period_key="2025-01-01",
+        usage=50,
+        limit_notice_plan=None,
+    )
+    event = models.MessageEvent(
+        event_type="message",
+        reply_token="r1",
+        group_id="group1",
+        user_id="user1",
+        sender_type="group",
+        timestamp=0,
+        text="hello",
+    )
+
+    handler._send_pause_notice(event, runtime=runtime)
+
+    assert repo.set_calls == [("group1", "2025-01-01", "free")]
@@ -62,3 +62,55 @@ def test_get_group_name_error_returns_none():
     name = adapter.get_group_name("group123")
 
     assert name is None
+
+
+class _UrlSession:
+    def __init__(self, names_by_url):
+        self._names_by_url = names_by_url
+        self.headers = {}
+
+    def get(self, url, timeout=5):
+        name = self._names_by_url.get(url)
+        if name is None:
+            return _FakeResponse(status_code=404)
+        return _FakeResponse(json_data={"displayName": name})
+
+
+def test_get_display_names_fetches_each_user_once_and_skips_missing():
+    adapter = LineApiAdapter("dummy")
+    adapter._session = _UrlSession(  # type: ignore[attr-defined]
+        {
+            "https://api.line.me/v2/bot/group/G1/member/U1": "Alice",
+            "https://api.line.me/v2/bot/group/G1/member/U2": "Bob",
+        }
+    )
+
+    names = adapter.get_display_names("group", "G1", ["U1", "U2", "U3", "U1", ""])
+
+    assert names == {"U1": "Alice", "U2": "Bob"}
+
+
+def test_reply_text_sends_utf8_body_without_unicode_escapes():
+    import json
+
+    adapter = LineApiAdapter("dummy")
+    session = MagicMock()
+    session.post.return_value = _FakeResponse(status_code=200)
+    adapter._session = session  # type: ignore[attr-defined]
+
+    adapter.reply_text("rpt", "こんにちは")
+
+    body = session.post.call_args.kwargs["data"]
+    assert isinstance(body, bytes)
+    assert "こんにちは".encode("utf-8") in body
+    assert json.loads(body) == {"replyToken": "rpt", "messages": [{"type": "text", "text": "こんにちは"}]}
+
+
+def test_sanitize_message_truncates_long_text_only():
+    short = {"type": "text", "text": "hello"}
+    long = {"type": "text", "text": "a" * 6000}
+
+    assert LineApiAdapter._sanitize_message(short) is short
+    sanitized = LineApiAdapter._sanitize_message(long)
+    assert len(sanitized["text"]) == 5000
+    assert len(long["text"]) == 6000
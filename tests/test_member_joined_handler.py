@@ -0,0 +1,47 @@
+import datetime
+from unittest.mock import MagicMock
+
+from src.app.handlers.member_joined_handler import MemberJoinedHandler
+from src.domain import models
+
+_EVENT_TIME = datetime.datetime(2025, 1, 1, 12, 0, tzinfo=datetime.timezone.utc)
+
+
+def _make_event(joined_user_ids=("U1", "U2")):
+    return models.MemberJoinedEvent(
+        event_type="memberJoined",
+        reply_token="rpt",
+        group_id="gid",
+        user_id=None,
+        sender_type="group",
+        timestamp=int(_EVENT_TIME.timestamp() * 1000),
+        joined_user_ids=list(joined_user_ids),
+    )
+
+
+def test_member_joined_registers_members_in_bulk_and_greets_by_name():
+    line = MagicMock()
+    line.get_display_names.return_value = {"U1": "Alice", "U2": "Bob"}
+    repo = MagicMock()
+    repo.fetch_bot_joined_at.return_value = _EVENT_TIME - datetime.timedelta(hours=1)
+
+    MemberJoinedHandler(line, repo).handle(_make_event(("U1", "", "U2")))
+
+    repo.ensure_group_members.assert_called_once_with("gid", ["U1", "U2"])
+    repo.ensure_group_member.assert_not_called()
+    line.get_display_names.assert_called_once_with("group", "gid", ["U1", "U2"])
+    line.get_display_name.assert_not_called()
+    message = line.reply_text.call_args[0][1]
+    assert message.startswith("Hello Alice、Bob !")
+
+
+def test_member_joined_skips_profile_fetch_right_after_bot_join():
+    line = MagicMock()
+    repo = MagicMock()
+    repo.fetch_bot_joined_at.return_value = _EVENT_TIME - datetime.timedelta(minutes=1)
+
+    MemberJoinedHandler(line, repo).handle(_make_event())
+
+    repo.ensure_group_members.assert_called_once_with("gid", ["U1", "U2"])
+    line.get_display_names.assert_not_called()
+    line.reply_text.assert_not_called()
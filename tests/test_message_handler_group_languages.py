@@ -0,0 +1,105 @@
+from src.app.handlers.message_handler import MessageHandler
+
+
+class _Dummy:
+    """Placeholder dependency; methods are never invoked in these tests."""
+
+
+class _CountingRepo:
+    def __init__(self):
+        self.calls = 0
+        self.languages = ["en", "ja"]
+
+    def fetch_group_languages(self, _group_id):
+        self.calls += 1
+        return list(self.languages)
+
+
+def _build_handler(repo) -> MessageHandler:
+    return MessageHandler(
+        line_client=_Dummy(),
+        translation_service=_Dummy(),
+        interface_translation=_Dummy(),
+        language_detector=_Dummy(),
+        language_pref_service=_Dummy(),
+        command_router=_Dummy(),
+        repo=repo,
+        max_context_messages=1,
+        max_group_languages=5,
+        translation_retry=1,
+        bot_mention_name="bot",
+    )
+
+
+def test_group_languages_are_fetched_once_per_event():
+    repo = _CountingRepo()
+    handler = _build_handler(repo)
+    handler._event_scope.group_languages = {}
+
+    assert handler._fetch_group_languages("G") == ["en", "ja"]
+    assert handler._fetch_and_limit_languages("G") == ["en", "ja"]
+    assert repo.calls == 1
+
+    repo.languages = ["fr"]
+    handler._invalidate_group_languages("G")
+    assert handler._fetch_group_languages("G") == ["fr"]
+    assert repo.calls == 2
+
+
+def test_group_languages_are_not_cached_outside_event():
+    repo = _CountingRepo()
+    handler = _build_handler(repo)
+
+    handler._fetch_group_languages("G")
+    handler._fetch_group_languages("G")
+
+    assert repo.calls == 2
+
+
+class _FailingInterfaceTranslation:
+    def translate(self, *_args, **_kwargs):
+        raise AssertionError("interface translation should not be called")
+
+
+def test_multilingual_message_skips_translation_for_english_only_groups():
+    repo = _CountingRepo()
+    repo.languages = ["en-US", "en-gb"]
+    handler = _build_handler(repo)
+    handler._interface_translation = _FailingInterfaceTranslation()
+
+    assert handler._build_multilingual_interface_message("Hello", "G") == "Hello"
+
+
+def test_multilingual_message_uses_given_languages_without_fetching():
+    repo = _CountingRepo()
+    repo.languages = ["ja"]
+    handler = _build_handler(repo)
+    handler._interface_translation = _FailingInterfaceTranslation()
+
+    assert handler._build_multilingual_interface_message("Hello", "G", languages=["en"]) == "Hello"
+    assert repo.calls == 0
+
+
+def test_shrink_notice_is_prepared_in_background():
+    repo = _CountingRepo()
+    handler = _build_handler(repo)
+
+    future = handler._submit_shrink_notice("G", 1, ["fr"], ["en"])
+
+    assert future is not None
+    assert "fr" in future.result()
+    assert handler._submit_shrink_notice("G", 1, [], ["en"]) is None
+    assert repo.calls == 0
+
+
+def test_multilingual_message_reuses_event_scoped_languages():
+    repo = _CountingRepo()
+    repo.languages = ["en"]
+    handler = _build_handler(repo)
+    handler._interface_translation = _FailingInterfaceTranslation()
+    handler._event_scope.group_languages = {}
+
+    handler._build_multilingual_interface_message("Hello", "G")
+    handler._build_multilingual_interface_message("Bye", "G")
+
+    assert repo.calls == 1
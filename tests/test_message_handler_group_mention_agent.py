@@ -160,3 +160,93 @@ def test_router_receives_runtime_payload_json():
     assert data["next_reset_at_utc"] == "2026-03-01T00:00:00+00:00"
     assert data["current_languages"] == ["ja", "en"]
     assert data["translation_enabled"] is True
+
+
+def test_pause_ack_is_sent_before_handle_returns():
+    class _Router:
+        def decide(self, _text):
+            return models.CommandDecision(action="pause", instruction_language="ja", ack_text="翻訳を停止します。")
+
+    class _RecordingRepo(_Repo):
+        def __init__(self):
+            super().__init__()
+            self.inserted = []
+
+        def ensure_group_member(self, *_args):
+            return None
+
+        def get_group_member_display_name(self, *_args):
+            return "Alice"
+
+        def insert_message(self, record):
+            self.inserted.append(record)
+
+    repo = _RecordingRepo()
+    handler = _build_handler(_Router(), repo=repo)
+
+    handler.handle(_event())
+
+    assert handler._line.last_text == "翻訳を停止します。"
+    assert len(repo.inserted) == 1
+    assert handler._event_scope.pending_replies is None
+
+
+def test_deferred_messages_are_flushed_by_await_pending_replies():
+    class _RecordingLine(_Line):
+        def __init__(self):
+            super().__init__()
+            self.sent = []
+
+        def reply_messages(self, _token, messages):
+            self.sent.append(messages)
+
+    handler = _build_handler(_Dummy())
+    handler._line = _RecordingLine()
+    handler._event_scope.pending_replies = []
+
+    assert handler._reply_messages_deferred(_event(), [{"type": "text", "text": "hi"}]) is True
+    handler._await_pending_replies()
+
+    assert handler._line.sent == [[{"type": "text", "text": "hi"}]]
+    assert handler._event_scope.pending_replies is None
+
+
+def test_command_resolves_sender_name_in_background_for_persistence():
+    import threading
+
+    class _Router:
+        def decide(self, _text):
+            return models.CommandDecision(action="resume", instruction_language="en", ack_text="Resumed.")
+
+    class _NamedLine(_Line):
+        def __init__(self):
+            super().__init__()
+            self.name_threads = []
+
+        def get_display_name(self, *_args, **_kwargs):
+            self.name_threads.append(threading.current_thread())
+            return "Bob"
+
+    class _RecordingRepo(_Repo):
+        def __init__(self):
+            super().__init__()
+            self.inserted = []
+
+        def ensure_group_member(self, *_args):
+            return None
+
+        def get_group_member_display_name(self, *_args):
+            return None
+
+        def insert_message(self, record):
+            self.inserted.append(record)
+
+    repo = _RecordingRepo()
+    handler = _build_handler(_Router(), repo=repo)
+    handler._line = _NamedLine()
+
+    handler.handle(_event())
+
+    assert handler._line.last_text == "Resumed."
+    assert [record.sender_name for record in repo.inserted] == ["Bob"]
+    assert handler._line.name_threads and handler._line.name_threads[0] is not threading.main_thread()
@@ -0,0 +1,62 @@
+from src.app.handlers.message_handler import MessageHandler
+from src.domain.models import TranslationResult
+
+
+class _Dummy:
+    """Placeholder dependency; methods are never invoked in these tests."""
+
+
+class _CountingTranslation:
+    def __init__(self):
+        self.calls = 0
+
+    def translate(self, *, message_text, candidate_languages, **_kwargs):
+        self.calls += 1
+        return [TranslationResult(lang=candidate_languages[0], text=message_text.replace("Hello", "こんにちは"))]
+
+
+def _build_handler(translation) -> MessageHandler:
+    return MessageHandler(
+        line_client=_Dummy(),
+        translation_service=translation,
+        interface_translation=_Dummy(),
+        language_detector=_Dummy(),
+        language_pref_service=_Dummy(),
+        command_router=_Dummy(),
+        repo=_Dummy(),
+        max_context_messages=1,
+        max_group_languages=5,
+        translation_retry=1,
+        bot_mention_name="bot",
+    )
+
+
+def test_translate_template_reuses_previous_translation():
+    translation = _CountingTranslation()
+    handler = _build_handler(translation)
+
+    first = handler._translate_template("Hello", "ja")
+    second = handler._translate_template("Hello", "JA")
+
+    assert first == second == "こんにちは"
+    assert translation.calls == 1
+
+
+def test_translate_template_cache_returns_fresh_lists_for_sequences():
+    translation = _CountingTranslation()
+    handler = _build_handler(translation)
+
+    first = handler._translate_template(["Hello", "Hello world"], "ja")
+    first.append("mutated")
+    second = handler._translate_template(["Hello", "Hello world"], "ja")
+
+    assert second == ["こんにちは", "こんにちは world"]
+    assert translation.calls == 1
+
+
+def test_normalize_template_text_unifies_newlines_and_blank_lines():
+    normalize = MessageHandler._normalize_template_text
+
+    assert normalize("  a\r\nb\rc\n\n\n\nd  ") == "a\nb\nc\n\nd"
+    assert normalize("plain text") == "plain text"
+    assert normalize("") == ""
@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
 
 from src.app.handlers.message_handler import MessageHandler, USAGE_MESSAGE
+from src.domain.services.bounded_cache import BoundedLRUCache
 from src.domain import models
 from src.domain.models import TranslationResult
 
@@ -24,6 +25,7 @@ def test_usage_response_wraps_bidi_lines():
     handler = _Handler()
     handler._repo = _Repo()
     handler._max_group_languages = 5
+    handler._constant_translation_cache = BoundedLRUCache(16)
 
     # メソッド内で使う helper を流用するためクラスの関数をバインド
     handler._limit_language_codes = MessageHandler._limit_language_codes.__get__(handler, MessageHandler)
@@ -36,3 +38,59 @@ def test_usage_response_wraps_bidi_lines():
     assert lines[0].startswith("\u200E\u202A") and lines[0].endswith("\u200E")
     # アラビア語行は RLM + RLE/PDF + RLM
     assert lines[1].startswith("\u200F\u202B") and lines[1].endswith("\u202C\u200F")
+
+
+def test_usage_response_reuses_cached_translations_per_language():
+    class _Languages:
+        def __init__(self):
+            self.languages = ["ja"]
+
+        def fetch_group_languages(self, _group_id):
+            return list(self.languages)
+
+    requested = []
+
+    class _CountingHandler(MessageHandler):
+        def __init__(self):
+            pass
+
+        def _invoke_translation_with_retry(self, *, candidate_languages, **_kwargs):
+            requested.append(list(candidate_languages))
+            return [TranslationResult(lang=lang, text=f"[{lang}] usage") for lang in candidate_languages]
+
+    handler = _CountingHandler()
+    handler._repo = _Languages()
+    handler._max_group_languages = 5
+    handler._constant_translation_cache = BoundedLRUCache(16)
+
+    first = handler._build_usage_response(instruction_lang="", group_id="G")
+    handler._repo.languages = ["ja", "fr"]
+    second = handler._build_usage_response(instruction_lang="", group_id="G")
+    third = handler._build_usage_response(instruction_lang="", group_id="G")
+
+    assert requested == [["ja"], ["fr"]]
+    assert first.count("usage") == 1
+    assert second == third
+    assert second.index("[ja]") < second.index("[fr]")
+
+
+def test_constant_translation_is_cached_only_under_returned_language():
+    requested = []
+
+    class _MismatchHandler(MessageHandler):
+        def __init__(self):
+            pass
+
+        def _invoke_translation_with_retry(self, *, candidate_languages, **_kwargs):
+            requested.append(list(candidate_languages))
+            # pt-br を依頼したのに pt で返ってくるケース
+            return [TranslationResult(lang="pt", text="uso")]
+
+    handler = _MismatchHandler()
+    handler._constant_translation_cache = BoundedLRUCache(16)
+
+    assert handler._translate_constant(USAGE_MESSAGE, ["pt-br"]) == {"pt": "uso"}
+    assert handler._translate_constant(USAGE_MESSAGE, ["pt"]) == {"pt": "uso"}
+    handler._translate_constant(USAGE_MESSAGE, ["pt-br"])
+
+    assert requested == [["pt-br"], ["pt-br"]]
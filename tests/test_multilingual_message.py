@@ -50,3 +50,18 @@ def test_build_multilingual_message_appends_unique_translations():
         warning_log="translation failed",
     )
     assert text.split("\n\n") == ["Hello", "ja:Hello", "fr:Hello"]
+
+
+def test_build_multilingual_message_caps_reply_length():
+    logger = _Logger()
+    translator = InterfaceTranslationService(_Translator())
+    base = "x" * 3000
+    text = build_multilingual_message(
+        base_text=base,
+        languages=["ja", "fr"],
+        translator=translator,
+        logger=logger,
+        warning_log="translation failed",
+    )
+    assert len(text) == 5000
+    assert text.startswith(base + "\n\nja:")
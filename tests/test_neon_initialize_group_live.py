@@ -0,0 +1,99 @@
+import os
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import pytest
+from dotenv import load_dotenv
+
+from src.infra.neon_repositories import BOT_JOIN_MARKER, NeonMessageRepository
+
+
+load_dotenv(dotenv_path=".env")
+
+
+TEST_DATABASE_URL = os.getenv("NEON_TEST_DATABASE_URL")
+
+
+class _SingleConnectionClient:
+    """一時テーブルを見られるよう、1 本の接続だけを使う NeonClient 互換クライアント。"""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    @contextmanager
+    def connection(self):
+        yield self._conn
+
+    @contextmanager
+    def cursor(self):
+        with self._conn.cursor() as cur:
+            yield cur
+
+
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="NEON_TEST_DATABASE_URL is required for live Neon test")
+def test_initialize_group_resets_every_member_and_settings():
+    import psycopg
+
+    with psycopg.connect(TEST_DATABASE_URL, autocommit=True) as conn:
+        with conn.cursor() as cur:
+            # 一時テーブルは pg_temp が search_path の先頭にあるため本番テーブルより優先される
+            cur.execute(
+                """
+                CREATE TEMP TABLE group_members (
+                    group_id TEXT NOT NULL,
+                    user_id TEXT NOT NULL,
+                    display_name TEXT,
+                    display_name_updated_at TIMESTAMPTZ,
+                    joined_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+                    last_prompted_at TIMESTAMPTZ,
+                    last_completed_at TIMESTAMPTZ,
+                    PRIMARY KEY (group_id, user_id)
+                )
+                """
+            )
+            cur.execute(
+                """
+                CREATE TEMP TABLE group_languages (
+                    group_id TEXT NOT NULL,
+                    lang_code VARCHAR(16) NOT NULL,
+                    lang_name TEXT NOT NULL,
+                    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+                    PRIMARY KEY (group_id, lang_code)
+                )
+                """
+            )
+            cur.execute(
+                """
+                CREATE TEMP TABLE group_settings (
+                    group_id TEXT PRIMARY KEY,
+                    translation_enabled BOOLEAN NOT NULL DEFAULT TRUE,
+                    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+                    group_name TEXT
+                )
+                """
+            )
+            cur.execute(
+                """
+                INSERT INTO group_members (group_id, user_id, joined_at, last_prompted_at, last_completed_at)
+                VALUES ('G1', 'U1', NOW(), NOW(), NOW()), ('G1', %s, NOW(), NOW(), NOW()), ('G2', 'U2', NOW(), NOW(), NOW())
+                """,
+                (BOT_JOIN_MARKER,),
+            )
+            cur.execute("INSERT INTO group_languages (group_id, lang_code, lang_name) VALUES ('G1', 'ja', 'Japanese')")
+            cur.execute("INSERT INTO group_settings (group_id, translation_enabled, group_name) VALUES ('G1', TRUE, 'old')")
+
+        repo = NeonMessageRepository(_SingleConnectionClient(conn))
+        joined_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        repo.initialize_group("G1", joined_at, None)
+
+        with conn.cursor() as cur:
+            cur.execute("SELECT user_id, last_prompted_at, last_completed_at FROM group_members WHERE group_id = 'G1'")
+            assert all(prompted is None and completed is None for _user, prompted, completed in cur.fetchall())
+            cur.execute("SELECT last_prompted_at FROM group_members WHERE group_id = 'G2'")
+            assert cur.fetchone()[0] is not None
+            cur.execute("SELECT COUNT(*) FROM group_languages WHERE group_id = 'G1'")
+            assert cur.fetchone()[0] == 0
+            cur.execute("SELECT translation_enabled, group_name FROM group_settings WHERE group_id = 'G1'")
+            assert cur.fetchone() == (False, "old")
+
+        assert repo.fetch_bot_joined_at("G1") == joined_at
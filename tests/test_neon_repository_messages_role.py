@@ -61,3 +61,70 @@ def test_fetch_private_conversation_returns_role_and_chronological_order():
 
     assert [item.text for item in history] == ["earlier", "later"]
     assert [item.role for item in history] == ["user", "assistant"]
+
+
+def test_initialize_group_runs_single_statement():
+    repo = NeonMessageRepository(_Client())
+    joined_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    repo.initialize_group("G1", joined_at, None)
+
+    executed = repo._client.cursor_obj.executed
+    assert len(executed) == 1
+    query, params = executed[0]
+    assert "DELETE FROM group_languages" in query
+    assert "translation_enabled = FALSE" in query
+    assert "COALESCE(EXCLUDED.group_name" in query
+    # マーカー行も含めて全メンバーのプロンプト状態をリセットする（従来の個別更新と同じ）
+    upsert = query.split("cleared_languages AS")[0]
+    assert "last_prompted_at = NULL" in upsert and "last_completed_at = NULL" in upsert
+    assert params["group_id"] == "G1"
+    assert params["joined_at"] == joined_at
+    assert params["group_name"] is None
+
+
+class _TxCursor(_Cursor):
+    def executemany(self, query, params_seq):
+        self.executed.append((str(query), list(params_seq)))
+
+
+class _TxClient:
+    def __init__(self, rows=None):
+        self.cursor_obj = _TxCursor(rows=rows)
+        self.connections = 0
+
+    def connection(self):
+        client = self
+
+        class _Conn:
+            def __enter__(self):
+                client.connections += 1
+                return self
+
+            def __exit__(self, exc_type, exc, tb):
+                return False
+
+            def cursor(self):
+                return client.cursor_obj
+
+        return _Conn()
+
+
+def test_apply_group_language_update_uses_one_transaction():
+    client = _TxClient(rows=[("ja",)])
+    repo = NeonMessageRepository(client, max_group_languages=3)
+
+    repo.apply_group_language_update(
+        "G1",
+        add_languages=[("EN", "English"), ("ja", "Japanese")],
+        remove_codes=["TH"],
+        translation_enabled=True,
+    )
+
+    assert client.connections == 1
+    queries = [query for query, _ in client.cursor_obj.executed]
+    assert "DELETE FROM group_languages" in queries[0]
+    assert client.cursor_obj.executed[0][1] == ("G1", ["th"])
+    assert client.cursor_obj.executed[2][1] == [("G1", "en", "English")]
+    assert "group_settings" in queries[3]
+    assert client.cursor_obj.executed[3][1] == ("G1", True)
@@ -1,4 +1,9 @@
+import base64
+import json
+import zlib
+
 from src.app.subscription_postback import decode_postback_payload, encode_subscription_payload
+from src.domain.services.language_settings_service import encode_language_postback_payload
 
 
 def test_decode_subscription_payload_roundtrip():
@@ -8,3 +13,81 @@ def test_decode_subscription_payload_roundtrip():
     decoded = decode_postback_payload(encoded)
 
     assert decoded == payload
+
+
+def test_language_payload_uses_preset_dictionary_and_roundtrips():
+    payload = {
+        "kind": "language_confirm",
+        "action": "confirm",
+        "languages": [{"code": "en", "name": "English"}, {"code": "ja", "name": "日本語"}],
+        "primary_language": "ja",
+        "completion_text": "English and 日本語 have been set as the translation languages.",
+        "limit_text": "You can set up to 5 translation languages. Please specify 5 or fewer.",
+    }
+
+    encoded = encode_language_postback_payload(dict(payload))
+
+    assert encoded.startswith("langpref3=")
+    assert decode_postback_payload(encoded) == payload
+
+
+def test_decode_legacy_zlib_language_payload():
+    payload = {"kind": "language_confirm", "action": "cancel", "primary_language": "ja"}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    legacy = "langpref2=" + base64.urlsafe_b64encode(zlib.compress(raw)).decode("ascii").rstrip("=")
+
+    assert decode_postback_payload(legacy) == payload
+
+
+def test_language_payload_keeps_longest_optional_text_that_fits():
+    long_text = "".join(chr(0x4E00 + (i * 7919) % 20000) for i in range(400))
+    payload = {
+        "kind": "language_confirm",
+        "action": "confirm",
+        "primary_language": "ja",
+        "completion_text": long_text,
+        "limit_text": long_text,
+    }
+
+    encoded = encode_language_postback_payload(dict(payload))
+    decoded = decode_postback_payload(encoded)
+
+    assert len(encoded) <= 280
+    assert "limit_text" not in decoded
+    assert long_text.startswith(decoded["completion_text"])
+    # 1 文字でも長くすると上限を超える長さまで残す
+    longer = dict(decoded, completion_text=long_text[: len(decoded["completion_text"]) + 1])
+    assert len(encode_language_postback_payload(dict(longer), max_bytes=10_000)) > 280
+
+
+def test_language_payload_encoding_is_reused_for_identical_payloads():
+    from src.domain.services import language_settings_service as module
+
+    payload = {"kind": "language_confirm", "action": "cancel", "primary_language": "ja", "cancel_text": "x" * 300}
+    module._encode_language_raw.cache_clear()
+
+    first = encode_language_postback_payload(dict(payload))
+    second = encode_language_postback_payload(dict(payload))
+
+    assert first == second
+    assert module._encode_language_raw.cache_info().hits >= 1
+
+
+def test_base64_length_is_computed_without_encoding():
+    from src.domain.services.language_settings_service import _b64_unpadded_length
+
+    for size in range(0, 64):
+        assert _b64_unpadded_length(size) == len(base64.urlsafe_b64encode(b"x" * size).rstrip(b"="))
+
+
+def test_postback_decoder_does_not_import_language_settings_service():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, src.app.subscription_postback; "
+        "sys.exit('src.domain.services.language_settings_service' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], check=False)
+
+    assert result.returncode == 0
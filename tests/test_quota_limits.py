@@ -307,3 +307,61 @@ def test_free_plan_under_limit_allows_translation_even_if_notice_flag_exists():
     assert handled is True
     assert translation.calls == 1
     assert repo.usage == 11
+
+
+class _ShrinkingQuotaRepo(ProQuotaRepo):
+    """Free プランの上限（3 言語）を超える言語が登録されているグループ。"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.languages = ["ja", "fr", "de", "ko"]
+
+    def fetch_group_languages(self, _group_id):
+        return list(self.languages)
+
+    def fetch_translation_runtime_state(self, group_id):
+        state = super().fetch_translation_runtime_state(group_id)
+        return TranslationRuntimeState(
+            translation_enabled=state.translation_enabled,
+            group_languages=list(self.languages),
+            subscription_status=state.subscription_status,
+            period_start=state.period_start,
+            period_end=state.period_end,
+            period_key=state.period_key,
+            usage=state.usage,
+            limit_notice_plan=state.limit_notice_plan,
+        )
+
+    def shrink_group_languages(self, _group_id, keep_limit):
+        removed = self.languages[keep_limit:]
+        self.languages = self.languages[:keep_limit]
+        return removed
+
+
+def test_shrink_notice_is_not_translated_when_quota_blocks():
+    line = RecordingLineClient()
+    translation = RecordingTranslationService()
+    repo = _ShrinkingQuotaRepo(initial_usage=60, paid=False, notice_plan="free")
+    handler = _build_handler(repo, line, translation)
+    interface_translation = NullInterfaceTranslation()
+    handler._interface_translation = interface_translation
+
+    handled = handler._handle_translation_flow(_build_event("hello"), sender_name="user", translation_enabled=True)
+    handler._executor.shutdown(wait=True)
+
+    assert handled is True
+    assert repo.languages == ["ja", "fr", "de"]
+    assert translation.calls == 0
+    assert interface_translation.calls == 0
+
+
+def test_shrink_notice_is_sent_with_allowed_translation():
+    line = RecordingLineClient()
+    translation = RecordingTranslationService()
+    repo = _ShrinkingQuotaRepo(initial_usage=10, paid=False)
+    handler = _build_handler(repo, line, translation)
+
+    handler._handle_translation_flow(_build_event("hello"), sender_name="user", translation_enabled=True)
+
+    assert translation.calls == 1
+    assert any("Older language settings were removed automatically: ko" in text for text in line.sent_texts)
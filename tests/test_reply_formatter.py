@@ -2,6 +2,7 @@ from src.domain.models import TranslationResult
 from src.presentation.reply_formatter import (
     build_translation_reply,
     format_translations,
+    join_within_limit,
     strip_source_echo,
     _wrap_bidi_isolate,
 )
@@ -43,6 +44,15 @@ def test_strip_source_echo_variations():
     assert strip_source_echo(source, "Ciao") == "Ciao"
 
 
+def test_strip_source_echo_escapes_source_and_ignores_case():
+    """正規表現の特殊文字を含む原文でも、大文字小文字を問わず先頭エコーだけを除去する。"""
+
+    source = "Price (1+1)?"
+    assert strip_source_echo(source, "price (1+1)? : 価格") == "価格"
+    assert strip_source_echo(source, "PRICE (1+1)? - Prix") == "Prix"
+    assert strip_source_echo(source, "1+1 の価格") == "1+1 の価格"
+
+
 def test_wrap_bidi_isolate_adds_marks():
     """RTL と LTR で前後のマークが付与されることを検証する。"""
 
@@ -83,3 +93,22 @@ def test_build_translation_reply_drops_echo_and_preserves_others():
     lines = reply.split("\n\n")
     assert len(lines) == 1
     assert "Hola" in lines[0]
+
+
+def test_join_within_limit_matches_join_then_slice():
+    parts = ["aaaa", "bb", "cccccc", "d"]
+
+    for limit in range(0, 20):
+        assert join_within_limit(parts, "\n\n", limit) == "\n\n".join(parts)[:limit]
+
+
+def test_join_within_limit_stops_consuming_parts_at_limit():
+    consumed = []
+
+    def parts():
+        for text in ("first", "second", "third"):
+            consumed.append(text)
+            yield text
+
+    assert join_within_limit(parts(), "\n\n", 6) == "first\n"
+    assert consumed == ["first", "second"]
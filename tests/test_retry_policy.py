@@ -0,0 +1,112 @@
+import pytest
+import requests
+
+from src.app.handlers import message_handler as message_handler_module
+from src.app.handlers.message_handler import MessageHandler
+from src.domain.services import retry_policy
+from src.domain.services.retry_policy import RetryPolicy, RetryRule, backoff_delay
+from src.infra.gemini_translation import GeminiRateLimitError
+
+
+def test_backoff_delay_grows_exponentially_until_cap(monkeypatch):
+    monkeypatch.setattr(retry_policy.random, "uniform", lambda low, high: high)
+
+    assert [backoff_delay(attempt, 0.5, 3.0) for attempt in range(4)] == [0.5, 1.0, 2.0, 3.0]
+
+
+def test_backoff_delay_is_zero_when_base_is_zero():
+    assert backoff_delay(3, 0.0, 8.0) == 0.0
+
+
+def test_retry_policy_does_not_sleep_after_last_attempt(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(retry_policy.random, "uniform", lambda low, high: high)
+    monkeypatch.setattr(retry_policy.time, "sleep", sleeps.append)
+    calls = []
+
+    def failing():
+        calls.append(1)
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        RetryPolicy(3, backoff_base=0.25, backoff_cap=8.0).run(failing)
+
+    assert len(calls) == 3
+    assert sleeps == [0.25, 0.5]
+
+
+def _handler_with_policy(policy):
+    handler = MessageHandler.__new__(MessageHandler)
+    handler._retry_error_policy = policy
+    return handler
+
+
+def test_run_with_retry_uses_separate_budget_per_error_type(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(message_handler_module.time, "sleep", sleeps.append)
+    monkeypatch.setattr(retry_policy.random, "uniform", lambda low, high: high)
+    handler = _handler_with_policy(
+        {
+            requests.exceptions.Timeout: RetryRule(3, 0.25, 2.0),
+            GeminiRateLimitError: RetryRule(2, 5.0, 30.0),
+            Exception: RetryRule(1, 0.5, 4.0),
+        }
+    )
+    errors = [requests.exceptions.Timeout(), GeminiRateLimitError()]
+
+    def flaky():
+        if errors:
+            raise errors.pop(0)
+        return ["ok"]
+
+    assert handler._run_with_retry("test", flaky) == ["ok"]
+    assert sleeps == [0.25, 5.0]
+
+
+def test_run_with_retry_reraises_when_budget_is_exhausted(monkeypatch):
+    monkeypatch.setattr(message_handler_module.time, "sleep", lambda _: None)
+    handler = _handler_with_policy({GeminiRateLimitError: RetryRule(2, 0.0, 0.0), Exception: RetryRule(1, 0.0, 0.0)})
+    calls = []
+
+    def rate_limited():
+        calls.append(1)
+        raise GeminiRateLimitError()
+
+    with pytest.raises(GeminiRateLimitError):
+        handler._run_with_retry("test", rate_limited)
+    assert len(calls) == 2
+
+
+def test_run_with_retry_caps_total_attempts_across_error_types(monkeypatch):
+    monkeypatch.setattr(message_handler_module.time, "sleep", lambda _: None)
+    handler = _handler_with_policy(
+        {
+            requests.exceptions.Timeout: RetryRule(2, 0.0, 0.0),
+            GeminiRateLimitError: RetryRule(2, 0.0, 0.0),
+            Exception: RetryRule(2, 0.0, 0.0),
+        }
+    )
+    cycle = [requests.exceptions.Timeout, ValueError, GeminiRateLimitError]
+    calls = []
+
+    def alternating():
+        calls.append(1)
+        raise cycle[(len(calls) - 1) % len(cycle)]()
+
+    with pytest.raises(ValueError):
+        handler._run_with_retry("test", alternating)
+    assert len(calls) == 2
+
+
+def test_run_with_retry_bounds_total_sleep_by_timeout(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(message_handler_module.time, "sleep", sleeps.append)
+    monkeypatch.setattr(retry_policy.random, "uniform", lambda low, high: high)
+    handler = _handler_with_policy({GeminiRateLimitError: RetryRule(3, 5.0, 30.0)})
+
+    def rate_limited():
+        raise GeminiRateLimitError()
+
+    with pytest.raises(GeminiRateLimitError):
+        handler._run_with_retry("test", rate_limited, timeout_seconds=6)
+    assert sleeps == [5.0, 1.0]
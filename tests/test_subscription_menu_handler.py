@@ -30,6 +30,7 @@ class _SubscriptionService:
     def __init__(self) -> None:
         self.checkout_calls = []
         self.portal_calls = []
+        self.invalidated = []
 
     def create_checkout_url(self, group_id):
         self.checkout_calls.append(group_id)
@@ -39,6 +40,9 @@ class _SubscriptionService:
         self.portal_calls.append(group_id)
         return "https://billing.stripe.com/session/should-not-be-used"
 
+    def invalidate_checkout_url(self, group_id):
+        self.invalidated.append(group_id)
+
 
 def test_subscription_menu_uses_checkout_url_for_manage_billing():
     line = _Line()
@@ -70,6 +74,8 @@ def test_subscription_menu_uses_checkout_url_for_manage_billing():
     assert handler._handle_subscription_menu(event, "en") is True
     assert subscription_service.portal_calls == []
     assert subscription_service.checkout_calls == ["G", "G"]
+    # 契約済みのグループでは以前の Checkout URL を使い回さない
+    assert subscription_service.invalidated == ["G"]
     assert line.messages is not None
     assert line.messages[0]["template"]["actions"][0]["label"] == "Manage billing"
     assert line.messages[0]["template"]["actions"][0]["uri"] == "https://frontend.example.com/pro.html?st=token"
@@ -58,3 +58,35 @@ def test_subscription_menu_shows_cancel_for_paid():
     labels = [a.get("label") for a in msg["template"]["actions"]]
     assert labels[0] == "Manage billing"
     assert any("Cancel" in (label or "") for label in labels)
+
+
+def test_subscription_menu_translates_all_texts_in_one_batch():
+    batches = []
+
+    def _translate_many(texts):
+        batches.append(list(texts))
+        return [f"[ja] {text}" for text in texts]
+
+    def _translate(_text):
+        raise AssertionError("single translation should not be used when batching")
+
+    msg = build_subscription_menu_message(
+        group_id="G",
+        instruction_lang="ja",
+        status="active",
+        effective_plan="standard",
+        period_end=None,
+        portal_url="https://example.com/portal",
+        upgrade_url="https://example.com/upgrade",
+        include_upgrade=True,
+        include_cancel=True,
+        translate=_translate,
+        translate_many=_translate_many,
+        truncate=_truncate,
+        normalize_text=_normalize,
+    )
+
+    assert len(batches) == 1
+    labels = [a.get("label") for a in msg["template"]["actions"]]
+    assert all(label.startswith("[ja]") for label in labels)
+    assert msg["template"]["title"].startswith("[ja]")
@@ -153,3 +153,99 @@ def test_create_checkout_url_token_flow_still_works_without_api_base():
     query = parse_qs(urlparse(url).query)
     assert "st" in query and query["st"][0]
     assert "api_base" not in query
+
+
+def _fake_checkout_stripe_module(calls):
+    module = types.ModuleType("stripe")
+
+    class _Session:
+        @staticmethod
+        def create(**kwargs):
+            calls.append(kwargs["metadata"]["group_id"])
+            return types.SimpleNamespace(url=f"https://checkout.stripe.com/{len(calls)}", id=f"cs_{len(calls)}")
+
+    module.checkout = types.SimpleNamespace(Session=_Session)
+    return module
+
+
+def test_legacy_checkout_url_is_reused_per_group_within_ttl(monkeypatch):
+    calls = []
+    monkeypatch.setitem(sys.modules, "stripe", _fake_checkout_stripe_module(calls))
+    service = SubscriptionService(_RepoStub(), stripe_secret_key="sk_test", stripe_price_monthly_id="price_123")
+
+    first = service.create_checkout_url("gid")
+    assert service.create_checkout_url("gid") == first
+    assert service.create_checkout_url("gid_other") != first
+    assert calls == ["gid", "gid_other"]
+
+
+def test_legacy_checkout_url_is_recreated_after_ttl(monkeypatch):
+    from src.domain.services import bounded_cache
+    from src.domain.services import subscription_service as module
+
+    calls = []
+    monkeypatch.setitem(sys.modules, "stripe", _fake_checkout_stripe_module(calls))
+    service = SubscriptionService(_RepoStub(), stripe_secret_key="sk_test", stripe_price_monthly_id="price_123")
+
+    now = [1000.0]
+    monkeypatch.setattr(bounded_cache.time, "monotonic", lambda: now[0])
+    service.create_checkout_url("gid")
+    now[0] += module.CHECKOUT_URL_CACHE_TTL_SECONDS + 1
+    service.create_checkout_url("gid")
+
+    assert calls == ["gid", "gid"]
+
+
+def test_legacy_checkout_url_is_recreated_after_invalidation(monkeypatch):
+    calls = []
+    monkeypatch.setitem(sys.modules, "stripe", _fake_checkout_stripe_module(calls))
+    service = SubscriptionService(_RepoStub(), stripe_secret_key="sk_test", stripe_price_monthly_id="price_123")
+
+    first = service.create_checkout_url("gid")
+    service.invalidate_checkout_url("gid")
+    service.invalidate_checkout_url("gid_unknown")
+
+    assert service.create_checkout_url("gid") != first
+    assert calls == ["gid", "gid"]
+
+
+def test_legacy_checkout_url_cache_is_bounded(monkeypatch):
+    from src.domain.services import subscription_service as module
+
+    calls = []
+    monkeypatch.setitem(sys.modules, "stripe", _fake_checkout_stripe_module(calls))
+    monkeypatch.setattr(module, "CHECKOUT_URL_CACHE_MAX_GROUPS", 2)
+    service = SubscriptionService(_RepoStub(), stripe_secret_key="sk_test", stripe_price_monthly_id="price_123")
+
+    for group_id in ("g1", "g2", "g3", "g1"):
+        service.create_checkout_url(group_id)
+
+    assert len(service._checkout_url_cache) == 2
+    assert calls == ["g1", "g2", "g3", "g1"]
+
+
+def test_load_stripe_caches_module_and_missing_sdk(monkeypatch):
+    from src.domain.services import subscription_service as module
+
+    imports = []
+    stripe_mod = _fake_stripe_module()
+
+    def _import(name):
+        imports.append(name)
+        return stripe_mod
+
+    monkeypatch.setattr(module.importlib, "import_module", _import)
+    service = SubscriptionService(_RepoStub(), stripe_secret_key="sk_test", stripe_price_monthly_id="price_123")
+    assert service._load_stripe() is stripe_mod
+    assert service._load_stripe() is stripe_mod
+    assert imports == ["stripe"]
+
+    def _missing(name):
+        imports.append(name)
+        raise ModuleNotFoundError(name)
+
+    monkeypatch.setattr(module.importlib, "import_module", _missing)
+    service = SubscriptionService(_RepoStub(), stripe_secret_key="sk_test", stripe_price_monthly_id="price_123")
+    assert service._load_stripe() is None
+    assert service._load_stripe() is None
+    assert imports == ["stripe", "stripe"]
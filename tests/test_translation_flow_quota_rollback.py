@@ -1,4 +1,5 @@
 import pytest
+from concurrent.futures import Future
 from datetime import datetime, timezone
 
 from src.domain import models
@@ -202,3 +203,56 @@ def test_usage_rollback_on_empty_response():
 
     assert result.reply_text is None
     assert usage_repo.usage == 0
+
+
+class RecordingTranslation(TranslationService):
+    def __init__(self):
+        self.contexts = []
+
+    def translate(self, *, context_messages, candidate_languages, **_kwargs):
+        self.contexts.append(list(context_messages))
+        return [models.TranslationResult(lang=lang, text="translated") for lang in candidate_languages]
+
+
+def test_prefetched_context_is_used_for_translation():
+    translator = RecordingTranslation()
+    service, _usage_repo, _quota = _build_service(translator)
+    prefetched = [models.ContextMessage(sender_name="a", text="earlier", timestamp=datetime(2025, 1, 1, tzinfo=timezone.utc))]
+    future = Future()
+    future.set_result(prefetched)
+
+    result = service.run(
+        event=_build_event(),
+        sender_name="user",
+        candidate_languages=["ja"],
+        paid=True,
+        limit=5,
+        plan_key="pro",
+        period_start=None,
+        period_end=None,
+        context_future=future,
+    )
+
+    assert result.reply_text
+    assert translator.contexts == [prefetched]
+
+
+def test_prefetched_context_is_cancelled_when_quota_blocks():
+    service, usage_repo, _quota = _build_service(RecordingTranslation())
+    usage_repo.usage = 5
+    future = Future()
+
+    result = service.run(
+        event=_build_event(),
+        sender_name="user",
+        candidate_languages=["ja"],
+        paid=True,
+        limit=5,
+        plan_key="pro",
+        period_start=None,
+        period_end=None,
+        context_future=future,
+    )
+
+    assert result.reply_text is None
+    assert future.cancelled()